@@ -0,0 +1,73 @@
+"""Compare the speed of the hashing backends available to tripwire.
+
+Usage:
+    python contrib/benchmark_hashing.py [--size-mib 1024] [--repeat 3] [FILE]
+
+When no file is given, a temporary file of random data is created. Run it on
+the same storage as the files normally checked to get meaningful numbers.
+"""
+
+import argparse
+import hashlib
+import os
+import pathlib
+import tempfile
+import time
+
+from uiucprescon.tripwire import validation
+
+
+def create_sample_file(directory: pathlib.Path, size_mib: int) -> pathlib.Path:
+    sample = directory / "benchmark.bin"
+    chunk = os.urandom(1024 * 1024)
+    with sample.open("wb") as fp:
+        for _ in range(size_mib):
+            fp.write(chunk)
+    return sample
+
+
+def time_backend(
+    path: pathlib.Path, backend: str, algorithm: str, repeat: int
+) -> float:
+    hashing_strategy = validation.HASHING_BACKENDS[backend]
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with path.open("rb") as fp:
+            hashing_strategy(
+                fp, validation.SUPPORTED_ALGORITHMS[algorithm], None
+            )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("file", type=pathlib.Path, nargs="?")
+    parser.add_argument("--size-mib", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--algorithm",
+        default="md5",
+        choices=validation.SUPPORTED_ALGORITHMS.keys(),
+    )
+    args = parser.parse_args()
+    print(
+        "kernel crypto API available: "
+        f"{validation.is_kernel_hashing_available()}"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.file or create_sample_file(
+            pathlib.Path(temp_dir), args.size_mib
+        )
+        size_mib = path.stat().st_size / (1024 * 1024)
+        # Read the file once so every backend starts with a warm page cache.
+        with path.open("rb") as fp:
+            validation.get_hash_from_file_pointer(fp, hashlib.md5)
+        for backend in validation.HASHING_BACKENDS:
+            best = time_backend(path, backend, args.algorithm, args.repeat)
+            print(f"{backend:>8}: {best:8.3f}s  {size_mib / best:10.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+"""Checksum validation of files stored inside ZIP and TAR archives.
+
+Archive members are hashed straight from the archive, without extracting
+them to disk first.
+
+.. versionadded:: 0.3.8
+"""
+
+from __future__ import annotations
+
+import abc
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import pathlib
+import posixpath
+import tarfile
+import threading
+import time
+import typing
+import zipfile
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from uiucprescon.tripwire import filters, utils, validation
+
+__all__ = [
+    "iter_archive_checksum_results",
+    "validate_archive_checksums_command",
+    "is_supported_archive",
+]
+
+# Names of files that list the checksums of many files, such as the payload
+# manifest of a BagIt bag.
+CHECKSUM_LIST_FILE_NAMES = frozenset(
+    ["manifest-md5.txt", "md5sum.txt", "md5sums.txt"]
+)
+
+CHECKSUM_SIDECAR_EXTENSION = ".md5"
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@dataclasses.dataclass(frozen=True)
+class ChecksumEntry:
+    """Expected checksum of an archive member."""
+
+    checksum_member: str
+    member: str
+    expected_hash: str
+
+
+def is_checksum_member(name: str) -> bool:
+    """Check if an archive member contains checksums of other members."""
+    return (
+        name.endswith(CHECKSUM_SIDECAR_EXTENSION)
+        or posixpath.basename(name) in CHECKSUM_LIST_FILE_NAMES
+    )
+
+
+def parse_checksum_member(name: str, text: str) -> List[ChecksumEntry]:
+    """Parse the expected checksums from a checksum archive member.
+
+    A .md5 file with a single checksum applies to the member with the same
+    name minus the extension, matching how validate-checksums treats files on
+    disk. Otherwise, each line is expected to be in the format of
+    "<hash> <file name>", with the file name relative to the checksum member.
+
+    Args:
+        name: name of the checksum member inside the archive.
+        text: content of the checksum member.
+
+    Returns: expected checksums.
+
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if name.endswith(CHECKSUM_SIDECAR_EXTENSION) and len(lines) == 1:
+        return [
+            ChecksumEntry(
+                checksum_member=name,
+                member=name[: -len(CHECKSUM_SIDECAR_EXTENSION)],
+                expected_hash=lines[0].split()[0],
+            )
+        ]
+    directory = posixpath.dirname(name)
+    entries = []
+    for line in lines:
+        try:
+            expected_hash, file_name = line.split(maxsplit=1)
+        except ValueError:
+            logger.warning("Unable to parse line in %s: %s", name, line)
+            continue
+        entries.append(
+            ChecksumEntry(
+                checksum_member=name,
+                member=posixpath.normpath(
+                    posixpath.join(directory, file_name.lstrip("*"))
+                ),
+                expected_hash=expected_hash,
+            )
+        )
+    return entries
+
+
+class AbsArchive(abc.ABC):
+    """Abstract class for reading files inside an archive."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Create a new archive reader."""
+        self.path = path
+
+    @classmethod
+    @abc.abstractmethod
+    def is_supported(cls, path: pathlib.Path) -> bool:
+        """Check if the file is an archive that this class can read."""
+
+    @abc.abstractmethod
+    def member_sizes(self) -> Dict[str, int]:
+        """Get the names and sizes of the regular files in the archive."""
+
+    @abc.abstractmethod
+    def iter_members(self) -> Iterator[Tuple[str, int, BinaryIO]]:
+        """Iterate over the regular files in the archive in storage order."""
+
+    def close(self) -> None:
+        """Release any resources held open by the archive."""
+
+    def __enter__(self) -> AbsArchive:
+        """Open archive context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close archive context."""
+        self.close()
+
+
+class AbsRandomAccessArchive(AbsArchive):
+    """Abstract class for archives with members that can be opened by name.
+
+    Members of these archives can be read independently of each other, and
+    therefore at the same time.
+    """
+
+    @abc.abstractmethod
+    def open_member(self, name: str) -> BinaryIO:
+        """Open a file inside the archive for reading."""
+
+    def iter_members(self) -> Iterator[Tuple[str, int, BinaryIO]]:
+        """Iterate over the regular files in the archive in storage order."""
+        for name, size in self.member_sizes().items():
+            with self.open_member(name) as member:
+                yield name, size, member
+
+
+class ZipArchive(AbsRandomAccessArchive):
+    """Zip file archive.
+
+    Zip members can be opened concurrently from the same ZipFile.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Open a zip archive."""
+        super().__init__(path)
+        self._zip = zipfile.ZipFile(path)
+
+    @classmethod
+    def is_supported(cls, path: pathlib.Path) -> bool:
+        """Check if the file is a zip archive."""
+        return zipfile.is_zipfile(path)
+
+    def member_sizes(self) -> Dict[str, int]:
+        """Get the names and sizes of the regular files in the archive."""
+        return {
+            info.filename: info.file_size
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        }
+
+    def open_member(self, name: str) -> BinaryIO:
+        """Open a file inside the archive for reading."""
+        return typing.cast(BinaryIO, self._zip.open(name))
+
+    def close(self) -> None:
+        """Close the zip file."""
+        self._zip.close()
+
+
+class UncompressedTarArchive(AbsRandomAccessArchive):
+    """Uncompressed tar file archive.
+
+    Each thread reading from the archive gets its own file handle, so that
+    members can be read at the same time without sharing a file position.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Open an uncompressed tar archive."""
+        super().__init__(path)
+        self._local = threading.local()
+        self._open_handles: List[tarfile.TarFile] = []
+        self._handles_lock = threading.Lock()
+        self._members = {
+            member.name: member
+            for member in self._tar_file().getmembers()
+            if member.isfile()
+        }
+
+    @classmethod
+    def is_supported(cls, path: pathlib.Path) -> bool:
+        """Check if the file is a tar archive without compression."""
+        try:
+            with tarfile.open(path, "r:"):
+                return True
+        except tarfile.TarError:
+            return False
+
+    def _tar_file(self) -> tarfile.TarFile:
+        tar_file: Optional[tarfile.TarFile] = getattr(
+            self._local, "tar_file", None
+        )
+        if tar_file is None:
+            tar_file = tarfile.open(self.path, "r:")
+            self._local.tar_file = tar_file
+            with self._handles_lock:
+                self._open_handles.append(tar_file)
+        return tar_file
+
+    def member_sizes(self) -> Dict[str, int]:
+        """Get the names and sizes of the regular files in the archive."""
+        return {name: member.size for name, member in self._members.items()}
+
+    def open_member(self, name: str) -> BinaryIO:
+        """Open a file inside the archive for reading."""
+        member = self._tar_file().extractfile(self._members[name])
+        if member is None:
+            raise KeyError(name)
+        return typing.cast(BinaryIO, member)
+
+    def close(self) -> None:
+        """Close every file handle opened for the archive."""
+        with self._handles_lock:
+            for tar_file in self._open_handles:
+                tar_file.close()
+            self._open_handles.clear()
+
+
+class CompressedTarArchive(AbsArchive):
+    """Compressed tar file archive.
+
+    Seeking inside a compressed stream means decompressing it again from the
+    start, so members are only ever read in a single pass, and cannot be
+    opened by name.
+    """
+
+    @classmethod
+    def is_supported(cls, path: pathlib.Path) -> bool:
+        """Check if the file is a tar archive."""
+        return tarfile.is_tarfile(path)
+
+    def member_sizes(self) -> Dict[str, int]:
+        """Get the names and sizes of the regular files in the archive."""
+        with tarfile.open(self.path, "r|*") as tar_file:
+            return {
+                member.name: member.size
+                for member in tar_file
+                if member.isfile()
+            }
+
+    def iter_members(self) -> Iterator[Tuple[str, int, BinaryIO]]:
+        """Iterate over the regular files in the archive in one pass."""
+        with tarfile.open(self.path, "r|*") as tar_file:
+            for member in tar_file:
+                if not member.isfile():
+                    continue
+                member_fp = tar_file.extractfile(member)
+                if member_fp is not None:
+                    yield (
+                        member.name,
+                        member.size,
+                        typing.cast(BinaryIO, member_fp),
+                    )
+
+
+# The order to determine the type of archive file. Used by open_archive()
+ARCHIVE_TYPES_CHECK_ORDER: List[Type[AbsArchive]] = [
+    ZipArchive,
+    UncompressedTarArchive,
+    CompressedTarArchive,
+]
+
+
+def is_supported_archive(path: pathlib.Path) -> bool:
+    """Check if a path is an archive file that can be validated."""
+    if not path.is_file():
+        return False
+    return any(klass.is_supported(path) for klass in ARCHIVE_TYPES_CHECK_ORDER)
+
+
+def open_archive(path: pathlib.Path) -> AbsArchive:
+    """Open an archive with the first reader that supports it."""
+    for klass in ARCHIVE_TYPES_CHECK_ORDER:
+        if klass.is_supported(path):
+            return klass(path)
+    raise ValueError(f"Unsupported archive format: {path}")
+
+
+def _read_checksum_text(member: BinaryIO) -> str:
+    return member.read().decode("utf-8", errors="replace")
+
+
+def _result(
+    archive_path: pathlib.Path,
+    entry: ChecksumEntry,
+    actual_hash: Optional[str],
+    elapsed: float,
+) -> validation.ChecksumValidationResult:
+    if actual_hash is None:
+        issues: Tuple[str, ...] = ("File not found in archive",)
+    elif actual_hash.lower() != entry.expected_hash.lower():
+        issues = (
+            f"Hash mismatch. Expected: {entry.expected_hash}. "
+            f"Actual: {actual_hash}",
+        )
+    else:
+        issues = ()
+    return validation.ChecksumValidationResult(
+        checksum_file=archive_path / entry.checksum_member,
+        file=archive_path / entry.member,
+        status=(
+            validation.ChecksumStatus.FAILED
+            if issues
+            else validation.ChecksumStatus.MATCHED
+        ),
+        expected_digest=entry.expected_hash,
+        issues=issues,
+        elapsed=elapsed,
+    )
+
+
+def _read_checksum_entries(
+    archive: AbsRandomAccessArchive,
+    sizes: Dict[str, int],
+    path_filter: filters.PathFilter,
+) -> List[ChecksumEntry]:
+    entries: List[ChecksumEntry] = []
+    for name in sizes:
+        if not is_checksum_member(name):
+            continue
+        if not path_filter.is_path_included(name):
+            continue
+        with archive.open_member(name) as member:
+            entries.extend(
+                parse_checksum_member(name, _read_checksum_text(member))
+            )
+    return entries
+
+
+def _iter_random_access_results(
+    archive: AbsRandomAccessArchive,
+    jobs: int,
+    hashing_strategy: validation.HashFilePointerStrategyProtocol,
+    path_filter: filters.PathFilter,
+) -> Iterator[validation.ChecksumValidationResult]:
+    sizes = archive.member_sizes()
+    entries = _read_checksum_entries(archive, sizes, path_filter)
+
+    def verify(entry: ChecksumEntry) -> validation.ChecksumValidationResult:
+        start_time = time.perf_counter()
+        if entry.member not in sizes:
+            return _result(archive.path, entry, None, 0.0)
+        with archive.open_member(entry.member) as member:
+            actual_hash = hashing_strategy(
+                member, hashlib.md5, size=sizes[entry.member]
+            )
+        return _result(
+            archive.path, entry, actual_hash, time.perf_counter() - start_time
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from utils.iter_executor_results(
+            executor, verify, entries, max_pending=jobs * 2, ordered=True
+        )
+
+
+def _iter_sequential_results(
+    archive: AbsArchive,
+    hashing_strategy: validation.HashFilePointerStrategyProtocol,
+    path_filter: filters.PathFilter,
+) -> Iterator[validation.ChecksumValidationResult]:
+    # Checksum files can come before or after the files they describe, so
+    # every member is hashed during the only pass through the archive.
+    hashes: Dict[str, Tuple[str, float]] = {}
+    entries: List[ChecksumEntry] = []
+    for name, size, member in archive.iter_members():
+        if is_checksum_member(name):
+            if path_filter.is_path_included(name):
+                entries.extend(
+                    parse_checksum_member(name, _read_checksum_text(member))
+                )
+            continue
+        start_time = time.perf_counter()
+        actual_hash = hashing_strategy(member, hashlib.md5, size=size)
+        hashes[name] = (actual_hash, time.perf_counter() - start_time)
+    for entry in entries:
+        if entry.member in hashes:
+            actual_hash, elapsed = hashes[entry.member]
+            yield _result(archive.path, entry, actual_hash, elapsed)
+        else:
+            yield _result(archive.path, entry, None, 0.0)
+
+
+def iter_archive_checksum_results(
+    path: pathlib.Path,
+    jobs: int = 1,
+    open_archive_strategy: Callable[[pathlib.Path], AbsArchive] = (
+        open_archive
+    ),
+    hashing_strategy: validation.HashFilePointerStrategyProtocol = (
+        validation.get_hash_from_file_pointer
+    ),
+    path_filter: Optional[filters.PathFilter] = None,
+) -> Iterator[validation.ChecksumValidationResult]:
+    """Validate checksums of files inside an archive without extracting it.
+
+    Checksums are read from .md5 files and checksum lists inside the archive.
+
+    Args:
+        path: archive file.
+        jobs: number of members to hash at the same time. Only used for
+            archives that can open members by name, such as zip files.
+        open_archive_strategy: strategy to open the archive.
+        hashing_strategy: strategy to hash an open member, such as a value
+            of validation.HASHING_BACKENDS.
+        path_filter: checksum members to include or exclude, matched
+            against their paths inside the archive.
+
+    Yields:
+        A result for each checksum found in the archive.
+    """
+    path_filter = path_filter or filters.PathFilter()
+    with open_archive_strategy(path) as archive:
+        if isinstance(archive, AbsRandomAccessArchive):
+            yield from _iter_random_access_results(
+                archive, jobs, hashing_strategy, path_filter
+            )
+        else:
+            yield from _iter_sequential_results(
+                archive, hashing_strategy, path_filter
+            )
+
+
+def validate_archive_checksums_command(
+    path: pathlib.Path,
+    jobs: int = 1,
+    results_strategy: Callable[
+        [pathlib.Path, int], Iterable[validation.ChecksumValidationResult]
+    ] = iter_archive_checksum_results,
+) -> None:
+    """Validate checksum files located inside an archive.
+
+    Args:
+        path: archive file.
+        jobs: number of members to hash at the same time.
+        results_strategy: strategy to validate the archive members.
+    """
+    logger.info("Validating checksums inside %s...", path.name)
+    validation.log_checksum_validation_results(
+        results_strategy(path, jobs), path
+    )
@@ -0,0 +1,297 @@
+"""Copy files while verifying the copies with checksums.
+
+.. versionadded:: 0.3.8
+"""
+
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import os
+import pathlib
+import shutil
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Tuple
+
+from uiucprescon.tripwire import utils, validation
+
+__all__ = ["copy_verify", "copy_verify_command", "CopyVerifyResult"]
+
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+CHECKSUM_SIDECAR_EXTENSION = ".md5"
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@dataclasses.dataclass(frozen=True)
+class CopyVerifyResult:
+    """Result of copying a single file and verifying the copy.
+
+    If the file could not be copied, the status is FAILED and error has the
+    reason.
+    """
+
+    source: pathlib.Path
+    destination: pathlib.Path
+    status: validation.ChecksumStatus
+    source_digest: str
+    destination_digest: str
+    elapsed: float
+    error: Optional[str] = None
+
+
+def drop_file_cache(fp: BinaryIO) -> None:
+    """Ask the operating system to evict a file's data from the page cache.
+
+    This is used so that re-reading a file that was just written reads it
+    from the storage device instead of memory. Only supported on platforms
+    with posix_fadvise; on others, this does nothing.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fp.flush()
+    os.fsync(fp.fileno())
+    os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def copy_with_hash(
+    source: pathlib.Path,
+    destination: pathlib.Path,
+    hashing_algorithm=hashlib.md5,
+    drop_cache: bool = False,
+) -> str:
+    """Copy a file, calculating the hash of the source as it is read.
+
+    Args:
+        source: file to copy
+        destination: path of the copy
+        hashing_algorithm: hashing algorithm to use such as hashlib.md5
+        drop_cache: evict the copy from the page cache after writing it
+
+    Returns: hash value of the source file
+
+    Raises:
+        shutil.SameFileError: if the destination is the source file.
+
+    """
+    if destination.exists() and os.path.samefile(source, destination):
+        raise shutil.SameFileError(
+            f"{source} and {destination} are the same file"
+        )
+    item_hash = hashing_algorithm()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with source.open("rb") as source_fp, destination.open("wb") as dest_fp:
+        while chunk := source_fp.read(COPY_CHUNK_SIZE):
+            item_hash.update(chunk)
+            dest_fp.write(chunk)
+        if drop_cache:
+            drop_file_cache(dest_fp)
+    shutil.copystat(source, destination)
+    return item_hash.hexdigest()
+
+
+def write_checksum_sidecar(path: pathlib.Path, hash_value: str) -> None:
+    """Write a .md5 file next to the file using the hash and file format."""
+    sidecar = path.with_name(f"{path.name}{CHECKSUM_SIDECAR_EXTENSION}")
+    sidecar.write_text(f"{hash_value} *{path.name}\n", encoding="utf-8")
+
+
+def locate_copy_jobs(
+    source: pathlib.Path, destination: pathlib.Path
+) -> Iterable[Tuple[pathlib.Path, pathlib.Path]]:
+    """Map every file in the source to its path in the destination.
+
+    If the destination is inside the source, it is not walked, so copies
+    made while walking are not copied again.
+    """
+    if source.is_file():
+        yield (
+            source,
+            destination / source.name if destination.is_dir() else destination,
+        )
+        return
+    resolved_destination = destination.resolve()
+    for root, dirs, files in os.walk(source):
+        dirs[:] = [
+            dir_name
+            for dir_name in dirs
+            if pathlib.Path(root, dir_name).resolve() != resolved_destination
+        ]
+        for file_name in files:
+            file_path = pathlib.Path(os.path.join(root, file_name))
+            yield file_path, destination / file_path.relative_to(source)
+
+
+def needs_sidecar(source: pathlib.Path) -> bool:
+    """Check if a copy of the source file should be given a .md5 file.
+
+    Checksum files and files that already have a checksum file in the source
+    are skipped, as the existing checksum file is copied along with them.
+    """
+    if source.name.endswith(CHECKSUM_SIDECAR_EXTENSION):
+        return False
+    return not source.with_name(
+        f"{source.name}{CHECKSUM_SIDECAR_EXTENSION}"
+    ).exists()
+
+
+def copy_and_verify_file(
+    source: pathlib.Path,
+    destination: pathlib.Path,
+    drop_cache: bool = False,
+    write_sidecar: bool = False,
+) -> CopyVerifyResult:
+    """Copy a single file and verify the copy by re-reading it.
+
+    Args:
+        source: file to copy
+        destination: path of the copy
+        drop_cache: evict the copy from the page cache before re-reading it
+        write_sidecar: write a .md5 file next to the copy
+
+    Returns: result of the verification. If the file could not be copied
+        or read back, the result is FAILED with the reason as its error.
+
+    """
+    start_time = time.perf_counter()
+    try:
+        source_digest = copy_with_hash(
+            source, destination, drop_cache=drop_cache
+        )
+        with destination.open("rb") as dest_fp:
+            destination_digest = validation.get_hash_from_file_pointer(
+                dest_fp, hashlib.md5
+            )
+    except OSError as e:
+        return CopyVerifyResult(
+            source=source,
+            destination=destination,
+            status=validation.ChecksumStatus.FAILED,
+            source_digest="",
+            destination_digest="",
+            elapsed=time.perf_counter() - start_time,
+            error=str(e),
+        )
+    matched = source_digest == destination_digest
+    if matched and write_sidecar:
+        write_checksum_sidecar(destination, destination_digest)
+    return CopyVerifyResult(
+        source=source,
+        destination=destination,
+        status=(
+            validation.ChecksumStatus.MATCHED
+            if matched
+            else validation.ChecksumStatus.FAILED
+        ),
+        source_digest=source_digest,
+        destination_digest=destination_digest,
+        elapsed=time.perf_counter() - start_time,
+    )
+
+
+def copy_verify(
+    source: pathlib.Path,
+    destination: pathlib.Path,
+    jobs: int = 1,
+    drop_cache: bool = False,
+    write_sidecars: bool = False,
+    locate_copy_jobs_strategy: Callable[
+        [pathlib.Path, pathlib.Path],
+        Iterable[Tuple[pathlib.Path, pathlib.Path]],
+    ] = locate_copy_jobs,
+) -> Iterator[CopyVerifyResult]:
+    """Copy files from source to destination and verify each copy.
+
+    Each source file is hashed while it is being copied and the copy is then
+    re-read and hashed, so every byte is read twice.
+
+    Args:
+        source: file or directory to copy.
+        destination: where to copy to.
+        jobs: number of files to copy at the same time.
+        drop_cache: evict copies from the page cache before re-reading them.
+        write_sidecars: write a .md5 file next to each verified copy that
+            does not already have one in the source.
+        locate_copy_jobs_strategy: strategy to map sources to destinations.
+
+    Yields:
+        A result for each file as soon as it is copied and verified.
+    """
+
+    def copy_job(
+        paths: Tuple[pathlib.Path, pathlib.Path],
+    ) -> CopyVerifyResult:
+        file_source, file_destination = paths
+        return copy_and_verify_file(
+            file_source,
+            file_destination,
+            drop_cache=drop_cache,
+            write_sidecar=write_sidecars and needs_sidecar(file_source),
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from utils.iter_executor_results(
+            executor,
+            copy_job,
+            locate_copy_jobs_strategy(source, destination),
+            max_pending=jobs * 2,
+        )
+
+
+def copy_verify_command(
+    source: pathlib.Path,
+    destination: pathlib.Path,
+    jobs: int = 1,
+    drop_cache: bool = False,
+    write_sidecars: bool = False,
+    copy_verify_strategy: Callable[..., Iterable[CopyVerifyResult]] = (
+        copy_verify
+    ),
+) -> bool:
+    """Copy files and report the verification of each copy.
+
+    Args:
+        source: file or directory to copy.
+        destination: where to copy to.
+        jobs: number of files to copy at the same time.
+        drop_cache: evict copies from the page cache before re-reading them.
+        write_sidecars: write a .md5 file next to each verified copy.
+        copy_verify_strategy: strategy to copy and verify the files.
+
+    Returns:
+        True if every copy matched its source, otherwise False.
+    """
+    total_copied = 0
+    errors = []
+    for result in copy_verify_strategy(
+        source,
+        destination,
+        jobs=jobs,
+        drop_cache=drop_cache,
+        write_sidecars=write_sidecars,
+    ):
+        total_copied += 1
+        if result.error is not None:
+            message = f"{result.destination} - Failed: {result.error}"
+            logger.error("(%d) %s", total_copied, message)
+            errors.append(message)
+        elif result.status is validation.ChecksumStatus.FAILED:
+            message = (
+                f"{result.destination} - Failed: Hash mismatch. "
+                f"Source: {result.source_digest}. "
+                f"Copy: {result.destination_digest}"
+            )
+            logger.error("(%d) %s", total_copied, message)
+            errors.append(message)
+        else:
+            logger.info(
+                "(%d) %s - Copy verified", total_copied, result.destination
+            )
+    logger.info(
+        validation.create_checksum_validation_report(
+            total=total_copied, errors=errors
+        )
+    )
+    return not errors
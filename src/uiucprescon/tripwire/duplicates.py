@@ -0,0 +1,247 @@
+"""Duplicate file detection.
+
+.. versionadded:: 0.3.8
+"""
+
+import collections
+import dataclasses
+import hashlib
+import io
+import logging
+import os
+import pathlib
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from uiucprescon.tripwire import validation
+
+__all__ = ["find_duplicates", "find_duplicates_command", "DuplicateGroup"]
+
+# Number of bytes read from both the start and the end of a file to create a
+# cheap fingerprint before committing to hashing the whole file.
+PARTIAL_HASH_SAMPLE_SIZE = 4 * 1024 * 1024
+
+CHECKSUM_SIDECAR_EXTENSION = ".md5"
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_T = TypeVar("_T")
+
+
+@dataclasses.dataclass(frozen=True)
+class DuplicateGroup:
+    """Files with identical content."""
+
+    digest: str
+    size: int
+    files: Tuple[pathlib.Path, ...]
+
+
+def locate_candidate_files(path: pathlib.Path) -> Iterable[pathlib.Path]:
+    """Locate every file that could be a duplicate.
+
+    Checksum files are skipped, and so are symbolic links, because the file
+    that a link points to would otherwise be compared with itself.
+    """
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            if file_name.endswith(CHECKSUM_SIDECAR_EXTENSION):
+                continue
+            file_path = os.path.join(root, file_name)
+            if os.path.islink(file_path):
+                continue
+            yield pathlib.Path(file_path)
+
+
+def group_files_by_size(
+    files: Iterable[pathlib.Path],
+    get_size: Callable[[pathlib.Path], int] = lambda p: p.stat().st_size,
+) -> Dict[int, List[pathlib.Path]]:
+    """Group non-empty files by size, keeping sizes shared by many files.
+
+    Files that cannot be read, such as broken symbolic links, are skipped
+    with a warning.
+    """
+    groups: DefaultDict[int, List[pathlib.Path]] = collections.defaultdict(
+        list
+    )
+    for file_path in files:
+        try:
+            size = get_size(file_path)
+        except OSError as error:
+            logger.warning("Skipping %s: %s", file_path, error)
+            continue
+        if size == 0:
+            continue
+        groups[size].append(file_path)
+    return {size: group for size, group in groups.items() if len(group) > 1}
+
+
+def get_partial_hash(
+    path: pathlib.Path,
+    size: int,
+    sample_size: int = PARTIAL_HASH_SAMPLE_SIZE,
+) -> Tuple[str, bool]:
+    """Get a hash of the first and last bytes of a file.
+
+    Args:
+        path: file path
+        size: size of the file in bytes
+        sample_size: number of bytes read from the start and from the end
+
+    Returns: hash value and whether the whole file was read to create it. When
+        the whole file was read, the hash value is the md5 of the file.
+
+    """
+    with path.open("rb") as file:
+        if size <= sample_size * 2:
+            return (
+                validation.get_hash_from_file_pointer(file, hashlib.md5),
+                True,
+            )
+        sample = io.BytesIO()
+        sample.write(file.read(sample_size))
+        file.seek(size - sample_size)
+        sample.write(file.read(sample_size))
+        sample.seek(0)
+        return (
+            validation.get_hash_from_file_pointer(sample, hashlib.md5),
+            False,
+        )
+
+
+def read_checksum_sidecar(path: pathlib.Path) -> Optional[str]:
+    """Read the md5 from a file's sidecar checksum file if one exists."""
+    sidecar = path.with_name(f"{path.name}{CHECKSUM_SIDECAR_EXTENSION}")
+    if not sidecar.is_file():
+        return None
+    return validation.read_checksum_file(sidecar).lower()
+
+
+def get_full_hash(
+    path: pathlib.Path,
+    read_sidecar_strategy: Callable[
+        [pathlib.Path], Optional[str]
+    ] = read_checksum_sidecar,
+) -> str:
+    """Get the md5 of a file, reusing the sidecar checksum if available."""
+    if hash_value := read_sidecar_strategy(path):
+        return hash_value
+    return validation.get_file_hash_with_progress_reporting(
+        path, hashing_algorithm=hashlib.md5
+    )
+
+
+def _group_by(
+    files: Iterable[pathlib.Path], key: Callable[[pathlib.Path], str]
+) -> Iterator[List[pathlib.Path]]:
+    groups: DefaultDict[str, List[pathlib.Path]] = collections.defaultdict(
+        list
+    )
+    for file_path in files:
+        groups[key(file_path)].append(file_path)
+    for group in groups.values():
+        if len(group) > 1:
+            yield group
+
+
+def _hash_files(
+    files: Iterable[pathlib.Path], hash_file: Callable[[pathlib.Path], _T]
+) -> Dict[pathlib.Path, _T]:
+    hashes: Dict[pathlib.Path, _T] = {}
+    for file_path in files:
+        try:
+            hashes[file_path] = hash_file(file_path)
+        except OSError as error:
+            logger.warning("Skipping %s: %s", file_path, error)
+    return hashes
+
+
+def find_duplicates(
+    path: pathlib.Path,
+    locate_files_strategy: Callable[
+        [pathlib.Path], Iterable[pathlib.Path]
+    ] = locate_candidate_files,
+    partial_hash_strategy: Callable[
+        [pathlib.Path, int], Tuple[str, bool]
+    ] = get_partial_hash,
+    full_hash_strategy: Callable[[pathlib.Path], str] = get_full_hash,
+) -> Iterator[DuplicateGroup]:
+    """Find files with identical content inside a directory.
+
+    Files are grouped by size first. Only files sharing a size have their
+    first and last bytes hashed, and only files that still collide after that
+    are fully hashed. Files that cannot be read while hashing are skipped
+    with a warning.
+
+    Args:
+        path: directory to search recursively.
+        locate_files_strategy: strategy to locate files to compare.
+        partial_hash_strategy: strategy to create a cheap fingerprint.
+        full_hash_strategy: strategy to hash the entire file.
+
+    Yields:
+        A group for each set of files with identical content.
+    """
+    for size, same_size in sorted(
+        group_files_by_size(locate_files_strategy(path)).items()
+    ):
+        partial_hashes = _hash_files(
+            same_size,
+            lambda file_path: partial_hash_strategy(file_path, size),
+        )
+        for candidates in _group_by(
+            partial_hashes, key=lambda p: partial_hashes[p][0]
+        ):
+            read_entire_file = partial_hashes[candidates[0]][1]
+            if read_entire_file:
+                yield DuplicateGroup(
+                    digest=partial_hashes[candidates[0]][0],
+                    size=size,
+                    files=tuple(sorted(candidates)),
+                )
+                continue
+            full_hashes = _hash_files(candidates, full_hash_strategy)
+            for duplicates in _group_by(
+                full_hashes, key=lambda p: full_hashes[p]
+            ):
+                yield DuplicateGroup(
+                    digest=full_hashes[duplicates[0]],
+                    size=size,
+                    files=tuple(sorted(duplicates)),
+                )
+
+
+def find_duplicates_command(path: pathlib.Path) -> None:
+    """Report files with identical content inside a directory.
+
+    Args:
+        path: directory to search recursively.
+    """
+    logger.info("Searching for duplicate files...")
+    total_groups = 0
+    for group in find_duplicates(path):
+        total_groups += 1
+        files_list = "\n".join(
+            f"  * {f.relative_to(path)}" for f in group.files
+        )
+        logger.info(
+            "Duplicate files (md5: %s, size: %d bytes):\n%s",
+            group.digest,
+            group.size,
+            files_list,
+        )
+    if total_groups:
+        logger.info("Found %d set(s) of duplicate files.", total_groups)
+    else:
+        logger.info("No duplicate files found.")
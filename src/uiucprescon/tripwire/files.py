@@ -6,15 +6,27 @@
 """
 
 import abc
+import array
 import collections
 import csv
 import dataclasses
 import functools
+import io
 import logging
+import pathlib
+import re
 import typing
+import zipfile
+from xml.etree import ElementTree
 from enum import Enum
 from functools import cached_property
 from typing import (
+    IO,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Generator,
+    List,
     NamedTuple,
     overload,
     TextIO,
@@ -25,13 +37,23 @@ from typing import (
     Union,
     ParamSpec,
     Callable,
+    Collection,
     Set,
+    Tuple,
     Type,
+    Optional,
 )
 
 from typing import Final
 
-__all__ = ["TSVManifest"]
+from uiucprescon.tripwire.exceptions import InvalidFileFormat
+
+__all__ = [
+    "TSVManifest",
+    "XLSXManifest",
+    "get_manifest_table",
+    "open_manifest",
+]
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -40,9 +62,149 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-@dataclasses.dataclass(frozen=True)
+class TableHeader:
+    """Field names of a table, shared by all of its rows.
+
+    .. versionadded:: 0.3.8
+    """
+
+    __slots__ = ("_selected", "fieldnames", "indexes")
+
+    def __init__(
+        self,
+        fieldnames: Sequence[str],
+        columns: Optional[Collection[str]] = None,
+    ) -> None:
+        """Create a TableHeader object.
+
+        Args:
+            fieldnames: field names of every column of the table.
+            columns: if set, only the values of the columns with these
+                field names are kept in the rows created.
+        """
+        # Same as csv.DictReader, the last column with a field name is used
+        # when more than one column has it.
+        indexes: Dict[str, int] = {}
+        for index, field_name in enumerate(fieldnames):
+            indexes[field_name] = index
+        self._selected: Optional[Tuple[int, ...]] = None
+        if columns is not None:
+            self._selected = tuple(
+                sorted(
+                    index
+                    for field_name, index in indexes.items()
+                    if field_name in columns
+                )
+            )
+            fieldnames = [fieldnames[index] for index in self._selected]
+            indexes = {
+                field_name: index
+                for index, field_name in enumerate(fieldnames)
+            }
+        self.fieldnames: Tuple[str, ...] = tuple(fieldnames)
+        self.indexes = indexes
+
+    def create_row(
+        self, line_number: int, values: Sequence[str]
+    ) -> "TableRow":
+        """Create a row of the table from the values of all its columns."""
+        if self._selected is not None:
+            values = [
+                values[index]
+                for index in self._selected
+                if index < len(values)
+            ]
+        return TableRow(
+            line_number=line_number,
+            row_data=TableRowData(self, tuple(values)),
+        )
+
+
+class TableRowData(Mapping[str, str]):
+    """Values of a table row, looked up by field name.
+
+    Only the values are stored for each row, and the field names are shared
+    with every other row of the table. It is read the same as the dict
+    created by csv.DictReader: a missing value is None, and values without
+    a field name are a list under None.
+
+    .. versionadded:: 0.3.8
+    """
+
+    __slots__ = ("_header", "_values")
+
+    def __init__(self, header: TableHeader, values: Tuple[str, ...]) -> None:
+        """Create a TableRowData object."""
+        self._header = header
+        self._values = values
+
+    def _has_extra_values(self) -> bool:
+        return len(self._values) > len(self._header.fieldnames)
+
+    def __getitem__(self, key: str) -> str:
+        """Get the value of a field."""
+        if key is None and self._has_extra_values():
+            return typing.cast(
+                str, list(self._values[len(self._header.fieldnames) :])
+            )
+        index = self._header.indexes[key]
+        if index < len(self._values):
+            return self._values[index]
+        return typing.cast(str, None)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names."""
+        yield from self._header.indexes
+        if self._has_extra_values():
+            yield typing.cast(str, None)
+
+    def __len__(self) -> int:
+        """Get the number of fields."""
+        return len(self._header.indexes) + self._has_extra_values()
+
+    def __repr__(self) -> str:
+        """Show the values as a dict."""
+        return repr(dict(self))
+
+
+def _iter_records(
+    reader: Iterator[List[str]],
+) -> Iterator[Tuple[int, List[str]]]:
+    # Same as csv.DictReader, empty records are skipped.
+    for values in reader:
+        if values:
+            yield typing.cast(typing.Any, reader).line_num, values
+
+
+def _iter_table_rows(
+    lines: Iterable[str],
+    columns: Optional[Collection[str]] = None,
+    rules: Sequence[Callable[[TableHeader], "AbsManifestRowRule"]] = (),
+    finding_reporter: Optional[Callable[["Finding"], None]] = None,
+) -> Iterator["TableRow"]:
+    """Read the rows of TSV data, with the header in the first record."""
+    reader = csv.reader(lines, dialect="excel-tab")
+    fieldnames = next(reader, None)
+    if fieldnames is None:
+        return
+    records: Iterable[Tuple[int, Sequence[str]]] = _iter_records(reader)
+    if rules:
+        records = _iter_checked_records(
+            records, TableHeader(fieldnames), rules, finding_reporter
+        )
+    header = TableHeader(fieldnames, columns)
+    for line_number, values in records:
+        yield header.create_row(line_number, values)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class TableRow:
-    """Table row."""
+    """Table row.
+
+    .. versionchanged:: 0.3.8
+        Rows read from a manifest share the field names of the manifest
+        in a TableHeader, instead of each row having a dict of them.
+    """
 
     line_number: int
     row_data: Mapping[str, str]
@@ -76,10 +238,21 @@ class ValidationFindingLevel(Enum):
 
 
 class Finding(NamedTuple):
-    """Validation finding."""
+    """Validation finding.
+
+    .. versionchanged:: 0.3.8
+        Added line_number.
+    """
 
     level: ValidationFindingLevel
     message: str
+    line_number: Optional[int] = None
+
+    def format(self) -> str:
+        """Get the message, with the line number if there is one."""
+        if self.line_number is None:
+            return self.message
+        return f"Line: {self.line_number}. {self.message}"
 
 
 class AbsFileValidator(abc.ABC):
@@ -103,6 +276,10 @@ INVALID_MANIFEST_TSV_ERROR_MESSAGE = (
     "Data in file is not in a valid manifest format"
 )
 
+INVALID_MANIFEST_XLSX_ERROR_MESSAGE = (
+    "Data in file is not in a valid manifest workbook format"
+)
+
 
 def discover_manifest_tsv_findings(fp: TextIO) -> Set[Finding]:
     findings: Set[Finding] = set()
@@ -127,9 +304,390 @@ def discover_manifest_tsv_findings(fp: TextIO) -> Set[Finding]:
     return findings
 
 
+# Columns with a header such as "Access File Name" or
+# "Photograph Filenames (JPEG)" list files.
+FILE_NAME_COLUMN_PATTERN = re.compile(r"file\s*names?\b", re.IGNORECASE)
+
+# Columns with a header such as "Preservation File Name" must have a value.
+REQUIRED_COLUMN_PATTERN = re.compile(
+    r"preservation\s+file\s*name", re.IGNORECASE
+)
+
+
+def _display_name(field_name: str) -> str:
+    return " ".join(field_name.split())
+
+
+class AbsManifestRowRule(abc.ABC):
+    """Check of the records of a manifest, run while it is read once.
+
+    A rule is created for each file validated, with the header of the file,
+    so it can remember the records it has already checked.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def __init__(self, header: TableHeader) -> None:
+        """Create a rule for a manifest with the given header."""
+        self.header = header
+
+    @abc.abstractmethod
+    def check_record(
+        self, line_number: int, values: Sequence[str]
+    ) -> Iterable[Finding]:
+        """Check the values of a record, in the order of the columns.
+
+        Args:
+            line_number: line that the record ends on.
+            values: values of the record.
+        """
+
+    def check_header(self) -> Iterable[Finding]:
+        """Get any findings of the header, before any record is checked."""
+        return ()
+
+    def finish(self) -> Iterable[Finding]:
+        """Get any findings once every record has been checked."""
+        return ()
+
+    def columns_matching(self, pattern: re.Pattern[str]) -> List[int]:
+        """Get the indexes of the columns with a header matching a pattern."""
+        return [
+            index
+            for index, field_name in enumerate(self.header.fieldnames)
+            if pattern.search(field_name)
+        ]
+
+
+class FileNameColumnRule(AbsManifestRowRule):
+    """Find headers without any column of file names.
+
+    Every manifest lists files, so a table without a file name column is
+    not a manifest.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def check_header(self) -> Iterator[Finding]:
+        """Check that the header has a column of file names."""
+        if not self.columns_matching(FILE_NAME_COLUMN_PATTERN):
+            yield Finding(
+                ValidationFindingLevel.ERROR,
+                "No column of file names in the header",
+            )
+
+    def check_record(
+        self, line_number: int, values: Sequence[str]
+    ) -> Iterable[Finding]:
+        """Records are not checked."""
+        return ()
+
+
+class ColumnCountRule(AbsManifestRowRule):
+    """Find records with a different number of values than the header.
+
+    Columns at the end of the header without a name are not counted when a
+    record has fewer values, because spreadsheet programs often export
+    them. Values in columns past the end of the header are a warning, since
+    the columns of the header can still be read.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def __init__(self, header: TableHeader) -> None:
+        """Create a rule for a manifest with the given header."""
+        super().__init__(header)
+        self.total_columns = len(header.fieldnames)
+        self.named_columns = self.total_columns
+        while (
+            self.named_columns
+            and not header.fieldnames[self.named_columns - 1].strip()
+        ):
+            self.named_columns -= 1
+
+    def check_record(
+        self, line_number: int, values: Sequence[str]
+    ) -> Iterator[Finding]:
+        """Check the number of values of a record."""
+        if any(values[self.total_columns :]):
+            yield Finding(
+                ValidationFindingLevel.WARNING,
+                f"Found {len(values)} values but the header only has "
+                f"{self.total_columns} columns",
+                line_number,
+            )
+        elif len(values) < self.named_columns:
+            yield Finding(
+                ValidationFindingLevel.WARNING,
+                f"Found {len(values)} values but the header has "
+                f"{self.named_columns} columns",
+                line_number,
+            )
+
+
+class DuplicateFileNameRule(AbsManifestRowRule):
+    """Find file names listed more than once in the same column.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def __init__(self, header: TableHeader) -> None:
+        """Create a rule for a manifest with the given header."""
+        super().__init__(header)
+        self.seen: Dict[int, Dict[str, int]] = {
+            index: {}
+            for index in self.columns_matching(FILE_NAME_COLUMN_PATTERN)
+        }
+
+    def check_record(
+        self, line_number: int, values: Sequence[str]
+    ) -> Iterator[Finding]:
+        """Check the file names of a record against the records before."""
+        for index, seen in self.seen.items():
+            file_name = values[index].strip() if index < len(values) else ""
+            if not file_name:
+                continue
+            first_line = seen.setdefault(file_name, line_number)
+            if first_line != line_number:
+                yield Finding(
+                    ValidationFindingLevel.WARNING,
+                    f'"{file_name}" in column '
+                    f'"{_display_name(self.header.fieldnames[index])}" '
+                    f"is also on line {first_line}",
+                    line_number,
+                )
+
+
+class BlankRequiredColumnRule(AbsManifestRowRule):
+    """Find records without a value in a column that requires one.
+
+    .. versionadded:: 0.3.8
+    """
+
+    required_column_pattern = REQUIRED_COLUMN_PATTERN
+
+    def __init__(self, header: TableHeader) -> None:
+        """Create a rule for a manifest with the given header."""
+        super().__init__(header)
+        self.required_columns = self.columns_matching(
+            self.required_column_pattern
+        )
+
+    def check_record(
+        self, line_number: int, values: Sequence[str]
+    ) -> Iterator[Finding]:
+        """Check that the required columns of a record have values."""
+        for index in self.required_columns:
+            if index >= len(values) or not values[index].strip():
+                yield Finding(
+                    ValidationFindingLevel.WARNING,
+                    "No value in column "
+                    f'"{_display_name(self.header.fieldnames[index])}"',
+                    line_number,
+                )
+
+
+class FileNameWhitespaceRule(AbsManifestRowRule):
+    """Find file names with whitespace before or after them.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def __init__(self, header: TableHeader) -> None:
+        """Create a rule for a manifest with the given header."""
+        super().__init__(header)
+        self.file_name_columns = self.columns_matching(
+            FILE_NAME_COLUMN_PATTERN
+        )
+
+    def check_record(
+        self, line_number: int, values: Sequence[str]
+    ) -> Iterator[Finding]:
+        """Check the file names of a record for stray whitespace."""
+        for index in self.file_name_columns:
+            value = values[index] if index < len(values) else ""
+            if value.strip() and value != value.strip():
+                yield Finding(
+                    ValidationFindingLevel.WARNING,
+                    f'Whitespace around "{value.strip()}" in column '
+                    f'"{_display_name(self.header.fieldnames[index])}"',
+                    line_number,
+                )
+
+
+DEFAULT_MANIFEST_ROW_RULES: Final[
+    Sequence[Callable[[TableHeader], AbsManifestRowRule]]
+] = (
+    FileNameColumnRule,
+    ColumnCountRule,
+    DuplicateFileNameRule,
+    BlankRequiredColumnRule,
+    FileNameWhitespaceRule,
+)
+
+
+def log_finding(finding: Finding) -> None:
+    """Log a validation finding at the level of the finding.
+
+    .. versionadded:: 0.3.8
+    """
+    match finding.level:
+        case ValidationFindingLevel.WARNING:
+            logger.warning(finding.format())
+        case ValidationFindingLevel.ERROR:
+            logger.error(finding.format())
+        case _:
+            logger.warning(
+                'Unknown validation level. level: %s. message: "%s"',
+                finding.level,
+                finding.format(),
+            )
+
+
+def _iter_checked_records(
+    records: Iterable[Tuple[int, Sequence[str]]],
+    header: TableHeader,
+    rules: Sequence[Callable[[TableHeader], AbsManifestRowRule]],
+    finding_reporter: Optional[Callable[[Finding], None]] = None,
+) -> Iterator[Tuple[int, Sequence[str]]]:
+    """Check the header and then each record with the rules as it is read.
+
+    The header is checked right away, before any record is read. Findings
+    are reported as soon as they are found, and the first error stops the
+    read, as the manifest cannot be trusted after it.
+    """
+    report = finding_reporter or log_finding
+
+    def check(findings: Iterable[Finding]) -> None:
+        for finding in findings:
+            report(finding)
+            if finding.level is ValidationFindingLevel.ERROR:
+                raise InvalidFileFormat(details=finding.format())
+
+    row_rules = [rule(header) for rule in rules]
+    for rule in row_rules:
+        check(rule.check_header())
+
+    def iter_records() -> Iterator[Tuple[int, Sequence[str]]]:
+        for line_number, values in records:
+            for rule in row_rules:
+                check(rule.check_record(line_number, values))
+            yield line_number, values
+        for rule in row_rules:
+            check(rule.finish())
+
+    return iter_records()
+
+
+def _iter_decoded_lines(fp: TextIO, findings: List[Finding]) -> Iterator[str]:
+    """Read the lines of a file, noting the lines that cannot be decoded.
+
+    When the bytes of the file can be read, each line is decoded on its own
+    so that undecodable bytes are found on the line they are on, and the
+    rest of the file can still be checked.
+    """
+    encoding = getattr(fp, "encoding", None)
+    if (
+        not isinstance(fp, io.TextIOWrapper)
+        or encoding is None
+        or "\n".encode(encoding) != b"\n"
+    ):
+        yield from fp
+        return
+    fp.buffer.seek(fp.tell())
+    for line_number, line in enumerate(iter(fp.buffer.readline, b""), start=1):
+        try:
+            yield line.decode(encoding)
+        except UnicodeDecodeError as e:
+            findings.append(
+                Finding(
+                    ValidationFindingLevel.ERROR,
+                    f"Unable to read text as {encoding}: {e.reason}",
+                    line_number,
+                )
+            )
+            yield line.decode(encoding, errors="replace")
+
+
+def iter_manifest_tsv_findings(
+    fp: TextIO,
+    rules: Sequence[
+        Callable[[TableHeader], AbsManifestRowRule]
+    ] = DEFAULT_MANIFEST_ROW_RULES,
+) -> Iterator[Finding]:
+    """Validate every record of a manifest, reading it only once.
+
+    Every rule checks each record as it is read, instead of each check
+    reading the file again.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        fp: file pointer to a tsv manifest. It is returned to where it
+            started once the file has been read.
+        rules: creates the rules to check each record with, given the
+            header.
+
+    Yields:
+        Findings, in the order of the lines they are on.
+    """
+    starting = fp.tell()
+    decoding_findings: List[Finding] = []
+    reader = csv.reader(
+        _iter_decoded_lines(fp, decoding_findings), dialect="excel-tab"
+    )
+    row_rules: List[AbsManifestRowRule] = []
+    total_rows = 0
+    try:
+        fieldnames = next(reader, None)
+        yield from decoding_findings
+        decoding_findings.clear()
+        if fieldnames is not None:
+            header = TableHeader(fieldnames)
+            row_rules = [rule(header) for rule in rules]
+            for rule in row_rules:
+                yield from rule.check_header()
+            for line_number, values in _iter_records(reader):
+                yield from decoding_findings
+                decoding_findings.clear()
+                total_rows += 1
+                for rule in row_rules:
+                    yield from rule.check_record(line_number, values)
+            yield from decoding_findings
+    except (csv.Error, UnicodeDecodeError) as e:
+        logger.debug("Failed to parse file: %s", e)
+        yield Finding(
+            ValidationFindingLevel.ERROR,
+            INVALID_MANIFEST_TSV_ERROR_MESSAGE,
+            reader.line_num or None,
+        )
+        return
+    finally:
+        fp.seek(starting)
+    for rule in row_rules:
+        yield from rule.finish()
+    if total_rows == 0:
+        yield Finding(ValidationFindingLevel.WARNING, "No rows in the file.")
+
+
+def discover_manifest_tsv_record_findings(fp: TextIO) -> Set[Finding]:
+    """Validate every record of a manifest with the default rules.
+
+    .. versionadded:: 0.3.8
+    """
+    return set(iter_manifest_tsv_findings(fp))
+
+
 class ManifestTSVAbsFileValidator(AbsFileValidator):
+    """Validator for manifest TSV files.
+
+    .. versionchanged:: 0.3.8
+        Every record of the file is validated in a single read, instead of
+        only the first record.
+    """
+
     validations: Sequence[Callable[[TextIO], Set[Finding]]] = [
-        discover_manifest_tsv_findings
+        discover_manifest_tsv_record_findings
     ]
 
     def get_validation_findings(self) -> Set[Finding]:
@@ -165,25 +723,22 @@ class _TSVManifestReader:
     @remembered_file_pointer
     def iter_over_file_pointer(cls, fp: TextIO) -> Iterator[TableRow]:
         """Iterate over the file pointer."""
-        reader = cls.reader(fp)
-        for row in reader:
-            yield TableRow(line_number=reader.line_num, row_data=row)
+        yield from _iter_table_rows(fp)
 
     @classmethod
     @remembered_file_pointer
-    def get_items(
-        cls, fp: TextIO, index: Union[int, slice]
-    ) -> Union[TableRow, Sequence[TableRow]]:
+    def get_header(cls, fp: TextIO) -> typing.Optional[Sequence[str]]:
+        """Get the field names, only reading the file up to the first row."""
         reader = cls.reader(fp)
+        try:
+            next(reader)
+        except StopIteration:
+            return None
         return [
-            TableRow(line_number=reader.line_num, row_data=row)
-            for row in reader
-        ][index]
-
-    @classmethod
-    @remembered_file_pointer
-    def get_total_entries(cls, fp: TextIO) -> int:
-        return len(list(cls.reader(fp)))
+            field_name
+            for field_name in (reader.fieldnames or [])
+            if field_name is not None
+        ]
 
     @classmethod
     @remembered_file_pointer
@@ -191,25 +746,111 @@ class _TSVManifestReader:
         """Check if the file is a valid TSV file."""
         validator = cls.get_validator(fp, SupportedFileTypes.MANIFEST_TSV)
         findings = validator.get_validation_findings()
-        is_valid = True
-        if findings:
-            for finding in findings:
-                match finding.level:
-                    case ValidationFindingLevel.WARNING:
-                        logger.warning(finding.message)
-                    case ValidationFindingLevel.ERROR:
-                        logger.error(finding.message)
-                        is_valid = False
-                    case _:
-                        logger.warning(
-                            (
-                                "Unknown validation level. "
-                                'level: %s. message: "%s"'
-                            ),
-                            finding.level,
-                            finding.message,
-                        )
-        return is_valid
+        for finding in sorted(
+            findings, key=lambda finding: finding.line_number or 0
+        ):
+            log_finding(finding)
+        return not any(
+            finding.level is ValidationFindingLevel.ERROR
+            for finding in findings
+        )
+
+
+class _TSVRowIndex:
+    """Positions of the records of a TSV file, found as they are needed.
+
+    The file is read with the csv module to find where each record starts,
+    so quoted fields with newlines in them do not start a new record. The
+    file is only read as far as the records requested, and never twice.
+    Rows are then read by seeking straight to the position of a record.
+    """
+
+    def __init__(self, fp: TextIO) -> None:
+        self._fp = fp
+        self.header: Optional[TableHeader] = None
+        self._offsets = array.array("q")
+        self._line_numbers = array.array("I")
+        self._next_offset: Optional[int] = None
+        self._lines_read = 0
+        self.complete = False
+
+    @staticmethod
+    def _read_lines(fp: TextIO) -> Iterator[str]:
+        # Iterating over a text file disables tell(), so readline() is used.
+        while True:
+            line = fp.readline()
+            if not line:
+                return
+            yield line
+
+    def _extend(self, count: Optional[int] = None) -> None:
+        """Find more records, until there are at least count of them.
+
+        All records are found if count is None.
+        """
+        if self.complete or (
+            count is not None and len(self._offsets) >= count
+        ):
+            return
+        starting = self._fp.tell()
+        try:
+            if self._next_offset is not None:
+                self._fp.seek(self._next_offset)
+            reader = csv.reader(
+                self._read_lines(self._fp), dialect="excel-tab"
+            )
+            if self.header is None:
+                fieldnames = next(reader, None)
+                if fieldnames is None:
+                    self.complete = True
+                    return
+                self.header = TableHeader(fieldnames)
+            while count is None or len(self._offsets) < count:
+                offset = self._fp.tell()
+                row = next(reader, None)
+                if row is None:
+                    self.complete = True
+                    break
+                # Same as csv.DictReader, empty records are not rows.
+                if row:
+                    self._offsets.append(offset)
+                    self._line_numbers.append(
+                        self._lines_read + reader.line_num
+                    )
+            self._next_offset = self._fp.tell()
+            self._lines_read += reader.line_num
+        finally:
+            self._fp.seek(starting)
+
+    def __len__(self) -> int:
+        self._extend()
+        return len(self._offsets)
+
+    def get_rows(self, start: int, stop: int) -> List[TableRow]:
+        """Get the rows from start up to, but not including, stop."""
+        self._extend(stop)
+        stop = min(stop, len(self._offsets))
+        if start >= stop or self.header is None:
+            return []
+        starting = self._fp.tell()
+        try:
+            self._fp.seek(self._offsets[start])
+            records = _iter_records(
+                csv.reader(self._read_lines(self._fp), dialect="excel-tab")
+            )
+            return [
+                self.header.create_row(self._line_numbers[i], values)
+                for i, (_, values) in zip(range(start, stop), records)
+            ]
+        finally:
+            self._fp.seek(starting)
+
+    def get_row(self, index: int) -> TableRow:
+        """Get a single row, by its position in the file."""
+        rows = self.get_rows(index, index + 1)
+        if not rows:
+            raise IndexError("out of bounds")
+        return rows[0]
 
 
 class TSVManifest(collections.abc.Sequence[TableRow]):
@@ -224,10 +865,19 @@ class TSVManifest(collections.abc.Sequence[TableRow]):
         """Iterate over the TSV file contents."""
         return self._tsv_manifest.iter_over_file_pointer(fp=self._fp)
 
+    @cached_property
+    def _row_index(self) -> _TSVRowIndex:
+        return _TSVRowIndex(self._fp)
+
     @cached_property
     def total_entries(self) -> int:
-        """Get the number of entries in the TSV file."""
-        return self._tsv_manifest.get_total_entries(fp=self._fp)
+        """Get the number of entries in the TSV file.
+
+        .. versionchanged:: 0.3.8
+            Counted by the index of row positions used to get rows, instead
+            of a separate read of the whole file.
+        """
+        return len(self._row_index)
 
     def __len__(self) -> int:
         """Get the number of entries in the TSV file."""
@@ -246,16 +896,490 @@ class TSVManifest(collections.abc.Sequence[TableRow]):
 
         Note: The index is the determined by order of the record in the file,
         and not the line number it is on.
+
+        .. versionchanged:: 0.3.8
+            The position of each row is remembered the first time the file
+            is read up to it, so rows are read by seeking straight to them
+            instead of reading the file from the start each time.
         """
         if isinstance(index, slice):
             max_size = len(self)
-            if index.start < 0 or index.stop > max_size:
+            if (index.start or 0) < 0 or (
+                index.stop is not None and index.stop > max_size
+            ):
                 raise IndexError("out of bounds")
-        else:
-            if index >= len(self):
+            start, stop, step = index.indices(max_size)
+            if step == 1:
+                return self._row_index.get_rows(start, stop)
+            return [
+                self._row_index.get_row(i) for i in range(start, stop, step)
+            ]
+        if index < 0:
+            index += len(self)
+            if index < 0:
                 raise IndexError("out of bounds")
-        return self._tsv_manifest.get_items(fp=self._fp, index=index)
+        return self._row_index.get_row(index)
+
+    def get_header(self) -> typing.Optional[Sequence[str]]:
+        """Get the field names of the TSV file.
+
+        Only the header and the first row are read.
+
+        .. versionadded:: 0.3.8
+
+        Returns:
+            Field names, or None if the file has no rows.
+        """
+        return self._tsv_manifest.get_header(fp=self._fp)
 
     def is_valid_file(self) -> bool:
         """Check if the file is a valid manifest TSV file."""
         return self._tsv_manifest.is_valid_file(fp=self._fp)
+
+    def iter_rows(
+        self,
+        progress_reporter: Optional[Callable[[int], None]] = None,
+        columns: Optional[Collection[str]] = None,
+        rules: Sequence[
+            Callable[[TableHeader], AbsManifestRowRule]
+        ] = DEFAULT_MANIFEST_ROW_RULES,
+        finding_reporter: Optional[Callable[[Finding], None]] = None,
+    ) -> Iterator[TableRow]:
+        """Iterate over the rows, validating the file as it is read.
+
+        Unlike iterating over the manifest, the file is read from where the
+        file pointer is, exactly once, so this works with file pointers that
+        cannot seek. Validation happens during the same pass instead of
+        reading the file beforehand.
+
+        .. versionadded:: 0.3.8
+
+        Args:
+            progress_reporter: called with the number of characters read
+                each time a line is read.
+            columns: if set, only the values of the columns with these
+                field names are kept in each row, such as the columns from
+                AbsManifest.required_columns().
+            rules: creates the rules to check each record with, given the
+                header.
+            finding_reporter: called with each finding of the rules as it
+                is found. Defaults to logging them.
+
+        Raises:
+            InvalidFileFormat: if the data is not in a valid manifest format,
+                or a rule finds an error.
+
+        Yields:
+            Rows of the manifest.
+        """
+
+        def lines() -> Iterator[str]:
+            for line in self._fp:
+                if progress_reporter is not None:
+                    progress_reporter(len(line))
+                yield line
+
+        total_rows = 0
+        try:
+            for row in _iter_table_rows(
+                lines(), columns, rules, finding_reporter
+            ):
+                total_rows += 1
+                yield row
+        except (csv.Error, UnicodeDecodeError) as e:
+            logger.debug("Failed to parse file: %s", e)
+            raise InvalidFileFormat(
+                details=INVALID_MANIFEST_TSV_ERROR_MESSAGE
+            ) from e
+        if total_rows == 0:
+            logger.warning("No rows in the file.")
+
+
+# Zip files, including .xlsx workbooks, start with a local file header.
+ZIP_FILE_SIGNATURE: Final[bytes] = b"PK\x03\x04"
+
+_DEFAULT_SHEET = "xl/worksheets/sheet1.xml"
+_DEFAULT_SHARED_STRINGS = "xl/sharedStrings.xml"
+_ESCAPED_CHARACTER = re.compile(r"_x([0-9A-Fa-f]{4})_")
+_COLUMN_LETTERS = re.compile(r"[A-Za-z]+")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _unescape(text: str) -> str:
+    # Characters that cannot be in XML, such as control characters, are
+    # written by Excel as _xHHHH_.
+    if "_x" not in text:
+        return text
+    return _ESCAPED_CHARACTER.sub(lambda m: chr(int(m.group(1), 16)), text)
+
+
+def _column_index(cell_reference: str) -> Optional[int]:
+    match = _COLUMN_LETTERS.match(cell_reference)
+    if match is None:
+        return None
+    index = 0
+    for letter in match.group().upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _rich_text(element: ElementTree.Element) -> str:
+    # Text of a shared or inline string. Phonetic runs (rPh) are not part of
+    # the value shown in the cell.
+    if _local_name(element.tag) == "t":
+        return element.text or ""
+    return "".join(
+        _rich_text(child)
+        for child in element
+        if _local_name(child.tag) not in ("rPh", "phoneticPr")
+    )
+
+
+class _ProgressReportingReader:
+    """Report how much of a zip file member has been read.
+
+    The amount is reported in compressed bytes, so that it matches the size
+    of the workbook file.
+    """
+
+    def __init__(
+        self,
+        member: IO[bytes],
+        info: zipfile.ZipInfo,
+        progress_reporter: Callable[[int], None],
+    ) -> None:
+        self._member = member
+        self._ratio = (
+            info.compress_size / info.file_size if info.file_size else 0
+        )
+        self._progress_reporter = progress_reporter
+        self._total_read = 0
+        self._reported = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._member.read(size)
+        self._total_read += len(data)
+        reported = int(self._total_read * self._ratio)
+        if reported > self._reported:
+            self._progress_reporter(reported - self._reported)
+            self._reported = reported
+        return data
+
+
+class _XLSXManifestReader:
+    """Read the rows of the first worksheet of an .xlsx workbook.
+
+    The worksheet is parsed as it is decompressed and each row is discarded
+    once it has been read, so memory use does not grow with the number of
+    rows. Only the shared strings table of the workbook is kept in memory.
+    """
+
+    @staticmethod
+    def _find_parts(workbook: zipfile.ZipFile) -> Tuple[str, str]:
+        """Find the first worksheet and the shared strings of the workbook."""
+        names = set(workbook.namelist())
+        relationships: Dict[str, str] = {}
+        shared_strings = _DEFAULT_SHARED_STRINGS
+        if "xl/_rels/workbook.xml.rels" in names:
+            rels = ElementTree.fromstring(
+                workbook.read("xl/_rels/workbook.xml.rels")
+            )
+            for relationship in rels:
+                target = relationship.get("Target", "")
+                target = (
+                    target.lstrip("/")
+                    if target.startswith("/")
+                    else f"xl/{target}"
+                )
+                relationships[relationship.get("Id", "")] = target
+                if relationship.get("Type", "").endswith("/sharedStrings"):
+                    shared_strings = target
+        sheet = _DEFAULT_SHEET
+        if "xl/workbook.xml" in names:
+            for element in ElementTree.fromstring(
+                workbook.read("xl/workbook.xml")
+            ).iter():
+                if _local_name(element.tag) != "sheet":
+                    continue
+                relationship_id = next(
+                    (
+                        value
+                        for key, value in element.attrib.items()
+                        if _local_name(key) == "id"
+                    ),
+                    None,
+                )
+                if relationship_id in relationships:
+                    sheet = relationships[relationship_id]
+                break
+        return sheet, shared_strings
+
+    @staticmethod
+    def _read_shared_strings(
+        workbook: zipfile.ZipFile, name: str
+    ) -> List[str]:
+        if name not in workbook.namelist():
+            return []
+        strings: List[str] = []
+        with workbook.open(name) as member:
+            for _, element in ElementTree.iterparse(member):
+                if _local_name(element.tag) == "si":
+                    strings.append(_unescape(_rich_text(element)))
+                    element.clear()
+        return strings
+
+    @staticmethod
+    def _cell_value(cell: ElementTree.Element, shared: List[str]) -> str:
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            return "".join(
+                _unescape(_rich_text(child))
+                for child in cell
+                if _local_name(child.tag) == "is"
+            )
+        value = next(
+            (
+                child.text or ""
+                for child in cell
+                if _local_name(child.tag) == "v"
+            ),
+            "",
+        )
+        if cell_type == "s" and value:
+            return shared[int(value)]
+        if cell_type == "b":
+            return "TRUE" if value == "1" else "FALSE"
+        return _unescape(value)
+
+    @classmethod
+    def iter_sheet_rows(
+        cls,
+        fp: BinaryIO,
+        progress_reporter: Optional[Callable[[int], None]] = None,
+    ) -> Generator[Tuple[int, List[str]], None, None]:
+        """Iterate over the row numbers and cell values of the worksheet.
+
+        Rows without any values are skipped.
+        """
+        try:
+            with zipfile.ZipFile(fp) as workbook:
+                sheet, shared_strings = cls._find_parts(workbook)
+                shared = cls._read_shared_strings(workbook, shared_strings)
+                with workbook.open(sheet) as member:
+                    source: typing.Any = (
+                        member
+                        if progress_reporter is None
+                        else _ProgressReportingReader(
+                            member,
+                            workbook.getinfo(sheet),
+                            progress_reporter,
+                        )
+                    )
+                    yield from cls._iter_rows(source, shared)
+        except (
+            zipfile.BadZipFile,
+            KeyError,
+            IndexError,
+            ValueError,
+            ElementTree.ParseError,
+        ) as e:
+            logger.debug("Failed to parse file: %s", e)
+            raise InvalidFileFormat(
+                details=INVALID_MANIFEST_XLSX_ERROR_MESSAGE
+            ) from e
+
+    @classmethod
+    def _iter_rows(
+        cls, source: typing.Any, shared: List[str]
+    ) -> Iterator[Tuple[int, List[str]]]:
+        sheet_data: Optional[ElementTree.Element] = None
+        row_number = 0
+        for event, element in ElementTree.iterparse(
+            source, events=("start", "end")
+        ):
+            tag = _local_name(element.tag)
+            if event == "start":
+                if tag == "sheetData":
+                    sheet_data = element
+                continue
+            if tag != "row":
+                continue
+            row_number = int(element.get("r", row_number + 1))
+            values: List[str] = []
+            for cell in element:
+                if _local_name(cell.tag) != "c":
+                    continue
+                column = _column_index(cell.get("r", ""))
+                if column is None:
+                    column = len(values)
+                values += [""] * (column - len(values))
+                values.append(cls._cell_value(cell, shared))
+            # Rows already read are removed so that they are not all kept
+            # in memory by the parser.
+            if sheet_data is not None:
+                sheet_data.clear()
+            while values and not values[-1]:
+                values.pop()
+            if values:
+                yield row_number, values
+
+    @classmethod
+    def iter_table_rows(
+        cls,
+        fp: BinaryIO,
+        progress_reporter: Optional[Callable[[int], None]] = None,
+        columns: Optional[Collection[str]] = None,
+        rules: Sequence[Callable[[TableHeader], AbsManifestRowRule]] = (),
+        finding_reporter: Optional[Callable[[Finding], None]] = None,
+    ) -> Iterator[TableRow]:
+        """Iterate over the rows after the header, keyed by the header."""
+        sheet_rows = cls.iter_sheet_rows(fp, progress_reporter)
+        first_row = next(sheet_rows, None)
+        if first_row is None:
+            return
+        fieldnames = first_row[1]
+        width = len(fieldnames)
+        # Empty cells at the end of a row are not stored in the sheet.
+        records: Iterable[Tuple[int, Sequence[str]]] = (
+            (row_number, values + [""] * (width - len(values)))
+            for row_number, values in sheet_rows
+        )
+        if rules:
+            records = _iter_checked_records(
+                records, TableHeader(fieldnames), rules, finding_reporter
+            )
+        header = TableHeader(fieldnames, columns)
+        for row_number, values in records:
+            yield header.create_row(row_number, values)
+
+    @classmethod
+    @remembered_file_pointer
+    def get_header(cls, fp: BinaryIO) -> typing.Optional[Sequence[str]]:
+        """Get the field names, only reading the sheet up to the first row."""
+        rows = cls.iter_sheet_rows(fp)
+        try:
+            header = next(rows, None)
+            if header is None or next(rows, None) is None:
+                return None
+            return header[1]
+        finally:
+            rows.close()
+
+
+class XLSXManifest:
+    """A class to handle manifests saved as Excel .xlsx workbooks.
+
+    Rows are read from the first worksheet as the workbook is decompressed,
+    without loading the whole workbook, and are the same as the rows of the
+    manifest saved as a TSV file. The line number of a row is its row
+    number in the worksheet.
+
+    Cells are read as the values stored in the workbook, not as they are
+    formatted, so dates are read as numbers.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def __init__(self, fp: BinaryIO) -> None:
+        """Create a XLSXManifest object."""
+        self._fp = fp
+        self._xlsx_manifest = _XLSXManifestReader()
+
+    def __iter__(self) -> Iterator[TableRow]:
+        """Iterate over the rows of the workbook."""
+        return self._xlsx_manifest.iter_table_rows(fp=self._fp)
+
+    def get_header(self) -> typing.Optional[Sequence[str]]:
+        """Get the field names of the workbook.
+
+        Returns:
+            Field names, or None if the workbook has no rows.
+        """
+        return self._xlsx_manifest.get_header(fp=self._fp)
+
+    def iter_rows(
+        self,
+        progress_reporter: Optional[Callable[[int], None]] = None,
+        columns: Optional[Collection[str]] = None,
+        rules: Sequence[
+            Callable[[TableHeader], AbsManifestRowRule]
+        ] = DEFAULT_MANIFEST_ROW_RULES,
+        finding_reporter: Optional[Callable[[Finding], None]] = None,
+    ) -> Iterator[TableRow]:
+        """Iterate over the rows, validating the workbook as it is read.
+
+        Args:
+            progress_reporter: called with the number of bytes of the
+                workbook read.
+            columns: if set, only the values of the columns with these
+                field names are kept in each row.
+            rules: creates the rules to check each record with, given the
+                header.
+            finding_reporter: called with each finding of the rules as it
+                is found. Defaults to logging them.
+
+        Raises:
+            InvalidFileFormat: if the data is not in a valid manifest format,
+                or a rule finds an error.
+
+        Yields:
+            Rows of the manifest.
+        """
+        total_rows = 0
+        for row in self._xlsx_manifest.iter_table_rows(
+            fp=self._fp,
+            progress_reporter=progress_reporter,
+            columns=columns,
+            rules=rules,
+            finding_reporter=finding_reporter,
+        ):
+            total_rows += 1
+            yield row
+        if total_rows == 0:
+            logger.warning("No rows in the file.")
+
+
+def get_manifest_table(
+    fp: IO[typing.Any],
+) -> Union[TSVManifest, XLSXManifest]:
+    """Get the manifest reader for a file pointer.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        fp: file pointer opened with open_manifest(). Binary file pointers
+            are read as .xlsx workbooks, and text file pointers as TSV files.
+    """
+    if isinstance(fp, (io.BufferedIOBase, io.RawIOBase)):
+        return XLSXManifest(typing.cast(BinaryIO, fp))
+    return TSVManifest(typing.cast(TextIO, fp))
+
+
+def is_xlsx_file(path: pathlib.Path) -> bool:
+    """Check if a file is an .xlsx workbook, by its name or its contents.
+
+    .. versionadded:: 0.3.8
+    """
+    if path.suffix.lower() == ".xlsx":
+        return True
+    try:
+        with path.open("rb") as fp:
+            return fp.read(len(ZIP_FILE_SIGNATURE)) == ZIP_FILE_SIGNATURE
+    except OSError:
+        return False
+
+
+def open_manifest(path: pathlib.Path) -> IO[typing.Any]:
+    """Open a manifest file to be read with get_manifest_table().
+
+    .xlsx workbooks are opened in binary mode and everything else is opened
+    as a UTF-8 TSV file.
+
+    .. versionadded:: 0.3.8
+    """
+    if is_xlsx_file(path):
+        return path.open("rb")
+    return path.open("r", newline="", encoding="utf-8")
@@ -0,0 +1,161 @@
+"""Rules for which files and directories are included when searching.
+
+Patterns are shell style globs, matched with case sensitivity. A pattern
+without a "/" is matched against the name of each file and directory at any
+depth, such as ``.DS_Store`` or ``*.tmp``. A pattern with a "/" is matched
+against the path relative to the directory searched, such as
+``scratch/*``. A pattern ending with "/" only matches directories.
+
+Excluded directories are pruned so that nothing inside of them is listed.
+
+.. versionadded:: 0.3.8
+"""
+
+import dataclasses
+import fnmatch
+import os
+import pathlib
+import posixpath
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+__all__ = ["PathFilter", "load_path_filter"]
+
+# Name of the file in a search path with exclude patterns for that path.
+IGNORE_FILE_NAME = ".tripwireignore"
+
+
+def _matches(pattern: str, relative_path: str, is_directory: bool) -> bool:
+    if pattern.endswith("/"):
+        if not is_directory:
+            return False
+        pattern = pattern.rstrip("/")
+    if "/" in pattern:
+        return fnmatch.fnmatchcase(relative_path, pattern.lstrip("/"))
+    return fnmatch.fnmatchcase(relative_path.rsplit("/", 1)[-1], pattern)
+
+
+@dataclasses.dataclass(frozen=True)
+class PathFilter:
+    """Include and exclude patterns for files found in a search.
+
+    Attributes:
+        include: if not empty, only files matching one of these patterns
+            are included. Directories are never pruned by these.
+        exclude: files and directories matching any of these patterns are
+            excluded.
+    """
+
+    include: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        """Check if the filter has any patterns."""
+        return bool(self.include or self.exclude)
+
+    @staticmethod
+    def _to_relative(relative_path: str) -> str:
+        normalized = posixpath.normpath(relative_path.replace(os.sep, "/"))
+        return "" if normalized == "." else normalized.strip("/")
+
+    def is_directory_excluded(self, relative_path: str) -> bool:
+        """Check if a directory should be pruned from a search.
+
+        Args:
+            relative_path: path of the directory relative to the search path.
+        """
+        relative_path = self._to_relative(relative_path)
+        return any(
+            _matches(pattern, relative_path, is_directory=True)
+            for pattern in self.exclude
+        )
+
+    def is_file_included(self, relative_path: str) -> bool:
+        """Check if a file in a directory that is not pruned is included.
+
+        Args:
+            relative_path: path of the file relative to the search path.
+        """
+        relative_path = self._to_relative(relative_path)
+        if any(
+            _matches(pattern, relative_path, is_directory=False)
+            for pattern in self.exclude
+        ):
+            return False
+        if not self.include:
+            return True
+        return any(
+            _matches(pattern, relative_path, is_directory=False)
+            for pattern in self.include
+        )
+
+    def is_path_included(self, relative_path: str) -> bool:
+        """Check if a file is included, including its parent directories.
+
+        Use this when the parent directories were not already checked with
+        is_directory_excluded() during the search, such as for files from a
+        listing or a glob.
+
+        Args:
+            relative_path: path of the file relative to the search path.
+        """
+        parts = self._to_relative(relative_path).split("/")
+        for i in range(1, len(parts)):
+            if self.is_directory_excluded("/".join(parts[:i])):
+                return False
+        return self.is_file_included(relative_path)
+
+    def prune(self, relative_root: str, directories: List[str]) -> None:
+        """Remove excluded directories in place from an os.walk() listing.
+
+        Args:
+            relative_root: directory listed, relative to the search path.
+            directories: subdirectory names, as given by os.walk().
+        """
+        if not self.exclude:
+            return
+        directories[:] = [
+            directory
+            for directory in directories
+            if not self.is_directory_excluded(
+                os.path.join(relative_root, directory)
+            )
+        ]
+
+
+def read_ignore_file(path: pathlib.Path) -> Tuple[str, ...]:
+    """Read the exclude patterns from an ignore file.
+
+    Each line is a pattern. Blank lines and lines starting with # are
+    skipped.
+    """
+    patterns = []
+    with path.open("r", encoding="utf-8") as fp:
+        for line in fp:
+            pattern = line.strip()
+            if pattern and not pattern.startswith("#"):
+                patterns.append(pattern)
+    return tuple(patterns)
+
+
+def load_path_filter(
+    search_path: Optional[pathlib.Path] = None,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> PathFilter:
+    """Create a path filter, adding the patterns from the ignore file.
+
+    Args:
+        search_path: directory searched. If it contains an ignore file, the
+            patterns in it are excluded, along with the ignore file itself.
+        include: include patterns.
+        exclude: exclude patterns.
+    """
+    exclude_patterns = list(exclude or [])
+    if search_path is not None:
+        ignore_file = search_path / IGNORE_FILE_NAME
+        if ignore_file.is_file():
+            exclude_patterns.append(f"/{IGNORE_FILE_NAME}")
+            exclude_patterns += read_ignore_file(ignore_file)
+    return PathFilter(
+        include=tuple(include or []), exclude=tuple(exclude_patterns)
+    )
@@ -0,0 +1,176 @@
+"""Reading file listings made ahead of time instead of searching for files.
+
+Listings can either be plain text, with one path per line such as the output
+of ``find <path> -type f``, or CSV files such as object store
+inventories. Either can be compressed with gzip or zstd.
+
+.. versionadded:: 0.3.8
+"""
+
+import csv
+import gzip
+import io
+import itertools
+import logging
+import pathlib
+import typing
+import urllib.parse
+from typing import BinaryIO, Iterator, List, Optional, TextIO
+
+from uiucprescon.tripwire.exceptions import TripwireException
+
+__all__ = ["open_inventory", "iter_inventory_paths"]
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Column names checked, in order, to find the path of a file in a CSV
+# inventory with a header row.
+CSV_PATH_COLUMNS = ["path", "key", "file", "name"]
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class InventoryError(TripwireException):
+    """Unable to read an inventory."""
+
+
+def _open_zstd(fp: BinaryIO) -> BinaryIO:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.ZstdFile(fp)
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise InventoryError(
+            "Reading zstd compressed inventories requires Python 3.14 or the "
+            "zstandard package."
+        ) from e
+    return zstandard.ZstdDecompressor().stream_reader(fp)
+
+
+def open_inventory(path: pathlib.Path) -> TextIO:
+    """Open an inventory file, decompressing it as it is read if needed.
+
+    The compression is detected from the start of the file, not the file
+    extension.
+
+    Args:
+        path: inventory file.
+
+    Returns:
+        Text file pointer to the inventory.
+    """
+    raw = path.open("rb")
+    try:
+        magic = raw.read(4)
+        raw.seek(0)
+        binary: BinaryIO
+        if magic.startswith(GZIP_MAGIC):
+            binary = typing.cast(
+                BinaryIO, gzip.GzipFile(fileobj=raw, mode="rb")
+            )
+        elif magic.startswith(ZSTD_MAGIC):
+            binary = _open_zstd(raw)
+        else:
+            binary = raw
+    except BaseException:
+        raw.close()
+        raise
+    return io.TextIOWrapper(binary, encoding="utf-8", newline="")
+
+
+def is_csv_inventory(path: pathlib.Path) -> bool:
+    """Check if an inventory file is a CSV file based on its name."""
+    suffixes = [
+        suffix.lower()
+        for suffix in path.suffixes
+        if suffix.lower() not in {".gz", ".zst", ".zstd"}
+    ]
+    return bool(suffixes) and suffixes[-1] == ".csv"
+
+
+def _get_csv_path_column(first_row: List[str]) -> Optional[int]:
+    normalized = [value.strip().lower() for value in first_row]
+    for column in CSV_PATH_COLUMNS:
+        if column in normalized:
+            return normalized.index(column)
+    return None
+
+
+def iter_csv_inventory_paths(fp: TextIO) -> Iterator[str]:
+    """Get the paths in a CSV inventory.
+
+    If the first row is a header with a path, key, file or name column, that
+    column is used. Otherwise, the CSV is read as an Amazon S3 inventory,
+    which has no header and has the URL encoded key of each object in the
+    second column.
+    """
+    reader = csv.reader(fp)
+    first_row = next(reader, None)
+    if first_row is None:
+        return
+    path_column = _get_csv_path_column(first_row)
+    if path_column is not None:
+        for row in reader:
+            if len(row) > path_column and row[path_column]:
+                yield row[path_column]
+        return
+
+    def get_key(row: List[str]) -> Optional[str]:
+        if len(row) > 1:
+            return urllib.parse.unquote(row[1])
+        return row[0] if row else None
+
+    for row in itertools.chain([first_row], reader):
+        if key := get_key(row):
+            yield key
+
+
+def iter_text_inventory_paths(fp: TextIO) -> Iterator[str]:
+    """Get the paths in a text inventory with one path on each line."""
+    for line in fp:
+        if path := line.rstrip("\r\n"):
+            yield path
+
+
+def iter_inventory_paths(
+    inventory_file: pathlib.Path, root_path: pathlib.Path
+) -> Iterator[pathlib.Path]:
+    """Get the paths of the files in an inventory inside a directory.
+
+    Relative paths in the inventory are relative to the current directory,
+    the same as the root path. Paths outside of the root path are skipped, so
+    an inventory of a whole share can be used for any directory in it.
+
+    Args:
+        inventory_file: inventory file, which can be compressed.
+        root_path: only paths inside this directory are returned.
+
+    Yields:
+        Paths of files.
+
+    Raises:
+        InventoryError: if the inventory is not UTF-8 encoded text.
+    """
+    root = pathlib.PurePath(root_path)
+    with open_inventory(inventory_file) as fp:
+        paths = (
+            iter_csv_inventory_paths(fp)
+            if is_csv_inventory(inventory_file)
+            else iter_text_inventory_paths(fp)
+        )
+        try:
+            for path in paths:
+                file_path = pathlib.Path(path)
+                if file_path.is_relative_to(root):
+                    yield file_path
+        except UnicodeDecodeError as e:
+            raise InventoryError(
+                f"Unable to read {inventory_file}. It is not UTF-8 encoded "
+                f"text: {e}"
+            ) from e
@@ -5,16 +5,24 @@ import argparse
 import contextlib
 import functools
 import logging
+import os
 import pathlib
 import sys
 from typing import Callable, Any, Dict, Tuple, Optional
 
 from uiucprescon.tripwire import (
+    archives,
+    copy_verify,
+    duplicates,
+    filters,
+    inventory,
+    manifest_batch,
     validation,
     utils,
     manifest_check,
     metadata,
     introspection,
+    watch,
 )
 from uiucprescon.tripwire.exceptions import InvalidFileFormat
 import argcomplete
@@ -48,14 +56,96 @@ def capture_log(
 def get_hash_command(args: argparse.Namespace) -> None:
     """Run get hash command."""
     validation.get_hash_command(
-        files=args.files, hashing_algorithm=args.hashing_algorithm
+        files=args.files,
+        hashing_algorithm=args.hashing_algorithm,
+        hashing_backend=args.hashing_backend,
     )
 
 
+@capture_log(logger=archives.logger)
 @capture_log(logger=validation.logger)
 def validate_checksums_command(args: argparse.Namespace) -> None:
     """Run validate checksums command."""
-    validation.validate_directory_checksums_command(path=args.path)
+    hashing_strategy = validation.HASHING_BACKENDS[args.hashing_backend]
+    if archives.is_supported_archive(args.path):
+        archives.validate_archive_checksums_command(
+            path=args.path,
+            jobs=args.jobs,
+            results_strategy=functools.partial(
+                archives.iter_archive_checksum_results,
+                hashing_strategy=hashing_strategy,
+                path_filter=get_path_filter(args, args.path),
+            ),
+        )
+        return
+    validation.validate_directory_checksums_command(
+        path=args.path,
+        locate_checksum_strategy=functools.partial(
+            validation.locate_checksum_files,
+            path_filter=get_path_filter(args, args.path),
+        ),
+        compare_checksum_to_target_strategy=functools.partial(
+            validation.validate_file_against_expected_hash,
+            hashing_strategy=hashing_strategy,
+        ),
+    )
+
+
+@capture_log(logger=duplicates.logger)
+def find_duplicates_command(args: argparse.Namespace) -> None:
+    """Run find duplicates command."""
+    duplicates.find_duplicates_command(path=args.path)
+
+
+@capture_log(logger=copy_verify.logger)
+def copy_verify_command(args: argparse.Namespace) -> None:
+    """Run copy verify command."""
+    if not copy_verify.copy_verify_command(
+        source=args.source,
+        destination=args.destination,
+        jobs=args.jobs,
+        drop_cache=args.drop_cache,
+        write_sidecars=args.write_checksums,
+    ):
+        sys.exit(1)
+
+
+def get_path_filter(
+    args: argparse.Namespace, search_path: pathlib.Path
+) -> filters.PathFilter:
+    """Get the include and exclude rules for searching a path."""
+    return filters.load_path_filter(
+        search_path, include=args.include, exclude=args.exclude
+    )
+
+
+def get_file_search_strategy(
+    args: argparse.Namespace,
+) -> manifest_check.FileSearchFactory:
+    """Get the strategy used to walk the search path of a manifest check."""
+    path_filter = get_path_filter(args, args.search_path)
+    if args.inventory is not None:
+        return functools.partial(
+            manifest_check.InventoryFileSearch,
+            inventory_file=args.inventory,
+            path_filter=path_filter,
+        )
+    if args.index_file is not None:
+        return functools.partial(
+            manifest_check.IndexedFileSearch,
+            index_file=args.index_file,
+            path_filter=path_filter,
+        )
+    if args.scanner == "concurrent":
+        return functools.partial(
+            manifest_check.ConcurrentFileSearch,
+            max_workers=args.scan_threads,
+            path_filter=path_filter,
+        )
+    return functools.partial(
+        manifest_check.FILE_SEARCH_STRATEGIES[args.scanner],
+        path_filter=path_filter,
+    )
 
 
 @capture_log(logger=manifest_check.logger)
@@ -64,14 +154,117 @@ def manifest_check_command(
     print_usage_function: Callable[[Optional[Any]], None],
 ) -> None:
     """Run manifest check command."""
+    if args.watch:
+        watch_manifests_command(args, print_usage_function)
+        return
+    try:
+        if args.low_memory:
+            manifest_check.locate_files_in_manifests_streaming(
+                manifests=manifest_check.find_manifest_files(args.manifest),
+                search_path=args.search_path,
+                file_search_strategy=get_file_search_strategy(args),
+            )
+            return
+        manifest_check.locate_files_in_manifests(
+            manifests=manifest_check.find_manifest_files(args.manifest),
+            search_path=args.search_path,
+            file_search_strategy=get_file_search_strategy(args),
+            verify_checksums=args.verify_checksums,
+            jobs=args.jobs,
+            suggest=args.suggestions,
+        )
+    except InvalidFileFormat as e:
+        logger.error(str(e))
+        print_usage_function(sys.stderr)
+        sys.exit(1)
+    except inventory.InventoryError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+
+@capture_log(logger=watch.logger)
+def watch_manifests_command(
+    args: argparse.Namespace,
+    print_usage_function: Callable[[Optional[Any]], None],
+) -> None:
+    """Run manifest check command in watch mode."""
     try:
-        manifest_check.locate_manifest_files(
-            manifest_tsv=args.manifest, search_path=args.search_path
+        all_found = watch.watch_manifests(
+            manifests=manifest_check.find_manifest_files(args.manifest),
+            search_path=args.search_path,
+            path_filter=get_path_filter(args, args.search_path),
+            timeout=args.watch_timeout,
         )
     except InvalidFileFormat as e:
         logger.error(str(e))
         print_usage_function(sys.stderr)
         sys.exit(1)
+    except watch.WatchError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    if not all_found:
+        sys.exit(1)
+
+
+@capture_log(logger=manifest_batch.logger)
+def manifest_check_batch_command(args: argparse.Namespace) -> None:
+    """Run manifest check batch command."""
+    if not manifest_batch.manifest_check_batch_command(
+        root=args.root,
+        jobs=args.jobs,
+        details=args.details,
+        include=args.include,
+        exclude=args.exclude,
+    ):
+        sys.exit(1)
+
+
+def add_path_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options to include or exclude files from a search."""
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="PATTERN",
+        help="only include files matching this glob pattern. Can be given "
+        "more than once",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="PATTERN",
+        help="exclude files and directories matching this glob pattern. "
+        "Excluded directories are not searched. Can be given more than "
+        f"once. Patterns in a {filters.IGNORE_FILE_NAME} file in the path "
+        "searched are also excluded",
+    )
+
+
+def add_hashing_backend_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the option to select how files are hashed."""
+    parser.add_argument(
+        "--hashing-backend",
+        type=str,
+        default="hashlib",
+        choices=validation.HASHING_BACKENDS.keys(),
+        help="how files are hashed. kernel uses the Linux kernel crypto API "
+        "when available and falls back to hashlib when it is not "
+        "(default: %(default)s)",
+    )
+
+
+def positive_int(value: str) -> int:
+    """Convert a command line argument to an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid int value: {value!r}"
+        ) from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be greater than zero: {value!r}"
+        )
+    return number
 
 
 def get_arg_parser() -> Tuple[
@@ -99,24 +292,177 @@ def get_arg_parser() -> Tuple[
         help="hashing algorithm to use (default: %(default)s)",
         choices=validation.SUPPORTED_ALGORITHMS.keys(),
     )
+    add_hashing_backend_argument(get_hash_command_parser)
 
     validate_checksums_parser = sub_commands.add_parser("validate-checksums")
-    validate_checksums_parser.add_argument("path", type=pathlib.Path)
+    validate_checksums_parser.add_argument(
+        "path",
+        type=pathlib.Path,
+        help="Directory, or a zip or tar archive, containing checksum files "
+        "and the files they describe.",
+    )
+    validate_checksums_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="number of archive members to verify at the same time "
+        "(default: %(default)s)",
+    )
+    add_hashing_backend_argument(validate_checksums_parser)
+    add_path_filter_arguments(validate_checksums_parser)
 
     manifest_check_parser = sub_commands.add_parser("manifest-check")
     manifest_check_parser.add_argument(
         "manifest",
         type=pathlib.Path,
-        help=""".tsv file that contains a package manifest.
-        Note that this is NOT an excel (.xlsx) file. To create a .tsv file,
-        from an .xlsx file, open the .xlsx file in Excel and save it as a
-        Tab Delimited Text file format.""",
+        nargs="+",
+        help=""".tsv or Excel .xlsx file that contains a package manifest,
+        or a directory of them. More than one can be given to check them all
+        with a single search of the search path. For .xlsx files, the first
+        worksheet is read.""",
     )
     manifest_check_parser.add_argument(
         "search_path",
         type=pathlib.Path,
         help="Path to search recursively for files listed in the manifest.",
     )
+    manifest_check_parser.add_argument(
+        "--scanner",
+        type=str,
+        default="sequential",
+        choices=manifest_check.FILE_SEARCH_STRATEGIES.keys(),
+        help="how to walk the search path. concurrent lists many directories "
+        "at the same time, which is faster on network storage "
+        "(default: %(default)s)",
+    )
+    manifest_check_parser.add_argument(
+        "--scan-threads",
+        type=positive_int,
+        default=manifest_check.ConcurrentFileSearch.default_max_workers,
+        help="number of directories to list at the same time when using the "
+        "concurrent scanner (default: %(default)s)",
+    )
+    manifest_check_parser.add_argument(
+        "--index-file",
+        type=pathlib.Path,
+        default=None,
+        help="index of the search path to reuse between checks. Only "
+        "directories changed since the last check are listed again. "
+        "The file is created if it does not exist. When used, --scanner is "
+        "ignored",
+    )
+    manifest_check_parser.add_argument(
+        "--inventory",
+        type=pathlib.Path,
+        default=None,
+        help="get the files in the search path from a listing of files "
+        "instead of searching for them. Either a text file with one path on "
+        "each line, or a .csv file such as an object store inventory. Can be "
+        "compressed with gzip or zstd. When used, --scanner and --index-file "
+        "are ignored",
+    )
+    manifest_check_parser.add_argument(
+        "--verify-checksums",
+        action="store_true",
+        help="also verify located files against their .md5 checksum files",
+    )
+    manifest_check_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="number of files to verify at the same time when using "
+        "--verify-checksums (default: %(default)s)",
+    )
+    manifest_check_parser.add_argument(
+        "--suggestions",
+        action="store_true",
+        help="show files with similar names to files that could not be "
+        "located",
+    )
+    manifest_check_parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="only keep the files listed in the manifest in memory instead "
+        "of an index of the search path, for search paths with too many "
+        "files to index. Files not included in the manifest are shown as "
+        "soon as they are found. When used, --verify-checksums and "
+        "similar file names are not available",
+    )
+    manifest_check_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="after checking, keep watching the search path and show "
+        "changes as files are added or removed. Exits once every file in "
+        "the manifest has been found. Only available on Linux. When used, "
+        "--scanner, --index-file, --inventory and --verify-checksums are "
+        "ignored",
+    )
+    manifest_check_parser.add_argument(
+        "--watch-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="when using --watch, stop with an error if nothing changes for "
+        "this many seconds",
+    )
+    add_path_filter_arguments(manifest_check_parser)
+    manifest_check_batch_parser = sub_commands.add_parser(
+        "manifest-check-batch",
+        help="check every package in a directory against its manifest.",
+    )
+    manifest_check_batch_parser.add_argument(
+        "root",
+        type=pathlib.Path,
+        help="Directory to search recursively for packages. Any directory "
+        "with a manifest .tsv or .xlsx file in it is a package.",
+    )
+    manifest_check_batch_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="number of packages to check at the same time "
+        "(default: %(default)s)",
+    )
+    manifest_check_batch_parser.add_argument(
+        "--details",
+        action="store_true",
+        help="show every issue found in each package, not just the summary",
+    )
+    add_path_filter_arguments(manifest_check_batch_parser)
+    find_duplicates_parser = sub_commands.add_parser(
+        "find-duplicates", help="find files with identical content."
+    )
+    find_duplicates_parser.add_argument(
+        "path",
+        type=pathlib.Path,
+        help="Path to search recursively for duplicate files.",
+    )
+    copy_verify_parser = sub_commands.add_parser(
+        "copy-verify", help="copy files and verify the copies."
+    )
+    copy_verify_parser.add_argument(
+        "source", type=pathlib.Path, help="File or directory to copy."
+    )
+    copy_verify_parser.add_argument(
+        "destination", type=pathlib.Path, help="Where to copy to."
+    )
+    copy_verify_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="number of files to copy at the same time (default: %(default)s)",
+    )
+    copy_verify_parser.add_argument(
+        "--drop-cache",
+        action="store_true",
+        help="evict copies from the operating system's cache before "
+        "verifying them so that they are read back from the storage device",
+    )
+    copy_verify_parser.add_argument(
+        "--write-checksums",
+        action="store_true",
+        help="write a .md5 file next to each verified copy",
+    )
     metadata_cmd = sub_commands.add_parser("metadata")
     metadata_parser = metadata_cmd.add_subparsers(
         dest="metadata_command", required=True
@@ -127,12 +473,27 @@ def get_arg_parser() -> Tuple[
     )
 
     metadata_show_show.add_argument("glob", type=str)
+    metadata_show_show.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="number of files to read the metadata of at the same time "
+        "(default: %(default)s)",
+    )
+    add_path_filter_arguments(metadata_show_show)
 
     metadata_validate = metadata_parser.add_parser(
         "validate", help="validate files from mediaconch policy"
     )
     metadata_validate.add_argument("policy_file", type=pathlib.Path)
     metadata_validate.add_argument("glob", type=str)
+    metadata_validate.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="number of files to validate at the same time, each in its own "
+        "process (default: %(default)s)",
+    )
     metadata_validate.add_argument(
         "-v",
         "--verbose",
@@ -150,6 +511,9 @@ def get_arg_parser() -> Tuple[
             "get-hash": get_hash_command_parser.print_help,
             "validate-checksums": validate_checksums_parser.print_help,
             "manifest-check": manifest_check_parser.print_help,
+            "manifest-check-batch": manifest_check_batch_parser.print_help,
+            "find-duplicates": find_duplicates_parser.print_help,
+            "copy-verify": copy_verify_parser.print_help,
             "metadata": metadata_cmd.print_help,
         },
     )
@@ -158,7 +522,17 @@ def get_arg_parser() -> Tuple[
 @capture_log(logger=metadata.logger)
 def metadata_show_command(args: argparse.Namespace) -> None:
     """Run metadata show command."""
-    metadata.show_metadata(args.glob, search_path=pathlib.Path("."))
+    metadata.show_metadata(
+        args.glob,
+        search_path=pathlib.Path("."),
+        find_files_strategy=functools.partial(
+            metadata.locate_files,
+            path_filter=get_path_filter(
+                args, pathlib.Path(metadata.get_glob_root(args.glob))
+            ),
+        ),
+        jobs=args.jobs,
+    )
 
 
 @contextlib.contextmanager
@@ -207,7 +581,7 @@ def metadata_validate_command(
         metadata.logger, verbosity=get_log_level(args.verbosity)
     ):
         if not validate_metadata_strategy(
-            args.glob, policy_xml_file=args.policy_file
+            args.glob, policy_xml_file=args.policy_file, jobs=args.jobs
         ):
             print("failed metadata validation")
             sys.exit(1)
@@ -246,6 +620,12 @@ def main() -> None:
                 args,
                 print_usage_function=print_help_commands["manifest-check"],
             )
+        case "manifest-check-batch":
+            manifest_check_batch_command(args)
+        case "find-duplicates":
+            find_duplicates_command(args)
+        case "copy-verify":
+            copy_verify_command(args)
         case "metadata":
             metadata_command(args, args.metadata_command)
         case "info":
@@ -0,0 +1,289 @@
+"""Checking the manifests of many packages at the same time.
+
+A package is a directory with one or more manifest .tsv or .xlsx files in
+it. Each package is checked in a separate process, searching only its own
+directory, and the results are reported together.
+
+.. versionadded:: 0.3.8
+"""
+
+import concurrent.futures
+import dataclasses
+import functools
+import logging
+import os
+import pathlib
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from uiucprescon.tripwire import files as tripwire_files
+from uiucprescon.tripwire import filters, manifest_check, utils
+from uiucprescon.tripwire.exceptions import InvalidFileFormat
+
+__all__ = [
+    "Package",
+    "PackageCheckResult",
+    "check_packages",
+    "find_packages",
+    "manifest_check_batch_command",
+]
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@dataclasses.dataclass(frozen=True)
+class Package:
+    """A directory of files and the manifests that list them."""
+
+    path: pathlib.Path
+    manifests: Tuple[pathlib.Path, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class PackageCheckResult:
+    """Result of checking a package against its manifests."""
+
+    package: Package
+    missing: Tuple[manifest_check.ManifestCheckResult, ...] = ()
+    duplicates: Tuple[manifest_check.ManifestCheckResult, ...] = ()
+    unexpected: Tuple[manifest_check.ManifestCheckResult, ...] = ()
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def has_issues(self) -> bool:
+        """Check if the package does not match its manifests."""
+        return bool(
+            self.error or self.missing or self.duplicates or self.unexpected
+        )
+
+
+def find_packages(
+    root: pathlib.Path,
+    is_manifest_strategy: Callable[[pathlib.Path], bool] = (
+        manifest_check.is_manifest_file
+    ),
+) -> Iterator[Package]:
+    """Find every package under a directory.
+
+    Directories with a manifest are packages and are not searched any
+    further, so the files inside of a package are only listed when the
+    package is checked.
+
+    Args:
+        root: directory to search recursively for packages.
+        is_manifest_strategy: strategy to check if a .tsv or .xlsx file is a
+            manifest.
+
+    Yields:
+        Packages, in the order they are found.
+    """
+    for directory, dirs, files in os.walk(root):
+        manifests = tuple(
+            pathlib.Path(directory, file_name)
+            for file_name in sorted(files)
+            if manifest_check.is_manifest_file_name(file_name)
+            and is_manifest_strategy(pathlib.Path(directory, file_name))
+        )
+        if manifests:
+            dirs.clear()
+            yield Package(path=pathlib.Path(directory), manifests=manifests)
+        else:
+            dirs.sort()
+
+
+def check_package(
+    package: Package,
+    include: Tuple[str, ...] = (),
+    exclude: Tuple[str, ...] = (),
+    file_search_strategy: Callable[
+        ..., Iterator[pathlib.Path]
+    ] = manifest_check.RecursiveFileSearch,
+) -> PackageCheckResult:
+    """Check a package against its manifests with a single search.
+
+    This runs in a worker process, so everything it returns is collected
+    into a result instead of being shown.
+
+    Args:
+        package: package to check.
+        include: include patterns for the files in the package.
+        exclude: exclude patterns for the files in the package. Patterns in
+            an ignore file in the package are also excluded.
+        file_search_strategy: strategy used to walk the package, called with
+            the package path and a path_filter keyword argument.
+    """
+    start_time = time.perf_counter()
+    scanner = manifest_check.PackageScanner(
+        package.path,
+        scanner_klass=functools.partial(
+            file_search_strategy,
+            path_filter=filters.load_path_filter(
+                package.path, include=include, exclude=exclude
+            ),
+        ),
+    )
+    missing: List[manifest_check.ManifestCheckResult] = []
+    for manifest in package.manifests:
+        try:
+            with tripwire_files.open_manifest(manifest) as fp:
+                manifest_type = manifest_check.get_manifest_type(fp)
+                missing += manifest_check.iter_missing_manifest_files(
+                    tripwire_files.get_manifest_table(fp).iter_rows(
+                        columns=manifest_type.required_columns()
+                    ),
+                    scanner,
+                    manifest_type,
+                )
+        except (InvalidFileFormat, ValueError, OSError) as e:
+            return PackageCheckResult(
+                package=package,
+                error=f"{manifest.name}: {e}",
+                elapsed=time.perf_counter() - start_time,
+            )
+    return PackageCheckResult(
+        package=package,
+        missing=tuple(missing),
+        duplicates=tuple(manifest_check.iter_duplicate_files(scanner)),
+        unexpected=tuple(
+            result
+            for result in manifest_check.iter_unexpected_files(scanner)
+            if result.location not in package.manifests
+        ),
+        elapsed=time.perf_counter() - start_time,
+    )
+
+
+def check_packages(
+    packages: Iterable[Package],
+    jobs: int = 1,
+    check_package_strategy: Callable[
+        [Package], PackageCheckResult
+    ] = check_package,
+    executor_factory: Callable[
+        ..., concurrent.futures.Executor
+    ] = concurrent.futures.ProcessPoolExecutor,
+) -> Iterator[PackageCheckResult]:
+    """Check packages in a pool of worker processes.
+
+    Args:
+        packages: packages to check.
+        jobs: number of packages to check at the same time.
+        check_package_strategy: strategy to check a single package. It must
+            be picklable, such as a module level function or a
+            functools.partial of one.
+        executor_factory: creates the executor, given max_workers.
+
+    Yields:
+        A result for each package as soon as it has been checked.
+    """
+    with executor_factory(max_workers=jobs) as executor:
+        yield from utils.iter_executor_results(
+            executor,
+            check_package_strategy,
+            packages,
+            max_pending=jobs * 2,
+        )
+
+
+def format_package_details(
+    result: PackageCheckResult, root: pathlib.Path
+) -> str:
+    """Create the detailed report of a package with issues."""
+    lines = [f"{result.package.path.relative_to(root)}:"]
+    if result.error:
+        lines.append(f"  Unable to check: {result.error}")
+    for missing in result.missing:
+        lines.append(
+            f"  Line: {missing.line_number}. Unable to locate: {missing.file}"
+        )
+    for duplicate in result.duplicates:
+        lines.append(
+            f"  Found in more than one location: "
+            f"{duplicate.location.relative_to(result.package.path)}"
+            if duplicate.location
+            else f"  Found in more than one location: {duplicate.file}"
+        )
+    for unexpected in result.unexpected:
+        lines.append(
+            f"  Not included in manifest: "
+            f"{unexpected.location.relative_to(result.package.path)}"
+            if unexpected.location
+            else f"  Not included in manifest: {unexpected.file}"
+        )
+    return "\n".join(lines)
+
+
+def create_batch_summary(
+    results: Iterable[PackageCheckResult], root: pathlib.Path
+) -> str:
+    """Create a summary of the results of checking many packages."""
+    results = sorted(results, key=lambda result: result.package.path)
+    with_issues = [result for result in results if result.has_issues]
+    lines = [f"Checked {len(results)} package(s) in {root}."]
+    for result in with_issues:
+        package_name = result.package.path.relative_to(root)
+        if result.error:
+            lines.append(f"  * {package_name} - Unable to check")
+            continue
+        lines.append(
+            f"  * {package_name} - {len(result.missing)} missing, "
+            f"{len(result.unexpected)} not in manifest, "
+            f"{len(result.duplicates)} in more than one location"
+        )
+    if with_issues:
+        lines.append(
+            f"{len(with_issues)} of {len(results)} package(s) have issues."
+        )
+    else:
+        lines.append("All packages match their manifests.")
+    return "\n".join(lines)
+
+
+def manifest_check_batch_command(
+    root: pathlib.Path,
+    jobs: int = 1,
+    details: bool = False,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    check_packages_strategy: Callable[
+        ..., Iterable[PackageCheckResult]
+    ] = check_packages,
+) -> bool:
+    """Check every package under a directory and report a summary.
+
+    Args:
+        root: directory to search recursively for packages.
+        jobs: number of packages to check at the same time.
+        details: also show every issue of each package with issues.
+        include: include patterns for the files in each package.
+        exclude: exclude patterns for the files in each package.
+        check_packages_strategy: strategy to check the packages.
+
+    Returns:
+        True if every package matched its manifests, otherwise False.
+    """
+    results: List[PackageCheckResult] = []
+    prog_bar = tqdm(desc="Checking packages", unit=" package", leave=False)
+    for result in check_packages_strategy(
+        find_packages(root),
+        jobs=jobs,
+        check_package_strategy=functools.partial(
+            check_package,
+            include=tuple(include or []),
+            exclude=tuple(exclude or []),
+        ),
+    ):
+        prog_bar.update()
+        if details and result.has_issues:
+            prog_bar.write(format_package_details(result, root))
+        results.append(result)
+    prog_bar.close()
+    if not results:
+        logger.warning("No package manifests found in %s", root)
+        return True
+    logger.info(create_batch_summary(results, root))
+    return not any(result.has_issues for result in results)
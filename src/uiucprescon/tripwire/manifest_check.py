@@ -1,26 +1,50 @@
 """Manifest file checking."""
 
 import abc
+import array
+import collections
+import concurrent.futures
+import dataclasses
+import difflib
+import enum
+import functools
+import hashlib
 import os
 import pathlib
+import sqlite3
+import stat
+import string
+import time
 import typing
+import unicodedata
 from typing import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
     Mapping,
+    Optional,
     Set,
     MutableMapping,
-    TextIO,
     Sequence,
     Type,
     List,
     Dict,
+    Tuple,
 )
 import logging
 from uiucprescon.tripwire import files as tripwire_files
+from uiucprescon.tripwire import filters, inventory, utils, validation
 from uiucprescon.tripwire.exceptions import InvalidFileFormat
 
 from tqdm import tqdm
 
-__all__ = ["locate_manifest_files"]
+__all__ = [
+    "locate_manifest_files",
+    "iter_manifest_check_results",
+    "ManifestCheckResult",
+    "ManifestCheckStatus",
+]
 PHOTO_FILE = "photo file"
 ACCESS_FILE = "access file"
 PRESERVATION_FILE = "preservation file"
@@ -38,13 +62,79 @@ class SearchPackage(typing.TypedDict, total=False):
     photo_file_checksum: str
 
 
+class ManifestCheckStatus(enum.Enum):
+    """Outcome of checking a file against a manifest."""
+
+    MISSING = "missing"
+    UNEXPECTED = "unexpected"
+    DUPLICATE = "duplicate"
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestCheckResult:
+    """A file that is either missing from or not included in a manifest.
+
+    .. versionadded:: 0.3.8
+    """
+
+    status: ManifestCheckStatus
+    file: str
+    line_number: Optional[int] = None
+    package_key: Optional[str] = None
+    location: Optional[pathlib.Path] = None
+    manifest: Optional[pathlib.Path] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestLineResult:
+    """Files missing and checksums verified for a single manifest line.
+
+    .. versionadded:: 0.3.8
+    """
+
+    line_number: int
+    missing: Tuple[ManifestCheckResult, ...]
+    checksums: Tuple[validation.ChecksumValidationResult, ...]
+
+
 class AbsManifest(abc.ABC):
     """Abstract class for manifest."""
 
     @abc.abstractmethod
-    def verify_format_type(self, fp: TextIO) -> bool:
+    def verify_format_type(self, fp: typing.IO) -> bool:
         """Check if the file is the expect format."""
 
+    @classmethod
+    def matches_header(cls, header: Collection[str]) -> Optional[bool]:
+        """Check if a manifest header is the format of this manifest type.
+
+        Used by get_manifest_type() so that the type of a manifest can be
+        found by reading its header once, instead of once per manifest type.
+
+        .. versionadded:: 0.3.8
+
+        Args:
+            header: field names of the manifest.
+
+        Returns:
+            None if the type cannot be determined from the header alone, in
+            which case verify_format_type() is used instead.
+        """
+        return None
+
+    def required_columns(self) -> Optional[Collection[str]]:
+        """Get the columns of the manifest used to identify files in a row.
+
+        Rows can be read with only these columns, so that the values of the
+        other columns are not kept in memory.
+
+        .. versionadded:: 0.3.8
+
+        Returns:
+            Field names of the columns, or None if any column can be used.
+        """
+        return None
+
     @abc.abstractmethod
     def extract_files_from_manifest(
         self, row: Mapping[str, str]
@@ -56,6 +146,10 @@ class KeyDetermineBaseOnList:
     def __init__(self, pattern: Dict[str, List[str]]):
         self.pattern = pattern
 
+    def possible_keys(self) -> Set[str]:
+        """Get every key that could be found in a row."""
+        return {key for keys in self.pattern.values() for key in keys}
+
     @staticmethod
     def get_for_possible(row, possible_keys: List[str]) -> str:
         for key in possible_keys:
@@ -92,20 +186,26 @@ class FilmManifest(AbsManifest):
             }
         )
 
-    def verify_format_type(self, fp: TextIO) -> bool:
+    def verify_format_type(self, fp: typing.IO) -> bool:
         result = self.is_it_a_film_manifest(fp=fp)
         if result is True:
             logger.debug("Determined manifest type is a film manifest.")
         return result
 
+    @classmethod
+    def matches_header(cls, header: Collection[str]) -> bool:
+        """Check if a manifest header is the format of a film manifest."""
+        return "Date of Film (M/D/YYYY)" in header
+
+    def required_columns(self) -> Set[str]:
+        """Get the columns used to identify files in a row."""
+        return self.key_determine_strategy.possible_keys()
+
     @staticmethod
     @tripwire_files.remembered_file_pointer
-    def is_it_a_film_manifest(fp: TextIO) -> bool:
-        try:
-            manifest = tripwire_files.TSVManifest(fp)
-            return "Date of Film (M/D/YYYY)" in manifest[0].row_data
-        except IndexError:
-            return False
+    def is_it_a_film_manifest(fp: typing.IO) -> bool:
+        header = tripwire_files.get_manifest_table(fp).get_header()
+        return header is not None and FilmManifest.matches_header(header)
 
     def extract_files_from_manifest(
         self, row: Mapping[str, str]
@@ -134,34 +234,33 @@ class FilmManifest(AbsManifest):
 class VideoManifest(AbsManifest):
     """Video manifest."""
 
-    @staticmethod
-    @tripwire_files.remembered_file_pointer
-    def is_it_a_video_manifest(fp: TextIO) -> bool:
+    @classmethod
+    def matches_header(cls, header: Collection[str]) -> bool:
+        """Check if a manifest header is the format of a video manifest."""
         unique_keys = [
             "Cassette \nNo.",
             "Cassette No.",
         ]
-        try:
-            manifest = tripwire_files.TSVManifest(fp)
-            for key in unique_keys:
-                if key in {k.strip() for k in manifest[0].row_data}:
-                    has_cassette_no_key = key
-                    break
-            else:
-                has_cassette_no_key = None
-        except IndexError:
-            return False
-        if not has_cassette_no_key:
+        stripped_keys = {k.strip() for k in header}
+        if not any(key in stripped_keys for key in unique_keys):
             return False
-        if (
-            """Side
-(A/B)"""
-            in manifest[0].row_data
-        ):
-            return False
-        return True
+        return "Side\n(A/B)" not in header
+
+    def required_columns(self) -> Set[str]:
+        """Get the columns used to identify files in a row."""
+        return {
+            "Preservation File Name",
+            "Access File Name",
+            "Photograph File Name",
+        }
 
-    def verify_format_type(self, fp: TextIO) -> bool:
+    @staticmethod
+    @tripwire_files.remembered_file_pointer
+    def is_it_a_video_manifest(fp: typing.IO) -> bool:
+        header = tripwire_files.get_manifest_table(fp).get_header()
+        return header is not None and VideoManifest.matches_header(header)
+
+    def verify_format_type(self, fp: typing.IO) -> bool:
         result = self.is_it_a_video_manifest(fp=fp)
         if result:
             logger.debug("Determined manifest type is a video manifest.")
@@ -207,20 +306,23 @@ class AudioManifest(AbsManifest):
             }
         )
 
+    @classmethod
+    def matches_header(cls, header: Collection[str]) -> bool:
+        """Check if a manifest header is the format of an audio manifest."""
+        unique_keys = ["Cassette Title", "Track Speed (ips)"]
+        return any(key.strip() in unique_keys for key in header)
+
+    def required_columns(self) -> Set[str]:
+        """Get the columns used to identify files in a row."""
+        return self.key_determine_strategy.possible_keys()
+
     @staticmethod
     @tripwire_files.remembered_file_pointer
-    def is_it_an_audio_manifest(fp: TextIO) -> bool:
-        unique_keys = ["Cassette Title", "Track Speed (ips)"]
-        try:
-            manifest = tripwire_files.TSVManifest(fp)
-            for key in set(manifest[0].row_data):
-                if key.strip() in unique_keys:
-                    return True
-            return False
-        except IndexError:
-            return False
+    def is_it_an_audio_manifest(fp: typing.IO) -> bool:
+        header = tripwire_files.get_manifest_table(fp).get_header()
+        return header is not None and AudioManifest.matches_header(header)
 
-    def verify_format_type(self, fp: TextIO) -> bool:
+    def verify_format_type(self, fp: typing.IO) -> bool:
         result = self.is_it_an_audio_manifest(fp=fp)
         if result:
             logger.debug("Determined manifest type is an audio manifest.")
@@ -249,39 +351,93 @@ class AudioManifest(AbsManifest):
         return data
 
 
+# Extensions of the files found as manifests in a directory.
+MANIFEST_FILE_EXTENSIONS: Tuple[str, ...] = (".tsv", ".xlsx")
+
 # The order to determine the type of manifest file that a file
 # handle points to. Used by get_manifest_type()
-
-LOOK_UP_MANIFEST_CHECKS_ORDER: Sequence[Type[AbsManifest]] = [
+LOOK_UP_MANIFEST_CHECKS_ORDER: List[Type[AbsManifest]] = [
     FilmManifest,
     VideoManifest,
     AudioManifest,
 ]
 
 
-def get_manifest_type(fp: typing.TextIO) -> AbsManifest:
+def register_manifest_type(
+    klass: Type[AbsManifest],
+) -> Type[AbsManifest]:
+    """Add a manifest type to the types checked by get_manifest_type().
+
+    Can be used as a class decorator. Manifest types registered are checked
+    after the types already registered.
+
+    .. versionadded:: 0.3.8
+    """
+    if klass not in LOOK_UP_MANIFEST_CHECKS_ORDER:
+        LOOK_UP_MANIFEST_CHECKS_ORDER.append(klass)
+    return klass
+
+
+def get_manifest_type(fp: typing.IO) -> AbsManifest:
+    """Determine the type of manifest that a file handle points to.
+
+    .. versionchanged:: 0.3.8
+        The header is read once and checked against every manifest type
+        with AbsManifest.matches_header(), instead of each manifest type
+        reading the file. The file pointer can also be to an .xlsx
+        workbook, opened with tripwire_files.open_manifest().
+    """
+    header = tripwire_files.get_manifest_table(fp).get_header()
     for klass in LOOK_UP_MANIFEST_CHECKS_ORDER:
-        manifest_type = klass()
-        if manifest_type.verify_format_type(fp=fp):
-            return manifest_type
+        matched = klass.matches_header(header) if header is not None else False
+        if matched:
+            logger.debug("Determined manifest type is %s.", klass.__name__)
+            return klass()
+        if matched is None:
+            manifest_type = klass()
+            if manifest_type.verify_format_type(fp=fp):
+                return manifest_type
 
     raise ValueError("unable to determine type of manifest")
 
 
 class RecursiveFileSearch:
+    """Search a directory tree, one directory at a time.
+
+    .. versionchanged:: 0.3.8
+        Added path_filter parameter.
+    """
+
     walk = os.walk
 
-    def __init__(self, root_path: pathlib.Path) -> None:
+    def __init__(
+        self,
+        root_path: pathlib.Path,
+        path_filter: Optional[filters.PathFilter] = None,
+    ) -> None:
         self.root_path = root_path
-        self.files_generator = self._recursive_search(self.root_path)
+        self.files_generator = self._recursive_search(
+            self.root_path, path_filter
+        )
 
     @classmethod
     def _recursive_search(
-        cls, path: pathlib.Path
+        cls,
+        path: pathlib.Path,
+        path_filter: Optional[filters.PathFilter] = None,
     ) -> typing.Iterator[pathlib.Path]:
         for root, dirs, files_ in cls.walk(path):
+            if not path_filter:
+                for file in files_:
+                    yield pathlib.Path(os.path.join(root, file))
+                continue
+            relative_root = os.path.relpath(root, path)
+            path_filter.prune(relative_root, dirs)
             for file in files_:
-                yield pathlib.Path(os.path.join(root, file))
+                if path_filter.is_file_included(
+                    os.path.join(relative_root, file)
+                ):
+                    yield pathlib.Path(os.path.join(root, file))
 
     def __iter__(self) -> "RecursiveFileSearch":
         return self
@@ -290,44 +446,759 @@ class RecursiveFileSearch:
         return next(self.files_generator)
 
 
+def _list_directory(path: str) -> typing.Tuple[List[str], List[str]]:
+    files: List[str] = []
+    directories: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.path)
+                elif not entry.is_symlink():
+                    # Same as os.walk, symlinks to directories are not
+                    # followed.
+                    directories.append(entry.path)
+    except OSError:
+        # Same as os.walk, directories that cannot be listed are skipped.
+        pass
+    return files, directories
+
+
+class ConcurrentFileSearch:
+    """Search a directory tree, listing many directories at the same time.
+
+    This is faster than RecursiveFileSearch on network storage where each
+    directory listing has to wait for a round trip to the server. Files are
+    not returned in any particular order.
+
+    .. versionadded:: 0.3.8
+    """
+
+    default_max_workers = 16
+
+    def __init__(
+        self,
+        root_path: pathlib.Path,
+        max_workers: Optional[int] = None,
+        path_filter: Optional[filters.PathFilter] = None,
+    ) -> None:
+        """Create a new concurrent file search.
+
+        Args:
+            root_path: directory to search recursively.
+            max_workers: number of directories to list at the same time.
+            path_filter: files and directories to include or exclude.
+        """
+        self.root_path = root_path
+        self.max_workers = max_workers or self.default_max_workers
+        self.path_filter = path_filter or filters.PathFilter()
+        self.files_generator = self._concurrent_search(self.root_path)
+
+    def _concurrent_search(
+        self, path: pathlib.Path
+    ) -> typing.Iterator[pathlib.Path]:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+        try:
+            pending = {executor.submit(_list_directory, str(path))}
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    files, directories = future.result()
+                    for directory in directories:
+                        if self.path_filter.is_directory_excluded(
+                            os.path.relpath(directory, path)
+                        ):
+                            continue
+                        pending.add(
+                            executor.submit(_list_directory, directory)
+                        )
+                    for file in files:
+                        if self.path_filter.is_file_included(
+                            os.path.relpath(file, path)
+                        ):
+                            yield pathlib.Path(file)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __iter__(self) -> "ConcurrentFileSearch":
+        return self
+
+    def __next__(self) -> pathlib.Path:
+        return next(self.files_generator)
+
+
+class IndexedFileSearch:
+    """Search a directory tree, using an index file from previous searches.
+
+    The index is a SQLite database of every directory searched, with its
+    modification time, files and subdirectories. Adding, removing or renaming
+    a file changes the modification time of the directory it is in, so only
+    directories whose modification time has changed since the last search
+    are listed again. Everything else is read from the index, which is
+    updated as the search goes.
+
+    .. versionadded:: 0.3.8
+    """
+
+    # Directories modified this recently may still be changing within the
+    # resolution of the file system timestamps, so they are always listed
+    # again on the next search.
+    minimum_age_ns = 2_000_000_000
+
+    def __init__(
+        self,
+        root_path: pathlib.Path,
+        index_file: pathlib.Path,
+        path_filter: Optional[filters.PathFilter] = None,
+    ) -> None:
+        """Create a new indexed file search.
+
+        Args:
+            root_path: directory to search recursively.
+            index_file: index file to use. It is created if it does not
+                exist.
+            path_filter: files and directories to include or exclude. The
+                index itself is not filtered, so it can be shared by
+                searches with different filters.
+        """
+        self.root_path = root_path
+        self.index_file = index_file
+        self.path_filter = path_filter or filters.PathFilter()
+        self.directories_listed = 0
+        self.files_generator = self._indexed_search(self.root_path)
+
+    @staticmethod
+    def _create_tables(connection: sqlite3.Connection) -> None:
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS directories (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                directory TEXT NOT NULL,
+                name TEXT NOT NULL,
+                is_directory INTEGER NOT NULL,
+                PRIMARY KEY (directory, name)
+            );
+            CREATE TEMPORARY TABLE visited (path TEXT PRIMARY KEY);
+            """
+        )
+
+    def _list_directory(
+        self, connection: sqlite3.Connection, path: str
+    ) -> typing.Tuple[List[str], List[str]]:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return [], []
+        connection.execute("INSERT INTO visited VALUES (?)", (path,))
+        cached = connection.execute(
+            "SELECT mtime_ns FROM directories WHERE path = ?", (path,)
+        ).fetchone()
+        if cached is not None and cached[0] == mtime_ns:
+            files: List[str] = []
+            directories: List[str] = []
+            for name, is_directory in connection.execute(
+                "SELECT name, is_directory FROM entries WHERE directory = ?",
+                (path,),
+            ):
+                (directories if is_directory else files).append(
+                    os.path.join(path, name)
+                )
+            return files, directories
+
+        self.directories_listed += 1
+        files, directories = _list_directory(path)
+        recently_modified = time.time_ns() - mtime_ns < self.minimum_age_ns
+        connection.execute(
+            "INSERT OR REPLACE INTO directories VALUES (?, ?)",
+            (path, None if recently_modified else mtime_ns),
+        )
+        connection.execute("DELETE FROM entries WHERE directory = ?", (path,))
+        connection.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?)",
+            [(path, os.path.basename(f), False) for f in files]
+            + [(path, os.path.basename(d), True) for d in directories],
+        )
+        return files, directories
+
+    @staticmethod
+    def _remove_unvisited(connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "DELETE FROM directories "
+            "WHERE path NOT IN (SELECT path FROM visited)"
+        )
+        connection.execute(
+            "DELETE FROM entries "
+            "WHERE directory NOT IN (SELECT path FROM visited)"
+        )
+
+    def _indexed_search(
+        self, path: pathlib.Path
+    ) -> typing.Iterator[pathlib.Path]:
+        connection = sqlite3.connect(self.index_file)
+        try:
+            self._create_tables(connection)
+            pending = [str(path)]
+            while pending:
+                files, directories = self._list_directory(
+                    connection, pending.pop()
+                )
+                pending.extend(
+                    directory
+                    for directory in reversed(directories)
+                    if not self.path_filter.is_directory_excluded(
+                        os.path.relpath(directory, path)
+                    )
+                )
+                for file in files:
+                    if self.path_filter.is_file_included(
+                        os.path.relpath(file, path)
+                    ):
+                        yield pathlib.Path(file)
+            # Only after a complete search is it known which directories no
+            # longer exist. Pruned directories were not visited, so nothing
+            # is removed when the search was filtered.
+            if not self.path_filter:
+                self._remove_unvisited(connection)
+        finally:
+            connection.commit()
+            connection.close()
+
+    def __iter__(self) -> "IndexedFileSearch":
+        return self
+
+    def __next__(self) -> pathlib.Path:
+        return next(self.files_generator)
+
+
+class InventoryFileSearch:
+    """Get the files in a directory tree from an inventory file.
+
+    Instead of searching the file system, the files are read from a listing
+    made ahead of time, such as the output of find or an object store
+    inventory. See uiucprescon.tripwire.inventory for the formats supported.
+
+    .. versionadded:: 0.3.8
+    """
+
+    def __init__(
+        self,
+        root_path: pathlib.Path,
+        inventory_file: pathlib.Path,
+        path_filter: Optional[filters.PathFilter] = None,
+    ) -> None:
+        """Create a new inventory file search.
+
+        Args:
+            root_path: directory to get the files inside of.
+            inventory_file: inventory file, which can be compressed.
+            path_filter: files and directories to include or exclude.
+        """
+        self.root_path = root_path
+        self.inventory_file = inventory_file
+        self.path_filter = path_filter or filters.PathFilter()
+        self.files_generator = self._inventory_search()
+
+    def _inventory_search(self) -> typing.Iterator[pathlib.Path]:
+        for file_path in inventory.iter_inventory_paths(
+            self.inventory_file, self.root_path
+        ):
+            if self.path_filter.is_path_included(
+                file_path.relative_to(self.root_path).as_posix()
+            ):
+                yield file_path
+
+    def __iter__(self) -> "InventoryFileSearch":
+        return self
+
+    def __next__(self) -> pathlib.Path:
+        return next(self.files_generator)
+
+
+FileSearchFactory = Callable[[pathlib.Path], typing.Iterator[pathlib.Path]]
+
+# File search strategies that can be selected by name. Each also accepts a
+# path_filter keyword argument.
+FILE_SEARCH_STRATEGIES: Dict[
+    str, Callable[..., typing.Iterator[pathlib.Path]]
+] = {
+    "sequential": RecursiveFileSearch,
+    "concurrent": ConcurrentFileSearch,
+}
+
+
+class FileIndex:
+    """Index of every file found in a search path.
+
+    Files are indexed by name, so that every location of a file name can be
+    found without searching.
+
+    To keep the index small for search paths with millions of files, each
+    directory and each file name is only stored once. Files are stored as
+    the ids of their directory and name, in arrays of integers, with the
+    files sharing a name linked together. Each file can also be looked up by
+    its directory and name ids in a hash table of entry ids, with open
+    addressing, so that checking for, adding and removing a file does not
+    depend on how many directories have the same name. Expected names are a
+    bitset.
+
+    .. versionadded:: 0.3.8
+    """
+
+    # Directory id of files that have been removed.
+    _REMOVED = 0xFFFFFFFF
+
+    # Entry id used to end a list of files sharing a name.
+    _NO_ENTRY = -1
+
+    # Slots of the hash table that have never been used, and slots of files
+    # that have been removed.
+    _EMPTY_SLOT = -1
+    _REMOVED_SLOT = -2
+
+    # The hash table is grown once more than this fraction of the slots are
+    # used, and then has four times as many slots as there are files.
+    _MAX_TABLE_LOAD = 0.5
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._directory_ids: Dict[str, int] = {}
+        self._directories: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        # For each name, the number of files with it, and the first and the
+        # last of those files.
+        self._name_counts = array.array("I")
+        self._first_entries = array.array("i")
+        self._last_entries = array.array("i")
+        # For each file, its directory, its name and the previous and the
+        # next file with the same name.
+        self._entry_directories = array.array("I")
+        self._entry_names = array.array("I")
+        self._previous_entries = array.array("i")
+        self._next_entries = array.array("i")
+        # Hash table of the entry of each file, by its directory and name.
+        self._slots = array.array("i", [self._EMPTY_SLOT]) * 8
+        self._used_slots = 0
+        self._expected = bytearray()
+        self._size = 0
+
+    @classmethod
+    def build(cls, files: Iterable[pathlib.Path]) -> "FileIndex":
+        """Build an index of the files in a single pass."""
+        index = cls()
+        for file_path in files:
+            index.add(file_path)
+        return index
+
+    def _get_name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is not None:
+            return name_id
+        name_id = self._name_ids[name] = len(self._names)
+        self._names.append(name)
+        self._name_counts.append(0)
+        self._first_entries.append(self._NO_ENTRY)
+        self._last_entries.append(self._NO_ENTRY)
+        if name_id % 8 == 0:
+            self._expected.append(0)
+        return name_id
+
+    def _get_directory_id(self, directory: str) -> int:
+        directory_id = self._directory_ids.get(directory)
+        if directory_id is None:
+            directory_id = self._directory_ids[directory] = len(
+                self._directories
+            )
+            self._directories.append(directory)
+        return directory_id
+
+    def _find_slot(self, directory_id: int, name_id: int) -> int:
+        """Get the slot of a file, or the empty slot where it would go."""
+        mask = len(self._slots) - 1
+        slot = hash((directory_id, name_id)) & mask
+        while True:
+            entry = self._slots[slot]
+            if entry == self._EMPTY_SLOT or (
+                entry != self._REMOVED_SLOT
+                and self._entry_names[entry] == name_id
+                and self._entry_directories[entry] == directory_id
+            ):
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow_table(self) -> None:
+        total_slots = len(self._slots)
+        while total_slots < self._size * 4:
+            total_slots *= 2
+        self._slots = array.array("i", [self._EMPTY_SLOT]) * total_slots
+        self._used_slots = self._size
+        for entry, directory_id in enumerate(self._entry_directories):
+            if directory_id != self._REMOVED:
+                slot = self._find_slot(directory_id, self._entry_names[entry])
+                self._slots[slot] = entry
+
+    def _find_entry_slot(self, file_path: pathlib.Path) -> Optional[int]:
+        directory, name = os.path.split(file_path)
+        directory_id = self._directory_ids.get(directory)
+        name_id = self._name_ids.get(name)
+        if directory_id is None or name_id is None:
+            return None
+        slot = self._find_slot(directory_id, name_id)
+        if self._slots[slot] == self._EMPTY_SLOT:
+            return None
+        return slot
+
+    def _iter_entries(self, name_id: int) -> Iterator[int]:
+        entry = self._first_entries[name_id]
+        while entry != self._NO_ENTRY:
+            yield entry
+            entry = self._next_entries[entry]
+
+    def _is_expected(self, name_id: int) -> bool:
+        return bool(self._expected[name_id >> 3] & (1 << (name_id & 7)))
+
+    def _get_path(self, entry: int) -> pathlib.Path:
+        return pathlib.Path(
+            self._directories[self._entry_directories[entry]],
+            self._names[self._entry_names[entry]],
+        )
+
+    def add(self, file_path: pathlib.Path) -> None:
+        """Add a file to the index."""
+        directory, name = os.path.split(file_path)
+        directory_id = self._get_directory_id(directory)
+        name_id = self._get_name_id(name)
+        slot = self._find_slot(directory_id, name_id)
+        if self._slots[slot] != self._EMPTY_SLOT:
+            return
+        entry = self._slots[slot] = len(self._entry_names)
+        last_entry = self._last_entries[name_id]
+        self._entry_directories.append(directory_id)
+        self._entry_names.append(name_id)
+        self._previous_entries.append(last_entry)
+        self._next_entries.append(self._NO_ENTRY)
+        if last_entry == self._NO_ENTRY:
+            self._first_entries[name_id] = entry
+        else:
+            self._next_entries[last_entry] = entry
+        self._last_entries[name_id] = entry
+        self._name_counts[name_id] += 1
+        self._size += 1
+        self._used_slots += 1
+        if self._used_slots > len(self._slots) * self._MAX_TABLE_LOAD:
+            self._grow_table()
+
+    def remove(self, file_path: pathlib.Path) -> None:
+        """Remove a file from the index if it is in it."""
+        slot = self._find_entry_slot(file_path)
+        if slot is None:
+            return
+        entry = self._slots[slot]
+        self._slots[slot] = self._REMOVED_SLOT
+        name_id = self._entry_names[entry]
+        previous_entry = self._previous_entries[entry]
+        next_entry = self._next_entries[entry]
+        if previous_entry == self._NO_ENTRY:
+            self._first_entries[name_id] = next_entry
+        else:
+            self._next_entries[previous_entry] = next_entry
+        if next_entry == self._NO_ENTRY:
+            self._last_entries[name_id] = previous_entry
+        else:
+            self._previous_entries[next_entry] = previous_entry
+        self._entry_directories[entry] = self._REMOVED
+        self._name_counts[name_id] -= 1
+        self._size -= 1
+
+    def contains_file(self, file_path: pathlib.Path) -> bool:
+        """Check if a file is in the index."""
+        return self._find_entry_slot(file_path) is not None
+
+    def iter_files(self) -> Iterator[pathlib.Path]:
+        """Iterate over every file in the index, in the order added."""
+        for entry, directory_id in enumerate(self._entry_directories):
+            if directory_id != self._REMOVED:
+                yield self._get_path(entry)
+
+    def names(self) -> Iterator[str]:
+        """Iterate over the names of the files in the index."""
+        for name_id, count in enumerate(self._name_counts):
+            if count:
+                yield self._names[name_id]
+
+    def locate(self, file_name: str) -> List[pathlib.Path]:
+        """Get every location of a file name."""
+        name_id = self._name_ids.get(file_name)
+        if name_id is None:
+            return []
+        return [self._get_path(entry) for entry in self._iter_entries(name_id)]
+
+    def mark_expected(self, file_name: str) -> None:
+        """Mark a file name as one that is supposed to be there."""
+        name_id = self._get_name_id(file_name)
+        self._expected[name_id >> 3] |= 1 << (name_id & 7)
+
+    def unexpected_files(self) -> Iterator[pathlib.Path]:
+        """Iterate over the files with names that were never expected.
+
+        Files are sorted by path, across the whole index, so that files of a
+        directory added at different times are still listed together.
+        """
+        yield from sorted(
+            self._get_path(entry)
+            for entry, (directory_id, name_id) in enumerate(
+                zip(self._entry_directories, self._entry_names)
+            )
+            if directory_id != self._REMOVED and not self._is_expected(name_id)
+        )
+
+    def duplicate_files(
+        self, expected_only: bool = False
+    ) -> Dict[str, List[pathlib.Path]]:
+        """Get the file names that are found in more than one directory."""
+        return {
+            self._names[name_id]: self.locate(self._names[name_id])
+            for name_id, count in enumerate(self._name_counts)
+            if count > 1 and (not expected_only or self._is_expected(name_id))
+        }
+
+    def __contains__(self, file_name: object) -> bool:
+        """Check if a file name is in the index."""
+        if not isinstance(file_name, str):
+            return False
+        name_id = self._name_ids.get(file_name)
+        return name_id is not None and self._name_counts[name_id] > 0
+
+    def __len__(self) -> int:
+        """Get the number of files in the index."""
+        return self._size
+
+
+class NameSuggestionIndex:
+    """Index of file names, used to find the names closest to a file name.
+
+    Names are compared after Unicode normalization and case folding, so
+    names that only differ by those are matched first. Otherwise, candidates
+    are found through an index of the n-grams of each name, starting with
+    the rarest n-grams of the name looked up, and ranked by how similar they
+    are after the prefix they share. The names are never scanned one by
+    one.
+
+    Names with the same stem but a different extension, and names that are
+    the other name with an extension added, such as its .md5 checksum file,
+    are other files of the same item and are never suggested.
+
+    .. versionadded:: 0.3.8
+    """
+
+    ngram_size = 3
+
+    # Number of candidates sharing the most n-grams with the name looked up
+    # that are compared to it.
+    candidates_to_compare = 20
+
+    # N-grams shared by more names than this are too common to narrow down
+    # the candidates, unless there is nothing else.
+    max_ngram_frequency = 50_000
+
+    # A typo changes a name in a single place, by at most this many
+    # characters.
+    max_typo_length = 3
+
+    # Similarity of the parts of two names after their common prefix.
+    minimum_similarity = 0.8
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Create a new index of file names."""
+        self.names: List[str] = []
+        self.normalized_names: List[str] = []
+        self.by_normalized_name: Dict[str, List[int]] = {}
+        self.ngrams: Dict[str, array.array] = {}
+        for name in names:
+            self.add(name)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize a name for comparison."""
+        return unicodedata.normalize("NFC", name).casefold()
+
+    @classmethod
+    def similarity(cls, normalized_name: str, other: str) -> float:
+        """Get how similar two names are, or 0.0 if they are not similar.
+
+        Names in a package usually share a long identifier, which would make
+        any two of them look alike. Only names that differ in a single place,
+        by a few characters, are similar, and only the parts of them after
+        the prefix they share are compared.
+        """
+        prefix = len(os.path.commonprefix([normalized_name, other]))
+        name_rest = normalized_name[prefix:]
+        other_rest = other[prefix:]
+        suffix = len(os.path.commonprefix([name_rest[::-1], other_rest[::-1]]))
+        if max(len(name_rest), len(other_rest)) - suffix > cls.max_typo_length:
+            return 0.0
+        return difflib.SequenceMatcher(None, name_rest, other_rest).ratio()
+
+    @staticmethod
+    def is_related_name(normalized_name: str, other: str) -> bool:
+        """Check if two names are of different files of the same item."""
+        if normalized_name == other:
+            return False
+        return (
+            os.path.splitext(normalized_name)[0] == os.path.splitext(other)[0]
+            or other.startswith(f"{normalized_name}.")
+            or normalized_name.startswith(f"{other}.")
+        )
+
+    def _get_ngrams(self, normalized_name: str) -> Set[str]:
+        padded = f" {normalized_name} "
+        return {
+            padded[i : i + self.ngram_size]
+            for i in range(len(padded) - self.ngram_size + 1)
+        }
+
+    def add(self, name: str) -> None:
+        """Add a file name to the index."""
+        name_id = len(self.names)
+        normalized_name = self.normalize(name)
+        self.names.append(name)
+        self.normalized_names.append(normalized_name)
+        self.by_normalized_name.setdefault(normalized_name, []).append(name_id)
+        for ngram in self._get_ngrams(normalized_name):
+            postings = self.ngrams.get(ngram)
+            if postings is None:
+                postings = self.ngrams[ngram] = array.array("I")
+            postings.append(name_id)
+
+    def _get_similar_names(self, normalized_name: str) -> Dict[int, float]:
+        ngrams = sorted(
+            (
+                ngram
+                for ngram in self._get_ngrams(normalized_name)
+                if ngram in self.ngrams
+            ),
+            key=lambda ngram: len(self.ngrams[ngram]),
+        )
+        # A typo only changes a few n-grams, so the rarest half of them is
+        # enough to find the candidates.
+        selected = [
+            ngram
+            for ngram in ngrams[: max(len(ngrams) // 2, 1)]
+            if len(self.ngrams[ngram]) <= self.max_ngram_frequency
+        ] or ngrams[:1]
+        shared_ngrams: typing.Counter[int] = collections.Counter()
+        for ngram in selected:
+            shared_ngrams.update(self.ngrams[ngram])
+        similar_names: Dict[int, float] = {}
+        for name_id, _ in shared_ngrams.most_common(
+            self.candidates_to_compare
+        ):
+            other = self.normalized_names[name_id]
+            if self.is_related_name(normalized_name, other):
+                continue
+            similarity = self.similarity(normalized_name, other)
+            if similarity >= self.minimum_similarity:
+                similar_names[name_id] = similarity
+        return similar_names
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """Get the names in the index closest to a name.
+
+        Args:
+            name: file name to find similar names for.
+            limit: maximum number of names to return.
+
+        Returns:
+            Similar names, closest first.
+        """
+        normalized_name = self.normalize(name)
+        scores: Dict[int, float] = {}
+        for name_id in self.by_normalized_name.get(normalized_name, []):
+            scores[name_id] = 2.0
+        if len(scores) < limit:
+            for name_id, similarity in self._get_similar_names(
+                normalized_name
+            ).items():
+                scores.setdefault(name_id, similarity)
+        ranked = sorted(
+            (name_id for name_id in scores if self.names[name_id] != name),
+            key=lambda name_id: (-scores[name_id], self.names[name_id]),
+        )
+        return [self.names[name_id] for name_id in ranked[:limit]]
+
+
 class PackageScanner:
-    scanner_klass = RecursiveFileSearch
+    """Locate files inside a search path.
+
+    .. versionchanged:: 0.3.8
+        The search path is fully indexed on first use, replacing the cache
+        that only contained the files scanned so far.
+    """
 
-    class Cache(typing.TypedDict):
-        file_name: str
-        location: pathlib.Path
-        expected: bool
+    scanner_klass: FileSearchFactory = RecursiveFileSearch
 
-    def __init__(self, search_path: pathlib.Path):
+    def __init__(
+        self,
+        search_path: pathlib.Path,
+        scanner_klass: Optional[FileSearchFactory] = None,
+    ):
         self.search_path = search_path
-        self.cache: typing.Dict[str, PackageScanner.Cache] = {}
-        self._scanner = PackageScanner.scanner_klass(self.search_path)
+        self._index: Optional[FileIndex] = None
+        self._suggestion_index: Optional[NameSuggestionIndex] = None
+        self._scanner = (scanner_klass or PackageScanner.scanner_klass)(
+            self.search_path
+        )
+
+    @property
+    def index(self) -> FileIndex:
+        """Index of every file in the search path, built on first use."""
+        if self._index is None:
+            self._index = FileIndex.build(self._scanner)
+        return self._index
 
     def locate(self, file_name: str) -> typing.Optional[pathlib.Path]:
-        if file_name in self.cache:
-            self.cache[file_name]["expected"] = True
-            return self.cache[file_name]["location"] / file_name
+        locations = self.index.locate(file_name)
+        if not locations:
+            return None
+        self.index.mark_expected(file_name)
+        return locations[0]
 
-        while True:
-            try:
-                entry = next(self._scanner)
-                entry_file_name = entry.name
-                self.cache[entry_file_name] = {
-                    "file_name": entry_file_name,
-                    "location": entry.parent,
-                    "expected": entry_file_name == file_name,
-                }
-                if entry_file_name == file_name:
-                    return entry
-            except StopIteration:
-                return None
-
-    def unexpected_files(self) -> Set[pathlib.Path]:
-        unexpected_files = set()
-        for k, v in self.cache.items():
-            if not v["expected"]:
-                unexpected_files.add(v["location"] / v["file_name"])
-        return unexpected_files
+    def unexpected_files(self) -> Iterator[pathlib.Path]:
+        """Iterate over the files in the search path never located.
+
+        .. versionchanged:: 0.3.8
+            Files are streamed from the index instead of returned as a set.
+        """
+        return self.index.unexpected_files()
+
+    def duplicate_files(self) -> Dict[str, List[pathlib.Path]]:
+        """Get the located file names found in more than one directory."""
+        return self.index.duplicate_files(expected_only=True)
+
+    def suggest(self, file_name: str, limit: int = 3) -> List[pathlib.Path]:
+        """Get the files with the names closest to a file name.
+
+        The index of names used is built the first time this is called.
+
+        .. versionadded:: 0.3.8
+        """
+        if self._suggestion_index is None:
+            self._suggestion_index = NameSuggestionIndex(self.index.names())
+        suggestions: List[pathlib.Path] = []
+        for name in self._suggestion_index.suggest(file_name, limit=limit):
+            suggestions += self.index.locate(name)
+        return suggestions[:limit]
 
 
 def locate_missing_files(
@@ -341,64 +1212,768 @@ def locate_missing_files(
     return typing.cast(SearchPackage, results)
 
 
-def locate_manifest_files_fp(
-    manifest_tsv_fp: typing.TextIO,
-    search_path: pathlib.Path,
+def iter_missing_manifest_files(
+    rows: Iterable[tripwire_files.TableRow],
+    scanner: PackageScanner,
     manifest_type: AbsManifest,
-) -> Set[pathlib.Path]:
-    prog_bar_format = (
-        "{desc}{percentage:3.0f}% |{bar}| Time Remaining: {remaining}"
-    )
-    manifest = tripwire_files.TSVManifest(manifest_tsv_fp)
-    if not manifest.is_valid_file():
-        raise InvalidFileFormat(details="Not a valid TSV manifest file.")
+) -> Iterator[ManifestCheckResult]:
+    """Locate the files listed by each manifest row, one row at a time.
 
-    scanner = PackageScanner(search_path)
-    for row in (
-        prog_bar := tqdm(manifest, bar_format=prog_bar_format, leave=False)
-    ):
+    .. versionadded:: 0.3.8
+
+    Args:
+        rows: rows of the manifest.
+        scanner: scanner used to locate files.
+        manifest_type: manifest type used to identify files in a row.
+
+    Yields:
+        A result for each file listed in the manifest that could not be found.
+    """
+    for row in rows:
         if items_check := manifest_type.extract_files_from_manifest(
             row.row_data
         ):
             if missing_files := locate_missing_files(items_check, scanner):
                 for k, v in missing_files.items():
-                    prog_bar.write(
-                        f"Line: {row.line_number}. Unable to locate: {v}"
+                    yield ManifestCheckResult(
+                        status=ManifestCheckStatus.MISSING,
+                        file=typing.cast(str, v),
+                        line_number=row.line_number,
+                        package_key=k,
                     )
 
+
+# Keys of a SearchPackage for a file and for the checksum file of it.
+CHECKSUM_PACKAGE_KEYS: List[Tuple[str, str]] = [
+    ("preservation_file", "preservation_file_checksum"),
+    ("access_file", "access_file_checksum"),
+    ("photo_file", "photo_file_checksum"),
+]
+
+
+def locate_checksum_pairs(
+    package: SearchPackage, scanner: PackageScanner
+) -> List[Tuple[pathlib.Path, pathlib.Path]]:
+    """Locate the files of a package with their checksum files.
+
+    Every location of a file is paired with the checksum file in the same
+    directory, so that a file is never checked against the checksum file of
+    another file with the same name in a different directory. If no location
+    of the file has its checksum file next to it, the first locations of
+    both are paired anyway, so that verify_checksum_pair() reports them
+    instead of them being skipped.
+
+    .. versionadded:: 0.3.8
+
+    Returns: checksum file and file pairs.
+    """
+    package_files = typing.cast(Mapping[str, str], package)
+    pairs = []
+    for file_key, checksum_key in CHECKSUM_PACKAGE_KEYS:
+        if file_key not in package_files or checksum_key not in package_files:
+            continue
+        file_name = package_files[file_key]
+        checksum_name = package_files[checksum_key]
+        file_path = scanner.locate(file_name)
+        checksum_file = scanner.locate(checksum_name)
+        if file_path is None or checksum_file is None:
+            continue
+        located_pairs = [
+            (location.with_name(checksum_name), location)
+            for location in scanner.index.locate(file_name)
+            if scanner.index.contains_file(location.with_name(checksum_name))
+        ]
+        pairs += located_pairs or [(checksum_file, file_path)]
+    return pairs
+
+
+def verify_checksum_pair(
+    checksum_file: pathlib.Path,
+    file_path: pathlib.Path,
+    read_checksums_strategy: Callable[
+        [pathlib.Path], str
+    ] = validation.read_checksum_file,
+    get_file_hash_strategy: Callable[[pathlib.Path], str] = functools.partial(
+        validation.get_file_hash_with_progress_reporting,
+        hashing_algorithm=hashlib.md5,
+    ),
+) -> validation.ChecksumValidationResult:
+    """Verify a file against the hash value in its checksum file.
+
+    If the checksum file is not in the same directory as the file, cannot be
+    read, or does not have a hash value, or the file cannot be read, the
+    result is FAILED with the reason as its issue.
+
+    .. versionadded:: 0.3.8
+    """
+    start_time = time.perf_counter()
+
+    def failed(issue: str) -> validation.ChecksumValidationResult:
+        return validation.ChecksumValidationResult(
+            checksum_file=checksum_file,
+            file=file_path,
+            status=validation.ChecksumStatus.FAILED,
+            expected_digest="",
+            issues=(issue,),
+            elapsed=time.perf_counter() - start_time,
+        )
+
+    if checksum_file.parent != file_path.parent:
+        return failed(
+            f"Checksum file is not next to the file. It is in "
+            f"{checksum_file.parent}"
+        )
+    try:
+        expected_hash_value = read_checksums_strategy(checksum_file).strip()
+    except (OSError, ValueError) as e:
+        return failed(f"Unable to read checksum file: {e}")
+    if not expected_hash_value or any(
+        character not in string.hexdigits for character in expected_hash_value
+    ):
+        return failed("Checksum file does not contain a hash value")
+    try:
+        hash_value = get_file_hash_strategy(file_path)
+    except OSError as e:
+        return failed(f"Unable to read file: {e}")
+    matched = expected_hash_value.lower() == hash_value.lower()
+    return validation.ChecksumValidationResult(
+        checksum_file=checksum_file,
+        file=file_path,
+        status=(
+            validation.ChecksumStatus.MATCHED
+            if matched
+            else validation.ChecksumStatus.FAILED
+        ),
+        expected_digest=expected_hash_value,
+        issues=(
+            ()
+            if matched
+            else (
+                f"Hash mismatch. Expected: {expected_hash_value}. "
+                f"Actual: {hash_value}",
+            )
+        ),
+        elapsed=time.perf_counter() - start_time,
+    )
+
+
+def iter_manifest_line_results(
+    rows: Iterable[tripwire_files.TableRow],
+    scanner: PackageScanner,
+    manifest_type: AbsManifest,
+    jobs: int = 1,
+    verify_checksum_strategy: Callable[
+        [pathlib.Path, pathlib.Path], validation.ChecksumValidationResult
+    ] = verify_checksum_pair,
+) -> Iterator[ManifestLineResult]:
+    """Locate the files of each manifest row and verify their checksums.
+
+    Files are located one row at a time. The checksums of the located files
+    are verified by a pool of worker threads, while rows further down the
+    manifest are being located.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        rows: rows of the manifest.
+        scanner: scanner used to locate files.
+        manifest_type: manifest type used to identify files in a row.
+        jobs: number of files to verify at the same time.
+        verify_checksum_strategy: strategy to verify a file against its
+            checksum file.
+
+    Yields:
+        A result for each manifest row listing files, in the order of the
+        manifest.
+    """
+
+    def located_rows() -> Iterator[
+        Tuple[int, SearchPackage, List[Tuple[pathlib.Path, pathlib.Path]]]
+    ]:
+        for row in rows:
+            if items_check := manifest_type.extract_files_from_manifest(
+                row.row_data
+            ):
+                yield (
+                    row.line_number,
+                    locate_missing_files(items_check, scanner),
+                    locate_checksum_pairs(items_check, scanner),
+                )
+
+    def verify_row(
+        located_row: Tuple[
+            int, SearchPackage, List[Tuple[pathlib.Path, pathlib.Path]]
+        ],
+    ) -> ManifestLineResult:
+        line_number, missing_files, pairs = located_row
+        return ManifestLineResult(
+            line_number=line_number,
+            missing=tuple(
+                ManifestCheckResult(
+                    status=ManifestCheckStatus.MISSING,
+                    file=typing.cast(str, v),
+                    line_number=line_number,
+                    package_key=k,
+                )
+                for k, v in missing_files.items()
+            ),
+            checksums=tuple(
+                verify_checksum_strategy(checksum_file, file_path)
+                for checksum_file, file_path in pairs
+            ),
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from utils.iter_executor_results(
+            executor,
+            verify_row,
+            located_rows(),
+            max_pending=jobs * 2,
+            ordered=True,
+        )
+
+
+def iter_unexpected_files(
+    scanner: PackageScanner,
+) -> Iterator[ManifestCheckResult]:
+    """Yield files found by the scanner that were never located.
+
+    .. versionadded:: 0.3.8
+    """
+    for file_path in scanner.unexpected_files():
+        yield ManifestCheckResult(
+            status=ManifestCheckStatus.UNEXPECTED,
+            file=file_path.name,
+            location=file_path,
+        )
+
+
+def iter_duplicate_files(
+    scanner: PackageScanner,
+) -> Iterator[ManifestCheckResult]:
+    """Yield every location of located files found in many directories.
+
+    .. versionadded:: 0.3.8
+    """
+    for file_name, locations in scanner.duplicate_files().items():
+        for location in locations:
+            yield ManifestCheckResult(
+                status=ManifestCheckStatus.DUPLICATE,
+                file=file_name,
+                location=location,
+            )
+
+
+def iter_manifest_check_results(
+    manifest_tsv_fp: typing.IO,
+    search_path: pathlib.Path,
+    manifest_type: AbsManifest,
+    scanner: Optional[PackageScanner] = None,
+) -> Iterator[ManifestCheckResult]:
+    """Check the manifest against the search path, one result at a time.
+
+    Missing files are yielded as the manifest is read. Files listed in the
+    manifest found in more than one location, and unexpected files, are
+    yielded once the whole manifest has been checked.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        manifest_tsv_fp: file pointer to a tsv manifest, or to an .xlsx
+            manifest opened with tripwire_files.open_manifest().
+        search_path: Path to search recursively.
+        manifest_type: manifest type used to identify files in a row.
+        scanner: scanner used to locate files. Defaults to a new
+            PackageScanner for the search path.
+
+    Yields:
+        Missing files followed by duplicate and unexpected files.
+    """
+    rows = tripwire_files.get_manifest_table(manifest_tsv_fp).iter_rows(
+        columns=manifest_type.required_columns()
+    )
+    scanner = scanner or PackageScanner(search_path)
+    yield from iter_missing_manifest_files(rows, scanner, manifest_type)
+    yield from iter_duplicate_files(scanner)
+    yield from iter_unexpected_files(scanner)
+
+
+def iter_manifest_entries(
+    manifests: Iterable[pathlib.Path],
+) -> Iterator[ManifestCheckResult]:
+    """Get every file listed in the manifests, as if it was missing.
+
+    .. versionadded:: 0.3.8
+    """
+    for manifest in manifests:
+        try:
+            with tripwire_files.open_manifest(manifest) as fp:
+                manifest_type = get_manifest_type(fp)
+                rows = tripwire_files.get_manifest_table(fp).iter_rows(
+                    columns=manifest_type.required_columns()
+                )
+                for row in rows:
+                    package = manifest_type.extract_files_from_manifest(
+                        row.row_data
+                    )
+                    for key, file_name in (package or {}).items():
+                        yield ManifestCheckResult(
+                            status=ManifestCheckStatus.MISSING,
+                            file=typing.cast(str, file_name),
+                            line_number=row.line_number,
+                            package_key=key,
+                            manifest=manifest,
+                        )
+        except InvalidFileFormat as e:
+            raise InvalidFileFormat(
+                file=manifest.name, details=e.details
+            ) from e
+
+
+def iter_streaming_check_results(
+    entries: Iterable[ManifestCheckResult],
+    search_path: pathlib.Path,
+    file_search_strategy: Optional[FileSearchFactory] = None,
+) -> Iterator[ManifestCheckResult]:
+    """Check manifests against a search path without indexing it.
+
+    Only the names of the files listed in the manifests are kept in memory,
+    in an exact set, so memory use depends on the size of the manifests
+    instead of the number of files in the search path. The search path is
+    searched once, and each file that is not listed is yielded as soon as
+    it is found.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        entries: files listed in the manifests, such as the results of
+            iter_manifest_entries().
+        search_path: Path to search recursively.
+        file_search_strategy: strategy used to walk the search path, such as
+            a value of FILE_SEARCH_STRATEGIES. Defaults to
+            PackageScanner.scanner_klass.
+
+    Yields:
+        Unexpected files while searching, followed by files listed in the
+        manifests found in more than one location, and missing files.
+    """
+    expected: Dict[str, List[ManifestCheckResult]] = {}
+    for entry in entries:
+        expected.setdefault(entry.file, []).append(entry)
+    locations: Dict[str, List[pathlib.Path]] = {}
+    search = (file_search_strategy or PackageScanner.scanner_klass)(
+        search_path
+    )
+    for file_path in search:
+        if file_path.name in expected:
+            locations.setdefault(file_path.name, []).append(file_path)
+            continue
+        yield ManifestCheckResult(
+            status=ManifestCheckStatus.UNEXPECTED,
+            file=file_path.name,
+            location=file_path,
+        )
+    for file_name, file_locations in locations.items():
+        if len(file_locations) > 1:
+            for location in file_locations:
+                yield ManifestCheckResult(
+                    status=ManifestCheckStatus.DUPLICATE,
+                    file=file_name,
+                    location=location,
+                )
+    for file_name, file_entries in expected.items():
+        if file_name not in locations:
+            yield from file_entries
+
+
+def get_remaining_size(fp: typing.IO) -> Optional[int]:
+    """Get the number of bytes left to read in a file if it can be known.
+
+    .. versionadded:: 0.3.8
+
+    Returns:
+        None for file pointers that are not regular files, such as pipes.
+    """
+    try:
+        file_stat = os.fstat(fp.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return max(file_stat.st_size - fp.tell(), 0)
+    except (OSError, ValueError):
+        return None
+
+
+def format_missing_file(
+    result: ManifestCheckResult,
+    scanner: PackageScanner,
+    search_path: pathlib.Path,
+    suggest: bool = False,
+) -> str:
+    """Create the message shown for a file that could not be located.
+
+    .. versionadded:: 0.3.8
+    """
+    message = f"Line: {result.line_number}. Unable to locate: {result.file}"
+    if not suggest:
+        return message
+    if suggestions := scanner.suggest(result.file):
+        similar_files = ", ".join(
+            str(suggestion.relative_to(search_path))
+            for suggestion in suggestions
+        )
+        message = f"{message}. Similar files found: {similar_files}"
+    return message
+
+
+def locate_manifest_files_fp(
+    manifest_tsv_fp: typing.IO,
+    search_path: pathlib.Path,
+    manifest_type: AbsManifest,
+    scanner: Optional[PackageScanner] = None,
+    verify_checksums: bool = False,
+    jobs: int = 1,
+    suggest: bool = False,
+) -> Iterable[pathlib.Path]:
+    """Show the files of a manifest that could not be located.
+
+    The manifest is read in a single pass, validating it as it is read.
+    Issues found in the records of the manifest are shown as they are
+    found, and an error stops the check. Progress is estimated from how
+    much of the file has been read.
+
+    .. versionchanged:: 0.3.8
+        Added verify_checksums, jobs and suggest parameters. The manifest is
+        no longer read in full to count the rows before it is checked.
+        The files not located are streamed from the index of the search
+        path instead of returned as a set.
+
+    Args:
+        manifest_tsv_fp: file pointer to a tsv manifest, or to an .xlsx
+            manifest opened with tripwire_files.open_manifest().
+        search_path: Path to search recursively.
+        manifest_type: manifest type used to identify files in a row.
+        scanner: scanner used to locate files. Defaults to a new
+            PackageScanner for the search path.
+        verify_checksums: also verify located files against their located
+            checksum files, reported together with the missing files of
+            each line.
+        jobs: number of files to verify at the same time.
+        suggest: show the files with the closest names to each file that
+            could not be located.
+
+    Returns: files found in the search path that have not been located.
+    """
+    total_size = get_remaining_size(manifest_tsv_fp)
+    prog_bar = tqdm(
+        total=total_size,
+        bar_format=(
+            "{desc}{percentage:3.0f}% |{bar}| Time Remaining: {remaining}"
+            if total_size is not None
+            else "{desc}{n_fmt} read"
+        ),
+        unit="B",
+        unit_scale=True,
+        leave=False,
+    )
+
+    def report_progress(amount_read: int) -> None:
+        # Characters are counted as bytes, so the estimate can overshoot on
+        # files with multibyte characters.
+        if total_size is None or prog_bar.n + amount_read <= total_size:
+            prog_bar.update(amount_read)
+
+    rows = tripwire_files.get_manifest_table(manifest_tsv_fp).iter_rows(
+        progress_reporter=report_progress,
+        columns=manifest_type.required_columns(),
+        finding_reporter=lambda finding: prog_bar.write(finding.format()),
+    )
+    scanner = scanner or PackageScanner(search_path)
+    if not verify_checksums:
+        for result in iter_missing_manifest_files(
+            rows, scanner, manifest_type
+        ):
+            prog_bar.write(
+                format_missing_file(result, scanner, search_path, suggest)
+            )
+        prog_bar.close()
+        return scanner.unexpected_files()
+
+    total_checked = 0
+    errors: List[str] = []
+    for line_result in iter_manifest_line_results(
+        rows, scanner, manifest_type, jobs=jobs
+    ):
+        for missing in line_result.missing:
+            prog_bar.write(
+                format_missing_file(missing, scanner, search_path, suggest)
+            )
+        for checksum_result in line_result.checksums:
+            total_checked += 1
+            if checksum_result.status is validation.ChecksumStatus.FAILED:
+                message = (
+                    f"{checksum_result.file.relative_to(search_path)} - "
+                    f"Failed: {', '.join(checksum_result.issues)}"
+                )
+                prog_bar.write(f"Line: {line_result.line_number}. {message}")
+                errors.append(message)
+    prog_bar.close()
+    logger.info(
+        validation.create_checksum_validation_report(
+            total=total_checked, errors=errors
+        )
+    )
     return scanner.unexpected_files()
 
 
+def report_duplicate_files(
+    duplicate_files: Mapping[str, List[pathlib.Path]],
+    search_path: pathlib.Path,
+) -> None:
+    """Log the files listed in a manifest found in more than one location."""
+    if not duplicate_files:
+        return
+    list_of_duplicate_files = [
+        "\n".join(
+            [f"* {file_name}"]
+            + [
+                f"    - {location.relative_to(search_path)}"
+                for location in sorted(locations)
+            ]
+        )
+        for file_name, locations in sorted(duplicate_files.items())
+    ]
+    print()
+    logger.info(
+        "Files in manifest found in more than one location: \n%s",
+        "\n".join(list_of_duplicate_files),
+    )
+
+
+def report_unexpected_files(
+    unexpected_files: Iterable[pathlib.Path],
+    search_path: pathlib.Path,
+    message: str = "Files found that were not included in manifest",
+) -> None:
+    """Log the files found that are not listed in a manifest.
+
+    .. versionchanged:: 0.3.8
+        Files are logged as they are iterated over instead of being sorted
+        in memory first.
+    """
+    found_some = False
+    for file_path in unexpected_files:
+        if not found_some:
+            print()
+            logger.info("%s: ", message)
+            found_some = True
+        logger.info("* %s", file_path.relative_to(search_path))
+
+
 def locate_manifest_files(
-    manifest_tsv: pathlib.Path, search_path: pathlib.Path
+    manifest_tsv: pathlib.Path,
+    search_path: pathlib.Path,
+    file_search_strategy: Optional[FileSearchFactory] = None,
 ) -> None:
     """Locate files listed in manifest in the search path.
 
+    .. versionchanged:: 0.3.8
+        Added file_search_strategy parameter.
+
     Args:
         manifest_tsv: manifest tsv file.
         search_path: Path to search recursively.
+        file_search_strategy: strategy used to walk the search path, such as
+            a value of FILE_SEARCH_STRATEGIES. Defaults to
+            PackageScanner.scanner_klass.
+    """
+    locate_files_in_manifests(
+        [manifest_tsv], search_path, file_search_strategy=file_search_strategy
+    )
+
+
+def locate_files_in_manifests_streaming(
+    manifests: Sequence[pathlib.Path],
+    search_path: pathlib.Path,
+    file_search_strategy: Optional[FileSearchFactory] = None,
+) -> None:
+    """Locate files listed in manifests without indexing the search path.
+
+    Files not listed in any of the manifests are reported while the search
+    path is searched, followed by the missing files of each manifest and
+    the files found in more than one location.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        manifests: manifest tsv files.
+        search_path: Path to search recursively.
+        file_search_strategy: strategy used to walk the search path, such as
+            a value of FILE_SEARCH_STRATEGIES. Defaults to
+            PackageScanner.scanner_klass.
+    """
+    found_unexpected = False
+    missing: List[ManifestCheckResult] = []
+    duplicate_files: Dict[str, List[pathlib.Path]] = {}
+    for result in iter_streaming_check_results(
+        iter_manifest_entries(manifests), search_path, file_search_strategy
+    ):
+        if result.status is ManifestCheckStatus.MISSING:
+            missing.append(result)
+            continue
+        if result.location is None:
+            continue
+        if result.status is ManifestCheckStatus.DUPLICATE:
+            duplicate_files.setdefault(result.file, []).append(result.location)
+            continue
+        if not found_unexpected:
+            print()
+            logger.info(
+                "%s: ",
+                "Files found that were not included in any manifest"
+                if len(manifests) > 1
+                else "Files found that were not included in manifest",
+            )
+            found_unexpected = True
+        logger.info("* %s", result.location.relative_to(search_path))
+    for manifest in manifests:
+        manifest_missing = sorted(
+            (result for result in missing if result.manifest == manifest),
+            key=lambda result: result.line_number or 0,
+        )
+        if manifest_missing and len(manifests) > 1:
+            logger.info("Checking %s", manifest.name)
+        for result in manifest_missing:
+            logger.info(
+                "Line: %s. Unable to locate: %s",
+                result.line_number,
+                result.file,
+            )
+    report_duplicate_files(duplicate_files, search_path)
+
+
+def is_manifest_file_name(file_name: str) -> bool:
+    """Check if a file name could be a manifest, by its extension.
+
+    Lock files that Excel creates next to an open workbook, starting with
+    "~$", are not manifests.
+
+    .. versionadded:: 0.3.8
+    """
+    return not file_name.startswith("~$") and file_name.lower().endswith(
+        MANIFEST_FILE_EXTENSIONS
+    )
+
+
+def is_manifest_file(path: pathlib.Path) -> bool:
+    """Check if a .tsv or .xlsx file is a manifest of a known type.
+
+    .. versionadded:: 0.3.8
+    """
+    try:
+        with tripwire_files.open_manifest(path) as fp:
+            get_manifest_type(fp)
+    except (InvalidFileFormat, ValueError, OSError):
+        return False
+    return True
+
+
+def find_manifest_files(
+    paths: Iterable[pathlib.Path],
+    is_manifest_strategy: Callable[[pathlib.Path], bool] = is_manifest_file,
+) -> List[pathlib.Path]:
+    """Get the manifest files from files and directories of manifests.
+
+    Directories are searched for .tsv and .xlsx manifests. Files in them that
+    are not a manifest of a known type are skipped with a warning. Files
+    given directly are always returned, so that problems with them are
+    reported when they are checked.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        paths: manifest files and directories of manifest files.
+        is_manifest_strategy: strategy to check if a .tsv or .xlsx file in a
+            directory is a manifest.
+    """
+    manifests: List[pathlib.Path] = []
+    for path in paths:
+        if not path.is_dir():
+            manifests.append(path)
+            continue
+        for child in sorted(path.iterdir()):
+            if not child.is_file() or not is_manifest_file_name(child.name):
+                continue
+            if not is_manifest_strategy(child):
+                logger.warning("Skipping %s. It is not a manifest.", child)
+                continue
+            manifests.append(child)
+    return manifests
+
+
+def locate_files_in_manifests(
+    manifests: Sequence[pathlib.Path],
+    search_path: pathlib.Path,
+    file_search_strategy: Optional[FileSearchFactory] = None,
+    verify_checksums: bool = False,
+    jobs: int = 1,
+    suggest: bool = False,
+) -> None:
+    """Locate files listed in many manifests with a single search.
+
+    The search path is only searched once and shared by every manifest.
+    Missing files are reported for each manifest, then files found in more
+    than one location and files not listed in any of the manifests are
+    reported for all of them.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        manifests: manifest tsv files.
+        search_path: Path to search recursively.
+        file_search_strategy: strategy used to walk the search path, such as
+            a value of FILE_SEARCH_STRATEGIES. Defaults to
+            PackageScanner.scanner_klass.
+        verify_checksums: also verify located files against their located
+            checksum files.
+        jobs: number of files to verify at the same time.
+        suggest: show the files with the closest names to each file that
+            could not be located.
     """
     logger.debug(
         "manifest_check_command using %s and searching at %s",
-        manifest_tsv,
+        ", ".join(str(manifest_tsv) for manifest_tsv in manifests),
         search_path,
     )
-    try:
-        with manifest_tsv.open("r", newline="", encoding="utf-8") as fp:
-            manifest_type = get_manifest_type(fp=fp)
-            unexpected_files = locate_manifest_files_fp(
-                fp, search_path, manifest_type=manifest_type
-            )
-    except InvalidFileFormat as e:
-        raise InvalidFileFormat(
-            file=manifest_tsv.name, details=e.details
-        ) from e
-    if unexpected_files:
-        list_of_unexpected_files = [
-            f"* {f.relative_to(search_path)}" for f in sorted(unexpected_files)
-        ]
-        print()
-        logger.info(
-            "Files found that were not included in manifest: \n%s",
-            "\n".join(list_of_unexpected_files),
-        )
+    scanner = PackageScanner(search_path, scanner_klass=file_search_strategy)
+    unexpected_files: Iterable[pathlib.Path] = ()
+    for manifest_tsv in manifests:
+        if len(manifests) > 1:
+            logger.info("Checking %s", manifest_tsv.name)
+        try:
+            with tripwire_files.open_manifest(manifest_tsv) as fp:
+                manifest_type = get_manifest_type(fp=fp)
+                # Files are only unexpected if no manifest lists them, so
+                # only the files left after the last manifest are reported.
+                unexpected_files = locate_manifest_files_fp(
+                    fp,
+                    search_path,
+                    manifest_type=manifest_type,
+                    scanner=scanner,
+                    verify_checksums=verify_checksums,
+                    jobs=jobs,
+                    suggest=suggest,
+                )
+        except InvalidFileFormat as e:
+            raise InvalidFileFormat(
+                file=manifest_tsv.name, details=e.details
+            ) from e
+    report_duplicate_files(scanner.duplicate_files(), search_path)
+    report_unexpected_files(
+        unexpected_files,
+        search_path,
+        message=(
+            "Files found that were not included in any manifest"
+            if len(manifests) > 1
+            else "Files found that were not included in manifest"
+        ),
+    )
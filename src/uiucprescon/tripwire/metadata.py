@@ -6,6 +6,7 @@ Added in version 0.3.3
 from __future__ import annotations
 
 import abc
+import concurrent.futures
 import itertools
 from collections import defaultdict
 import json
@@ -21,7 +22,9 @@ from typing import (
     Union,
     Callable,
     Iterable,
+    Iterator,
     Optional,
+    Tuple,
     List,
     Set,
     TypedDict,
@@ -31,6 +34,8 @@ import pathlib
 import pymediainfo
 
 from uiucprescon.pymediaconch import mediaconch
+from uiucprescon.tripwire import utils
+from uiucprescon.tripwire.filters import PathFilter
 
 __all__ = ["show_metadata"]
 
@@ -113,11 +118,43 @@ LOCATE_FILE_DEFAULT_FILTERS: List[Callable[[str], bool]] = [
 ]
 
 
+def get_glob_root(glob_expression: str) -> str:
+    """Get the directory part of a glob expression before any wildcards.
+
+    .. versionadded:: 0.3.8
+    """
+    root_parts = []
+    for part in pathlib.PurePath(glob_expression).parts:
+        if glob_module.has_magic(part):
+            break
+        root_parts.append(part)
+    return os.path.join(*root_parts) if root_parts else "."
+
+
 def locate_files(
-    glob_expression: str, filters: Optional[List[Callable[[str], bool]]] = None
+    glob_expression: str,
+    filters: Optional[List[Callable[[str], bool]]] = None,
+    path_filter: Optional[PathFilter] = None,
 ) -> Iterable[str]:
+    """Locate files matching a glob expression.
+
+    .. versionchanged:: 0.3.8
+        Added path_filter parameter.
+
+    Args:
+        glob_expression: glob expression, which can use ** to match any
+            number of directories.
+        filters: callbacks that every file located must pass.
+        path_filter: files and directories to include or exclude, relative
+            to the part of the glob expression before any wildcards.
+    """
     filters = filters if filters is not None else LOCATE_FILE_DEFAULT_FILTERS
+    glob_root = get_glob_root(glob_expression)
     for file_path in glob_module.iglob(glob_expression, recursive=True):
+        if path_filter and not path_filter.is_path_included(
+            os.path.relpath(file_path, glob_root)
+        ):
+            continue
         is_valid = True
         for filter_ in filters:
             if not filter_(file_path):
@@ -127,6 +164,42 @@ def locate_files(
             yield file_path
 
 
+def iter_files_metadata(
+    files: Iterable[str],
+    get_file_metadata_strategy: Callable[
+        [pathlib.Path], Dict[str, Union[str, int]]
+    ] = get_media_metadata,
+    jobs: int = 1,
+) -> Iterator[Tuple[str, Dict[str, Union[str, int]]]]:
+    """Get the metadata of files, in the same order as the files.
+
+    With more than one job, the metadata of the next files is read in
+    threads while the metadata already read is used, so that the time spent
+    waiting for storage overlaps.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        files: files to get the metadata of.
+        get_file_metadata_strategy: strategy to get the metadata of a file.
+        jobs: number of files to get the metadata of at the same time.
+
+    Yields:
+        Each file with its metadata.
+    """
+
+    def get_metadata(file: str) -> Tuple[str, Dict[str, Union[str, int]]]:
+        return file, get_file_metadata_strategy(pathlib.Path(file))
+
+    if jobs <= 1:
+        yield from map(get_metadata, files)
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from utils.iter_executor_results(
+            executor, get_metadata, files, max_pending=jobs * 2, ordered=True
+        )
+
+
 def show_metadata(
     glob: str,
     search_path: pathlib.Path = pathlib.Path("."),
@@ -134,17 +207,35 @@ def show_metadata(
     get_file_metadata_strategy: Callable[
         [pathlib.Path], Dict[str, Union[str, int]]
     ] = get_media_metadata,
+    jobs: int = 1,
 ) -> None:
-    """Show metadata for files matching the glob pattern."""
+    """Show metadata for files matching the glob pattern.
+
+    .. versionchanged:: 0.3.8
+        Added jobs parameter. Reports are still shown in the order the files
+        are found.
+
+    Args:
+        glob: glob pattern of the files, relative to the search path.
+        search_path: directory the glob pattern is relative to.
+        find_files_strategy: strategy to find the files matching a glob
+            pattern.
+        get_file_metadata_strategy: strategy to get the metadata of a file.
+        jobs: number of files to get the metadata of at the same time.
+    """
     width = get_console_print_width()
     found_some = False
-    for file in find_files_strategy(str(search_path / glob)):
+    for file, file_metadata in iter_files_metadata(
+        find_files_strategy(str(search_path / glob)),
+        get_file_metadata_strategy=get_file_metadata_strategy,
+        jobs=jobs,
+    ):
         found_some = True
         print("=" * width)
         logger.info(
             generate_metadata_report(
                 file,
-                metadata=get_file_metadata_strategy(pathlib.Path(file)),
+                metadata=file_metadata,
                 width=width,
             )
         )
@@ -185,15 +276,46 @@ class AbsValidateStrategy(abc.ABC):
         """Validate files matching the glob pattern and return a result."""
 
 
+# MediaConch handle of a worker process, with the policy already loaded.
+_worker_mediaconch: Optional[mediaconch.MediaConch] = None
+
+
+def _init_mediaconch_worker(policy_file: str) -> None:
+    global _worker_mediaconch
+    _worker_mediaconch = MediaConchValidator._get_media_conch()
+    _worker_mediaconch.add_policy(policy_file)
+
+
+def _get_worker_mediaconch_report(filepath: str) -> Tuple[str, str]:
+    if _worker_mediaconch is None:
+        raise RuntimeError("MediaConch worker process was not initialized.")
+    return filepath, _worker_mediaconch.get_report(
+        _worker_mediaconch.add_file(filepath)
+    )
+
+
 class MediaConchValidator(AbsValidateStrategy):
-    """MediaConch validation strategy."""
+    """MediaConch validation strategy.
+
+    .. versionchanged:: 0.3.8
+        Added jobs to validate files in worker processes.
+
+    Args:
+        jobs: number of files to validate at the same time. With more than
+            one job, each worker process creates its own MediaConch handle
+            and loads the policy once.
+    """
 
     @dataclass
     class _Results:
         files_inspected: int = 0
         files_with_issues: Set[FileIssues] = field(default_factory=set)
 
-    def __init__(self) -> None:
+        def merge(self, other: MediaConchValidator._Results) -> None:
+            self.files_inspected += other.files_inspected
+            self.files_with_issues |= other.files_with_issues
+
+    def __init__(self, jobs: int = 1) -> None:
         self.policy_file: Optional[pathlib.Path] = None
         self.issue_formatter: Callable[[MediaConchRule], str] = (
             lambda rule: f'Rule "{rule["name"]}" failed.  '
@@ -205,6 +327,10 @@ class MediaConchValidator(AbsValidateStrategy):
         self.validate_policy_file: Callable[[pathlib.Path], bool] = (
             lambda policy_xml_file: pathlib.Path(policy_xml_file).is_file()
         )
+        self.jobs = jobs
+        self.executor_factory: Callable[..., concurrent.futures.Executor] = (
+            concurrent.futures.ProcessPoolExecutor
+        )
 
     def set_policy_file(self, policy_xml_file: pathlib.Path) -> None:
         self.policy_file = policy_xml_file
@@ -230,29 +356,49 @@ class MediaConchValidator(AbsValidateStrategy):
                     if rule["outcome"] != "pass":
                         yield self.issue_formatter(rule)
 
+    def _iter_files(self, glob: str) -> Iterator[str]:
+        for file in self.iglob(glob, recursive=True):
+            if os.path.isdir(file):
+                continue
+            yield file
+
+    def _iter_results(self, glob: str) -> Iterator[_Results]:
+        if self.policy_file is None:
+            raise ValueError("Policy file must be set before validation.")
+        if self.jobs <= 1:
+            mc = self.mediaconch or self._get_media_conch()
+            mc.add_policy(str(self.policy_file))
+            for file in self._iter_files(glob):
+                logger.info(f"Validating {file}")
+                yield self.get_mediaconch_results(file, mc)
+            return
+
+        # Files are handed to the workers ahead of time, so each file is only
+        # logged once its result comes back.
+        with self.executor_factory(
+            max_workers=self.jobs,
+            initializer=_init_mediaconch_worker,
+            initargs=(str(self.policy_file),),
+        ) as executor:
+            for file, json_report in utils.iter_executor_results(
+                executor,
+                _get_worker_mediaconch_report,
+                self._iter_files(glob),
+                max_pending=self.jobs * 2,
+            ):
+                yield self.parse_mediaconch_results(file, json_report)
+
     def validate(self, glob: str) -> ValidationResult:
         if not self.policy_file:
             raise ValueError("Policy file must be set before validation.")
 
-        mc = self.mediaconch or self._get_media_conch()
         if not self.validate_policy_file(self.policy_file):
             raise ValueError("Policy file must be valid policy file.")
-        mc.add_policy(str(self.policy_file))
         final_results = MediaConchValidator._Results()
 
         try:
-            for file in self.iglob(glob, recursive=True):
-                if os.path.isdir(file):
-                    continue
-
-                logger.info(f"Validating {file}")
-                file_results = self.get_mediaconch_results(file, mc)
-                final_results.files_inspected += file_results.files_inspected
-                final_results.files_with_issues = (
-                    final_results.files_with_issues.union(
-                        file_results.files_with_issues
-                    )
-                )
+            for file_results in self._iter_results(glob):
+                final_results.merge(file_results)
         except KeyboardInterrupt:
             logger.info("Validation interrupted by user.")
         logger.info(f"Inspected {final_results.files_inspected} files.")
@@ -265,6 +411,15 @@ class MediaConchValidator(AbsValidateStrategy):
         self, filepath: str, mc: mediaconch.MediaConch
     ) -> _Results:
         json_report = mc.get_report(mc.add_file(str(filepath)))
+        return self.parse_mediaconch_results(filepath, json_report)
+
+    def parse_mediaconch_results(
+        self, filepath: str, json_report: str
+    ) -> _Results:
+        """Get the results of a file from its MediaConch JSON report.
+
+        .. versionadded:: 0.3.8
+        """
         try:
             file_result: MediaconchReportData = json.loads(json_report)
         except json.JSONDecodeError as err:
@@ -322,20 +477,29 @@ Validation Results
 def validate_metadata(
     glob: str,
     policy_xml_file: pathlib.Path,
-    validate_strategy: AbsValidateStrategy = MediaConchValidator(),
+    validate_strategy: Optional[AbsValidateStrategy] = None,
+    jobs: int = 1,
 ) -> bool:
     """Validate metadata for files matching the glob pattern.
 
+    .. versionchanged:: 0.3.8
+        Added jobs.
+
     Args:
         glob: Glob pattern to match files.
         policy_xml_file: MediaConch policy XML file.
-        validate_strategy: class implementing AbsValidateStrategy
+        validate_strategy: class implementing AbsValidateStrategy. Defaults
+            to a MediaConchValidator.
+        jobs: number of files to validate at the same time with the default
+            validate_strategy.
 
     Returns:
         If all files pass validation, returns True. If any file fails
         validation, returns False.
 
     """
+    if validate_strategy is None:
+        validate_strategy = MediaConchValidator(jobs=jobs)
     validate_strategy.set_policy_file(policy_xml_file)
     result = validate_strategy.validate(glob)
 
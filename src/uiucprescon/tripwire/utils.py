@@ -1,12 +1,17 @@
 """General utility library functions."""
 
+import collections
+import concurrent.futures
 import pathlib
-from typing import Optional, Callable, Iterable, List, cast
+from typing import Optional, Callable, Iterable, Iterator, List, TypeVar, cast
 from importlib.metadata import version, PackageNotFoundError
 from uiucprescon.tripwire.exceptions import TripwireException
 import tomllib
 
-__all__ = ["get_version"]
+__all__ = ["get_version", "iter_executor_results"]
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class InvalidVersionStrategy(TripwireException):
@@ -73,3 +78,54 @@ def get_version(
             pass
 
     raise MissingVersionInformation("Unable to determine package version")
+
+
+def iter_executor_results(
+    executor: concurrent.futures.Executor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_pending: int,
+    ordered: bool = False,
+) -> Iterator[R]:
+    """Run func on items using an executor, limiting the work in flight.
+
+    Unlike Executor.map, items are only consumed as fast as results are
+    produced, so very large or lazy iterables do not get loaded into memory.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        executor: executor used to run the function.
+        func: function to call with each item.
+        items: items to pass to func.
+        max_pending: maximum number of submitted items without a result yet.
+        ordered: yield results in the same order as the items. Otherwise,
+            results are yielded as they complete.
+
+    Yields:
+        Results of func.
+    """
+    max_pending = max(max_pending, 1)
+    if ordered:
+        queue: collections.deque[concurrent.futures.Future[R]] = (
+            collections.deque()
+        )
+        for item in items:
+            queue.append(executor.submit(func, item))
+            if len(queue) >= max_pending:
+                yield queue.popleft().result()
+        while queue:
+            yield queue.popleft().result()
+        return
+
+    pending: set[concurrent.futures.Future[R]] = set()
+    for item in items:
+        pending.add(executor.submit(func, item))
+        if len(pending) >= max_pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+    for future in concurrent.futures.as_completed(pending):
+        yield future.result()
@@ -1,26 +1,47 @@
 """Validation module for checksum files."""
 
+import dataclasses
+import enum
+import functools
 import hashlib
 import io
 import os
 import pathlib
+import socket
+import time
 from typing import (
     Any,
     BinaryIO,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Protocol,
     TextIO,
+    Tuple,
 )
+from uiucprescon.tripwire import filters
 from uiucprescon.tripwire.files import remembered_file_pointer
 import logging
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 from tqdm import tqdm
 
-__all__ = ["validate_directory_checksums_command"]
+__all__ = [
+    "validate_directory_checksums_command",
+    "iter_file_hashes",
+    "iter_checksum_validation_results",
+    "FileHashResult",
+    "ChecksumValidationResult",
+    "ChecksumStatus",
+]
 
 
 SUPPORTED_ALGORITHMS = {
@@ -29,6 +50,15 @@ SUPPORTED_ALGORITHMS = {
     "sha256": hashlib.sha256,
 }
 
+# Names used by the Linux kernel crypto API for the supported algorithms.
+KERNEL_HASH_ALGORITHM_NAMES = {
+    hashlib.md5: "md5",
+    hashlib.sha1: "sha1",
+    hashlib.sha256: "sha256",
+}
+
+KERNEL_HASH_PIPE_SIZE = 1024 * 1024
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
@@ -37,31 +67,186 @@ def get_hash_from_file_pointer(
     pointer: BinaryIO,
     hashing_algorithm,
     progress_reporter: Optional[Callable[[float], None]] = None,
+    size: Optional[int] = None,
 ) -> str:
     """Calculates the hash of a given file pointer.
 
+    .. versionchanged:: 0.3.8
+        Added size parameter and support for file pointers that cannot seek.
+
     Args:
         pointer: file pointer
         hashing_algorithm: hashing algorithm to use such as hashlib.md5
         progress_reporter: callback to a function that reports progress
+        size: number of bytes left to read from the pointer, if known. When
+            not given, it is determined by seeking to the end of the pointer.
+            Pointers that cannot seek, report no progress without it.
 
     Returns: hash value
 
     """
     item_hash = hashing_algorithm()
-    starting_point = pointer.tell()
-    pointer.seek(0, io.SEEK_END)
-    size = pointer.tell() - starting_point
-    pointer.seek(starting_point)
+    if size is None and pointer.seekable():
+        starting_point = pointer.tell()
+        pointer.seek(0, io.SEEK_END)
+        size = pointer.tell() - starting_point
+        pointer.seek(starting_point)
+    progress_from_start = 0
     while chunk := pointer.read(item_hash.block_size * 128):
         item_hash.update(chunk)
-        if progress_reporter:
-            progress_from_start = pointer.tell() - starting_point
+        if progress_reporter and size:
+            progress_from_start += len(chunk)
             progress = progress_from_start / size * 100
             progress_reporter(progress)
     return item_hash.hexdigest()
 
 
+def _get_kernel_hash(
+    pointer: BinaryIO,
+    algorithm_name: str,
+    digest_size: int,
+    progress_reporter: Optional[Callable[[float], None]] = None,
+    size: Optional[int] = None,
+) -> str:
+    file_descriptor = pointer.fileno()
+    starting_point = pointer.tell()
+    if size is None:
+        size = os.fstat(file_descriptor).st_size - starting_point
+    end = starting_point + size
+    position = starting_point
+    with socket.socket(socket.AF_ALG, socket.SOCK_SEQPACKET) as algorithm:
+        algorithm.bind(("hash", algorithm_name))
+        operation, _ = algorithm.accept()
+        with operation:
+            read_end, write_end = os.pipe()
+            try:
+                try:
+                    fcntl.fcntl(
+                        write_end, fcntl.F_SETPIPE_SZ, KERNEL_HASH_PIPE_SIZE
+                    )
+                except OSError:
+                    pass
+                while position < end:
+                    # The file data moves from the page cache into the pipe
+                    # and then into the kernel's hash, never through Python.
+                    spliced = os.splice(
+                        file_descriptor,
+                        write_end,
+                        min(KERNEL_HASH_PIPE_SIZE, end - position),
+                        offset_src=position,
+                    )
+                    if spliced == 0:
+                        break
+                    position += spliced
+                    while spliced:
+                        spliced -= os.splice(
+                            read_end,
+                            operation.fileno(),
+                            spliced,
+                            flags=os.SPLICE_F_MORE,
+                        )
+                    if progress_reporter and size:
+                        progress_reporter(
+                            (position - starting_point) / size * 100
+                        )
+            finally:
+                os.close(read_end)
+                os.close(write_end)
+            digest = operation.recv(digest_size)
+    pointer.seek(position)
+    return digest.hex()
+
+
+def _has_file_descriptor(pointer: BinaryIO) -> bool:
+    # Members of archives are read through the archive and have no file
+    # descriptor of their own.
+    try:
+        pointer.fileno()
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+@functools.cache
+def is_kernel_hashing_available() -> bool:
+    """Check if the Linux kernel crypto API can be used for hashing."""
+    if fcntl is None or not hasattr(socket, "AF_ALG"):
+        return False
+    if not hasattr(os, "splice"):
+        return False
+    try:
+        with socket.socket(socket.AF_ALG, socket.SOCK_SEQPACKET) as algorithm:
+            algorithm.bind(("hash", "md5"))
+    except OSError:
+        return False
+    return True
+
+
+def get_hash_from_file_pointer_kernel(
+    pointer: BinaryIO,
+    hashing_algorithm,
+    progress_reporter: Optional[Callable[[float], None]] = None,
+    size: Optional[int] = None,
+) -> str:
+    """Calculates the hash of a file pointer with the Linux kernel crypto API.
+
+    The file data is spliced straight from the file into an AF_ALG socket so
+    that it is never copied into Python memory. If the kernel crypto API is
+    not available, the pointer is not a real file, or the algorithm is not
+    supported by the kernel, get_hash_from_file_pointer() is used instead.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        pointer: file pointer
+        hashing_algorithm: hashing algorithm to use such as hashlib.md5
+        progress_reporter: callback to a function that reports progress
+        size: number of bytes left to read from the pointer, if known.
+
+    Returns: hash value
+
+    """
+    algorithm_name = KERNEL_HASH_ALGORITHM_NAMES.get(hashing_algorithm)
+    if (
+        algorithm_name is not None
+        and _has_file_descriptor(pointer)
+        and is_kernel_hashing_available()
+    ):
+        starting_point = pointer.tell()
+        try:
+            return _get_kernel_hash(
+                pointer,
+                algorithm_name,
+                digest_size=hashing_algorithm().digest_size,
+                progress_reporter=progress_reporter,
+                size=size,
+            )
+        except OSError as error:
+            # Nothing was read through the pointer itself, so starting over
+            # with hashlib from the same point is safe.
+            logger.debug("Kernel hashing unavailable: %s", error)
+            pointer.seek(starting_point)
+    return get_hash_from_file_pointer(
+        pointer, hashing_algorithm, progress_reporter, size=size
+    )
+
+
+class HashFilePointerStrategyProtocol(Protocol):
+    def __call__(
+        self,
+        pointer: BinaryIO,
+        hashing_algorithm,
+        progress_reporter: Optional[Callable[[float], None]] = None,
+        size: Optional[int] = None,
+    ) -> str: ...
+
+
+HASHING_BACKENDS: Dict[str, HashFilePointerStrategyProtocol] = {
+    "hashlib": get_hash_from_file_pointer,
+    "kernel": get_hash_from_file_pointer_kernel,
+}
+
+
 def get_file_hash_with_progress_reporting(
     path: pathlib.Path,
     hashing_algorithm,
@@ -101,6 +286,9 @@ def validate_file_against_expected_hash(
     expected_hash: str,
     target_file: pathlib.Path,
     get_file_hash_strategy: GetFileHashStrategyProtocol = get_file_hash_with_progress_reporting,  # noqa: E501
+    hashing_strategy: Callable[
+        [BinaryIO, Any, Optional[Callable[[float], None]]], str
+    ] = get_hash_from_file_pointer,
 ) -> Optional[List[str]]:
     prog_bar_format = (
         "{desc}{percentage:3.0f}% |{bar}| Time Remaining: {remaining}"
@@ -114,7 +302,7 @@ def validate_file_against_expected_hash(
         hashing_algorithm=hashlib.md5,
         progress_reporter=lambda value,  # type: ignore[misc]
         prog_bar=progress_bar: prog_bar.set_progress(value),
-        hashing_strategy=get_hash_from_file_pointer,
+        hashing_strategy=hashing_strategy,
     )
 
     progress_bar.close()
@@ -140,46 +328,154 @@ class ProgressBar(tqdm):
             self.refresh()
 
 
-def locate_checksum_files(path: pathlib.Path) -> Iterable[pathlib.Path]:
+class ChecksumStatus(enum.Enum):
+    """Outcome of validating a file against its checksum."""
+
+    MATCHED = "matched"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass(frozen=True)
+class FileHashResult:
+    """Hash value calculated for a single file.
+
+    .. versionadded:: 0.3.8
+    """
+
+    file: pathlib.Path
+    algorithm: str
+    digest: str
+    elapsed: float
+
+
+@dataclasses.dataclass(frozen=True)
+class ChecksumValidationResult:
+    """Result of validating a single file against its checksum file.
+
+    .. versionadded:: 0.3.8
+    """
+
+    checksum_file: pathlib.Path
+    file: pathlib.Path
+    status: ChecksumStatus
+    expected_digest: str
+    issues: Tuple[str, ...]
+    elapsed: float
+
+
+def locate_checksum_files(
+    path: pathlib.Path, path_filter: Optional[filters.PathFilter] = None
+) -> Iterable[pathlib.Path]:
+    """Locate the .md5 checksum files in a directory tree.
+
+    .. versionchanged:: 0.3.8
+        Added path_filter parameter.
+
+    Args:
+        path: directory to search recursively.
+        path_filter: files and directories to include or exclude. Excluded
+            directories are not searched.
+    """
+    path_filter = path_filter or filters.PathFilter()
     for root, dirs, files in os.walk(path):
+        relative_root = os.path.relpath(root, path)
+        path_filter.prune(relative_root, dirs)
         for file_name in files:
             if not file_name.endswith(".md5"):
                 continue
+            if not path_filter.is_file_included(
+                os.path.join(relative_root, file_name)
+            ):
+                continue
             yield pathlib.Path(os.path.join(root, file_name))
 
 
+def iter_file_hashes(
+    files: Iterable[pathlib.Path],
+    hashing_algorithm: str,
+    progress_reporter_factory: Optional[
+        Callable[[pathlib.Path], Callable[[float], None]]
+    ] = None,
+    hashing_strategy: Callable[
+        [BinaryIO, Any, Optional[Callable[[float], None]]], str
+    ] = get_hash_from_file_pointer,
+) -> Iterator[FileHashResult]:
+    """Calculate the hash values of files, one file at a time.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        files: files to calculate a hash value for.
+        hashing_algorithm: name of the algorithm, a key of
+            SUPPORTED_ALGORITHMS.
+        progress_reporter_factory: optional callback that is given the file
+            about to be hashed and returns a progress reporter for it.
+        hashing_strategy: strategy to hash an open file, such as a value of
+            HASHING_BACKENDS.
+
+    Yields:
+        A result record for each file as soon as it has been hashed.
+    """
+    for file_path in files:
+        progress_reporter = (
+            progress_reporter_factory(file_path)
+            if progress_reporter_factory
+            else None
+        )
+        start_time = time.perf_counter()
+        digest = get_file_hash_with_progress_reporting(
+            file_path,
+            hashing_algorithm=SUPPORTED_ALGORITHMS[hashing_algorithm],
+            progress_reporter=progress_reporter,
+            hashing_strategy=hashing_strategy,
+        )
+        yield FileHashResult(
+            file=file_path,
+            algorithm=hashing_algorithm,
+            digest=digest,
+            elapsed=time.perf_counter() - start_time,
+        )
+
+
 def get_hash_command(
-    files: List[pathlib.Path], hashing_algorithm: str
+    files: List[pathlib.Path],
+    hashing_algorithm: str,
+    hashing_backend: str = "hashlib",
 ) -> None:
     prog_bar_format = (
         "{desc}{percentage:3.0f}% |{bar}| Time Remaining: {remaining}"
     )
+    progress_bars: Dict[pathlib.Path, ProgressBar] = {}
 
-    for i, file_path in enumerate(files):
+    def start_progress_bar(file_path: pathlib.Path) -> Callable[[float], None]:
         progress_bar = ProgressBar(
             total=100.0, leave=False, bar_format=prog_bar_format
         )
-
         progress_bar.set_description(file_path.name)
-        result = get_file_hash_with_progress_reporting(
-            file_path,
-            hashing_algorithm=SUPPORTED_ALGORITHMS[hashing_algorithm],
-            progress_reporter=lambda value,  # type: ignore[misc]
-            prog_bar=progress_bar: prog_bar.set_progress(value),
+        progress_bars[file_path] = progress_bar
+        return progress_bar.set_progress
+
+    for i, result in enumerate(
+        iter_file_hashes(
+            files,
+            hashing_algorithm=hashing_algorithm,
+            progress_reporter_factory=start_progress_bar,
+            hashing_strategy=HASHING_BACKENDS[hashing_backend],
         )
-        progress_bar.close()
+    ):
+        progress_bars.pop(result.file).close()
 
         # Report the results
         if len(files) == 1:
             pre_fix = ""
         else:
             pre_fix = f"({i + 1}/{len(files)}) "
-        logger.info(f"{pre_fix}{file_path} --> {hashing_algorithm}: {result}")
+        logger.info(
+            f"{pre_fix}{result.file} --> {result.algorithm}: {result.digest}"
+        )
 
 
-def create_checksum_validation_report(
-    checksum_files_checked: List[pathlib.Path], errors: List[str]
-) -> str:
+def create_checksum_validation_report(total: int, errors: List[str]) -> str:
     report_header = "Results:"
 
     if errors:
@@ -188,7 +484,7 @@ def create_checksum_validation_report(
     {report_error_list}
     """
     else:
-        report_body = f"All {len(checksum_files_checked)} checksum(s) matched."
+        report_body = f"All {total} checksum(s) matched."
 
     return f"""{report_header}
 
@@ -236,6 +532,65 @@ def read_checksum_file(file_path: pathlib.Path) -> str:
         return get_checksum_file_reading_strategy(fp=f)(f)
 
 
+def get_checksum_target(checksum_file: pathlib.Path) -> pathlib.Path:
+    """Get the path of the file that a checksum file is for.
+
+    .. versionadded:: 0.3.8
+    """
+    return pathlib.Path(
+        os.path.join(
+            checksum_file.parent, checksum_file.name.replace(".md5", "")
+        )
+    )
+
+
+def iter_checksum_validation_results(
+    path: pathlib.Path,
+    locate_checksum_strategy: Callable[
+        [pathlib.Path], Iterable[pathlib.Path]
+    ] = locate_checksum_files,
+    read_checksums_strategy: Callable[
+        [pathlib.Path], str
+    ] = read_checksum_file,
+    compare_checksum_to_target_strategy: Callable[
+        [str, pathlib.Path], Optional[List[str]]
+    ] = validate_file_against_expected_hash,
+) -> Iterator[ChecksumValidationResult]:
+    """Validate checksum files located inside the directory, one at a time.
+
+    Checksum files are located lazily, so memory use does not grow with the
+    number of files checked.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        path: path to directory containing checksums and matching files
+        locate_checksum_strategy: strategy to locate checksum files
+        read_checksums_strategy: strategy to read checksum files
+        compare_checksum_to_target_strategy: strategy to compare checksum files
+
+    Yields:
+        A result record for each checksum file as soon as it is validated.
+    """
+    for checksum_file in locate_checksum_strategy(path):
+        start_time = time.perf_counter()
+        expected_hash_value = read_checksums_strategy(checksum_file)
+        target_file = get_checksum_target(checksum_file)
+        issues = compare_checksum_to_target_strategy(
+            expected_hash_value, target_file
+        )
+        yield ChecksumValidationResult(
+            checksum_file=checksum_file,
+            file=target_file,
+            status=(
+                ChecksumStatus.FAILED if issues else ChecksumStatus.MATCHED
+            ),
+            expected_digest=expected_hash_value,
+            issues=tuple(issues or []),
+            elapsed=time.perf_counter() - start_time,
+        )
+
+
 def validate_directory_checksums_command(
     path: pathlib.Path,
     locate_checksum_strategy: Callable[
@@ -258,39 +613,66 @@ def validate_directory_checksums_command(
 
     """
     logger.info("Locating checksums files...")
-    checksum_files = list(locate_checksum_strategy(path))
+    # Only the checksum files are counted here, so they are not kept in
+    # memory while they are validated.
+    total = sum(1 for _ in locate_checksum_strategy(path))
+
+    def locate_with_progress(
+        search_path: pathlib.Path,
+    ) -> Iterator[pathlib.Path]:
+        for i, checksum_file in enumerate(
+            locate_checksum_strategy(search_path)
+        ):
+            logger.info(
+                "(%d/%d) Validating %s",
+                i + 1,
+                total,
+                get_checksum_target(checksum_file).relative_to(path),
+            )
+            yield checksum_file
+
     logger.info("Validating checksums...")
-    errors = []
-    for i, checksum_file in enumerate(checksum_files):
-        expected_hash_value = read_checksums_strategy(checksum_file)
+    log_checksum_validation_results(
+        iter_checksum_validation_results(
+            path,
+            locate_checksum_strategy=locate_with_progress,
+            read_checksums_strategy=read_checksums_strategy,
+            compare_checksum_to_target_strategy=compare_checksum_to_target_strategy,
+        ),
+        path,
+    )
 
-        target_file = pathlib.Path(
-            os.path.join(
-                checksum_file.parent, checksum_file.name.replace(".md5", "")
-            )
-        )
-        logger.info(
-            "(%d/%d) Validating %s",
-            i + 1,
-            len(checksum_files),
-            target_file.relative_to(path),
-        )
-        issues = compare_checksum_to_target_strategy(
-            expected_hash_value, target_file
-        )
-        if issues:
-            file_report = ", ".join(issues)
+
+def log_checksum_validation_results(
+    results: Iterable[ChecksumValidationResult], path: pathlib.Path
+) -> None:
+    """Log checksum validation results as they arrive, followed by a report.
+
+    .. versionadded:: 0.3.8
+
+    Args:
+        results: checksum validation results.
+        path: path that the files in the results are reported relative to.
+    """
+    errors = []
+    total_checked = 0
+    for result in results:
+        total_checked += 1
+        if result.status is ChecksumStatus.FAILED:
+            file_report = ", ".join(result.issues)
             message = (
-                f"{target_file.relative_to(path)} - Failed: {file_report}"
+                f"{result.file.relative_to(path)} - Failed: {file_report}"
             )
-            logger.error(message)
+            logger.error("(%d) %s", total_checked, message)
             errors.append(message)
         else:
-            logger.info("%s - Checksum matched", target_file.relative_to(path))
+            logger.info(
+                "(%d) %s - Checksum matched",
+                total_checked,
+                result.file.relative_to(path),
+            )
 
     logger.info("Job done!")
     logger.info(
-        create_checksum_validation_report(
-            checksum_files_checked=checksum_files, errors=errors
-        )
+        create_checksum_validation_report(total=total_checked, errors=errors)
     )
@@ -0,0 +1,422 @@
+"""Keeping a manifest check up to date as files arrive.
+
+After one initial search of the search path, changes to it are followed with
+the Linux inotify API instead of searching it again. Files are counted once
+they have been closed after writing or moved into the search path, so files
+that are still being uploaded are not reported as found.
+
+.. versionadded:: 0.3.8
+"""
+
+import ctypes
+import ctypes.util
+import dataclasses
+import errno
+import logging
+import os
+import pathlib
+import select
+import struct
+import sys
+import typing
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from uiucprescon.tripwire import filters, manifest_check
+from uiucprescon.tripwire.exceptions import TripwireException
+
+__all__ = ["ManifestWatcher", "WatchChange", "WatchError", "watch_manifests"]
+
+# Flags from <sys/inotify.h>.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_ONLYDIR
+)
+
+# struct inotify_event without the name that follows it.
+EVENT_HEADER = struct.Struct("iIII")
+
+EVENT_BUFFER_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class WatchError(TripwireException):
+    """Unable to watch for changes."""
+
+
+@dataclasses.dataclass(frozen=True)
+class InotifyEvent:
+    """A single event read from an inotify file descriptor."""
+
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+class Inotify:
+    """Minimal wrapper around the Linux inotify API."""
+
+    def __init__(self) -> None:
+        """Create a new inotify instance.
+
+        Raises:
+            WatchError: if inotify is not available.
+        """
+        if not sys.platform.startswith("linux"):
+            raise WatchError("Watching for changes is only supported on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise WatchError(
+                f"Unable to use inotify: {os.strerror(ctypes.get_errno())}"
+            )
+
+    def add_watch(self, path: pathlib.Path, mask: int = WATCH_MASK) -> int:
+        """Watch a directory for changes.
+
+        Returns:
+            The watch descriptor of the directory.
+        """
+        wd = self._libc.inotify_add_watch(
+            self.fd, ctypes.c_char_p(os.fsencode(path)), ctypes.c_uint32(mask)
+        )
+        if wd < 0:
+            error_number = ctypes.get_errno()
+            if error_number == errno.ENOSPC:
+                raise WatchError(
+                    "Too many directories to watch. Increase "
+                    "fs.inotify.max_user_watches to watch more."
+                )
+            raise OSError(error_number, os.strerror(error_number), str(path))
+        return typing.cast(int, wd)
+
+    def remove_watch(self, wd: int) -> None:
+        """Stop watching a directory, if it is still watched."""
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(
+        self, timeout: Optional[float] = None
+    ) -> List[InotifyEvent]:
+        """Wait for events and read them.
+
+        Args:
+            timeout: seconds to wait for events. None waits forever.
+
+        Returns:
+            Events read, which is empty if the timeout expired.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        data = os.read(self.fd, EVENT_BUFFER_SIZE)
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, name_size = EVENT_HEADER.unpack_from(
+                data, offset
+            )
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + name_size].rstrip(b"\0")
+            offset += name_size
+            events.append(InotifyEvent(wd, mask, cookie, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        os.close(self.fd)
+
+
+@dataclasses.dataclass(frozen=True)
+class WatchChange:
+    """A change in the result of a manifest check.
+
+    Attributes:
+        result: file that became missing or unexpected, or stopped being so.
+        resolved: True if the file is no longer missing or unexpected.
+    """
+
+    result: manifest_check.ManifestCheckResult
+    resolved: bool
+
+
+class ManifestWatcher:
+    """Follow the changes to a search path after checking it once.
+
+    The file index of the scanner is updated from inotify events, so the
+    search path is only searched again when the kernel reports that events
+    were lost.
+    """
+
+    def __init__(
+        self,
+        search_path: pathlib.Path,
+        entries: Iterable[manifest_check.ManifestCheckResult],
+        inotify: Optional[Inotify] = None,
+        path_filter: Optional[filters.PathFilter] = None,
+    ) -> None:
+        """Create a new watcher.
+
+        Args:
+            search_path: directory to watch recursively.
+            entries: files listed in the manifests, such as the results of
+                manifest_check.iter_manifest_entries().
+            inotify: inotify instance to use. Defaults to a new one.
+            path_filter: files and directories to include or exclude.
+        """
+        self.search_path = search_path
+        self.inotify = inotify or Inotify()
+        self.path_filter = path_filter or filters.PathFilter()
+        self.watched: Dict[int, pathlib.Path] = {}
+        self.entries: Dict[str, List[manifest_check.ManifestCheckResult]] = {}
+        for entry in entries:
+            self.entries.setdefault(entry.file, []).append(entry)
+        self.missing: Dict[str, List[manifest_check.ManifestCheckResult]] = {}
+        self.scanner = manifest_check.PackageScanner(
+            search_path, scanner_klass=self._watch_tree
+        )
+
+    def _add_watch(self, directory: pathlib.Path) -> None:
+        try:
+            self.watched[self.inotify.add_watch(directory)] = directory
+        except FileNotFoundError:
+            pass
+
+    def _watch_tree(self, directory: pathlib.Path) -> Iterator[pathlib.Path]:
+        # Each directory is watched before it is listed, so files added
+        # while it is listed are not missed.
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            self._add_watch(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        relative_path = os.path.relpath(
+                            entry.path, self.search_path
+                        )
+                        if entry.is_dir():
+                            # Symbolic links to directories are not followed,
+                            # the same as os.walk().
+                            if not entry.is_symlink() and (
+                                not self.path_filter.is_directory_excluded(
+                                    relative_path
+                                )
+                            ):
+                                pending.append(pathlib.Path(entry.path))
+                        elif self.path_filter.is_file_included(relative_path):
+                            yield pathlib.Path(entry.path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+    def start(self) -> Iterator[manifest_check.ManifestCheckResult]:
+        """Search the search path and check it against the manifests.
+
+        Yields:
+            Missing files followed by unexpected files.
+        """
+        for file_name, entries in self.entries.items():
+            if self.scanner.locate(file_name) is None:
+                self.missing[file_name] = entries
+                yield from entries
+        yield from manifest_check.iter_unexpected_files(self.scanner)
+
+    def _file_added(self, file_path: pathlib.Path) -> Iterator[WatchChange]:
+        index = self.scanner.index
+        if index.contains_file(file_path):
+            return
+        index.add(file_path)
+        if file_path.name in self.missing:
+            index.mark_expected(file_path.name)
+            for entry in self.missing.pop(file_path.name):
+                yield WatchChange(entry, resolved=True)
+        elif file_path.name not in self.entries:
+            yield WatchChange(self._unexpected(file_path), resolved=False)
+
+    def _file_removed(self, file_path: pathlib.Path) -> Iterator[WatchChange]:
+        index = self.scanner.index
+        if not index.contains_file(file_path):
+            return
+        index.remove(file_path)
+        if file_path.name in self.entries:
+            if file_path.name not in index:
+                self.missing[file_path.name] = self.entries[file_path.name]
+                for entry in self.missing[file_path.name]:
+                    yield WatchChange(entry, resolved=False)
+        else:
+            yield WatchChange(self._unexpected(file_path), resolved=True)
+
+    def _directory_removed(
+        self, directory: pathlib.Path
+    ) -> Iterator[WatchChange]:
+        for wd, watched_directory in list(self.watched.items()):
+            if watched_directory.is_relative_to(directory):
+                self.inotify.remove_watch(wd)
+                del self.watched[wd]
+        removed = [
+            file_path
+            for file_path in self.scanner.index.iter_files()
+            if file_path.is_relative_to(directory)
+        ]
+        for file_path in removed:
+            yield from self._file_removed(file_path)
+
+    @staticmethod
+    def _unexpected(
+        file_path: pathlib.Path,
+    ) -> manifest_check.ManifestCheckResult:
+        return manifest_check.ManifestCheckResult(
+            status=manifest_check.ManifestCheckStatus.UNEXPECTED,
+            file=file_path.name,
+            location=file_path,
+        )
+
+    def _rescan(self) -> Iterator[WatchChange]:
+        logger.warning(
+            "Changes were lost. Searching %s again", self.search_path
+        )
+        for wd in self.watched:
+            self.inotify.remove_watch(wd)
+        self.watched.clear()
+        found = set(self._watch_tree(self.search_path))
+        indexed = set(self.scanner.index.iter_files())
+        for file_path in sorted(indexed - found):
+            yield from self._file_removed(file_path)
+        for file_path in sorted(found - indexed):
+            yield from self._file_added(file_path)
+
+    def handle_event(self, event: InotifyEvent) -> Iterator[WatchChange]:
+        """Update the index from an inotify event.
+
+        Yields:
+            Changes to the missing and unexpected files.
+        """
+        if event.mask & IN_Q_OVERFLOW:
+            yield from self._rescan()
+            return
+        if event.mask & IN_IGNORED:
+            self.watched.pop(event.wd, None)
+            return
+        directory = self.watched.get(event.wd)
+        if directory is None or not event.name:
+            return
+        path = directory / event.name
+        relative_path = os.path.relpath(path, self.search_path)
+        if event.mask & IN_ISDIR:
+            if event.mask & (IN_CREATE | IN_MOVED_TO):
+                if not self.path_filter.is_directory_excluded(relative_path):
+                    for file_path in self._watch_tree(path):
+                        yield from self._file_added(file_path)
+            elif event.mask & (IN_DELETE | IN_MOVED_FROM):
+                yield from self._directory_removed(path)
+            return
+        if not self.path_filter.is_file_included(relative_path):
+            return
+        if event.mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+            yield from self._file_added(path)
+        elif event.mask & (IN_DELETE | IN_MOVED_FROM):
+            yield from self._file_removed(path)
+
+    def iter_changes(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[WatchChange]:
+        """Follow changes until no file listed in the manifests is missing.
+
+        Args:
+            timeout: seconds to wait for each change. None waits forever.
+
+        Yields:
+            Changes to the missing and unexpected files as they happen.
+        """
+        while self.missing:
+            events = self.inotify.read_events(timeout)
+            if not events:
+                return
+            for event in events:
+                yield from self.handle_event(event)
+
+
+def format_change(change: WatchChange, search_path: pathlib.Path) -> str:
+    """Create the message shown for a change in the check results."""
+    result = change.result
+    if result.status is manifest_check.ManifestCheckStatus.MISSING:
+        if change.resolved:
+            return f"Line: {result.line_number}. Found: {result.file}"
+        return f"Line: {result.line_number}. Unable to locate: {result.file}"
+    location = (
+        result.location.relative_to(search_path)
+        if result.location
+        else result.file
+    )
+    if change.resolved:
+        return f"No longer found: {location}"
+    return f"Not included in manifest: {location}"
+
+
+def watch_manifests(
+    manifests: Sequence[pathlib.Path],
+    search_path: pathlib.Path,
+    path_filter: Optional[filters.PathFilter] = None,
+    timeout: Optional[float] = None,
+    watcher_factory: typing.Callable[..., ManifestWatcher] = ManifestWatcher,
+) -> bool:
+    """Check manifests and keep checking them as files change.
+
+    Args:
+        manifests: manifest tsv files.
+        search_path: directory to watch recursively.
+        path_filter: files and directories to include or exclude.
+        timeout: give up after this many seconds without any change. None
+            waits forever.
+        watcher_factory: creates the watcher.
+
+    Returns:
+        True once every file listed in the manifests has been found, or
+        False if the timeout expired first.
+    """
+    watcher = watcher_factory(
+        search_path,
+        list(manifest_check.iter_manifest_entries(manifests)),
+        path_filter=path_filter,
+    )
+    try:
+        for result in watcher.start():
+            logger.info(
+                format_change(WatchChange(result, resolved=False), search_path)
+            )
+        if watcher.missing:
+            logger.info(
+                "Watching %s for %d missing file(s)...",
+                search_path,
+                len(watcher.missing),
+            )
+        for change in watcher.iter_changes(timeout):
+            logger.info(format_change(change, search_path))
+    finally:
+        watcher.inotify.close()
+    if watcher.missing:
+        logger.warning(
+            "Stopped watching with %d file(s) still missing",
+            len(watcher.missing),
+        )
+        return False
+    logger.info("All files listed in the manifest were found.")
+    return True
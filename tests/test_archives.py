@@ -0,0 +1,143 @@
+import hashlib
+import io
+import pathlib
+import tarfile
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+from uiucprescon.tripwire import archives, filters, validation
+
+GOOD_HASH = hashlib.md5(b"abcdef").hexdigest()
+
+
+def _files():
+    return {
+        "package/file1.wav": b"abcdef",
+        "package/file1.wav.md5": f"{GOOD_HASH} *file1.wav\n".encode(),
+        "package/file2.wav": b"changed",
+        "package/file2.wav.md5": f"{GOOD_HASH}\n".encode(),
+    }
+
+
+def _create_zip(path):
+    with zipfile.ZipFile(path, "w") as zip_file:
+        for name, data in _files().items():
+            zip_file.writestr(name, data)
+
+
+def _create_tar(path, mode):
+    with tarfile.open(path, mode) as tar_file:
+        for name, data in _files().items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar_file.addfile(info, io.BytesIO(data))
+
+
+@pytest.fixture(
+    params=[
+        ("sample.zip", _create_zip),
+        ("sample.tar", lambda path: _create_tar(path, "w:")),
+        ("sample.tar.gz", lambda path: _create_tar(path, "w:gz")),
+    ],
+    ids=["zip", "tar", "tar.gz"],
+)
+def archive_file(request, tmp_path):
+    name, create = request.param
+    path = tmp_path / name
+    create(path)
+    return path
+
+
+def test_is_supported_archive(archive_file):
+    assert archives.is_supported_archive(archive_file) is True
+
+
+def test_is_supported_archive_not_an_archive(tmp_path):
+    not_archive = tmp_path / "file.wav"
+    not_archive.write_bytes(b"abcdef")
+    assert archives.is_supported_archive(not_archive) is False
+    assert archives.is_supported_archive(tmp_path) is False
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_iter_archive_checksum_results(archive_file, jobs):
+    results = {
+        result.file.relative_to(archive_file).as_posix(): result.status
+        for result in archives.iter_archive_checksum_results(
+            archive_file, jobs=jobs
+        )
+    }
+    assert results == {
+        "package/file1.wav": validation.ChecksumStatus.MATCHED,
+        "package/file2.wav": validation.ChecksumStatus.FAILED,
+    }
+
+
+def test_iter_archive_checksum_results_path_filter(archive_file):
+    results = list(
+        archives.iter_archive_checksum_results(
+            archive_file,
+            path_filter=filters.PathFilter(exclude=("file2.wav.md5",)),
+        )
+    )
+    assert [result.file.name for result in results] == ["file1.wav"]
+
+
+def test_iter_archive_checksum_results_hashing_strategy(archive_file):
+    hashing_strategy = Mock(wraps=validation.get_hash_from_file_pointer)
+    results = list(
+        archives.iter_archive_checksum_results(
+            archive_file, hashing_strategy=hashing_strategy
+        )
+    )
+    assert results[0].status is validation.ChecksumStatus.MATCHED
+    assert hashing_strategy.called
+
+
+def test_parse_checksum_member_list():
+    entries = archives.parse_checksum_member(
+        "bag/manifest-md5.txt",
+        f"{GOOD_HASH}  data/file1.wav\n{GOOD_HASH}  data/file2.wav\n",
+    )
+    assert [entry.member for entry in entries] == [
+        "bag/data/file1.wav",
+        "bag/data/file2.wav",
+    ]
+
+
+def test_parse_checksum_member_sidecar():
+    entries = archives.parse_checksum_member("file1.wav.md5", GOOD_HASH)
+    assert entries == [
+        archives.ChecksumEntry(
+            checksum_member="file1.wav.md5",
+            member="file1.wav",
+            expected_hash=GOOD_HASH,
+        )
+    ]
+
+
+def test_missing_member_fails(tmp_path):
+    path = tmp_path / "sample.zip"
+    with zipfile.ZipFile(path, "w") as zip_file:
+        zip_file.writestr("file1.wav.md5", GOOD_HASH)
+    results = list(archives.iter_archive_checksum_results(path))
+    assert results[0].status is validation.ChecksumStatus.FAILED
+    assert "File not found in archive" in results[0].issues
+
+
+def test_validate_archive_checksums_command(caplog):
+    path = pathlib.Path("sample.zip")
+    result = validation.ChecksumValidationResult(
+        checksum_file=path / "file1.wav.md5",
+        file=path / "file1.wav",
+        status=validation.ChecksumStatus.MATCHED,
+        expected_digest=GOOD_HASH,
+        issues=(),
+        elapsed=0.0,
+    )
+    archives.validate_archive_checksums_command(
+        path, results_strategy=Mock(return_value=[result])
+    )
+    assert "file1.wav - Checksum matched" in caplog.text
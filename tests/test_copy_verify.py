@@ -0,0 +1,123 @@
+import hashlib
+import pathlib
+from unittest.mock import Mock
+
+from uiucprescon.tripwire import copy_verify, validation
+
+
+def test_copy_with_hash(tmp_path):
+    source = tmp_path / "source.wav"
+    source.write_bytes(b"abcdef")
+    destination = tmp_path / "out" / "copy.wav"
+    assert (
+        copy_verify.copy_with_hash(source, destination)
+        == hashlib.md5(b"abcdef").hexdigest()
+    )
+    assert destination.read_bytes() == b"abcdef"
+
+
+def test_copy_with_hash_drop_cache(tmp_path, monkeypatch):
+    drop_file_cache = Mock()
+    monkeypatch.setattr(copy_verify, "drop_file_cache", drop_file_cache)
+    source = tmp_path / "source.wav"
+    source.write_bytes(b"abcdef")
+    copy_verify.copy_with_hash(source, tmp_path / "copy.wav", drop_cache=True)
+    drop_file_cache.assert_called_once()
+
+
+def test_locate_copy_jobs_directory(tmp_path):
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "file.wav").write_bytes(b"abcdef")
+    destination = tmp_path / "destination"
+    assert list(copy_verify.locate_copy_jobs(source, destination)) == [
+        (source / "sub" / "file.wav", destination / "sub" / "file.wav")
+    ]
+
+
+def test_copy_verify_skips_destination_inside_source(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "file.wav").write_bytes(b"abcdef")
+    destination = source / "backup"
+    results = list(copy_verify.copy_verify(source, destination))
+    assert [r.source for r in results] == [source / "file.wav"]
+    assert sorted(p.name for p in destination.rglob("*")) == ["file.wav"]
+    assert len(list(copy_verify.copy_verify(source, destination))) == 1
+
+
+def test_copy_verify_writes_sidecars(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "file.wav").write_bytes(b"abcdef")
+    destination = tmp_path / "destination"
+    results = list(
+        copy_verify.copy_verify(
+            source, destination, jobs=2, write_sidecars=True
+        )
+    )
+    assert results[0].status is validation.ChecksumStatus.MATCHED
+    assert (
+        validation.read_checksum_file(destination / "file.wav.md5")
+        == hashlib.md5(b"abcdef").hexdigest()
+    )
+
+
+def test_needs_sidecar_skips_existing_checksums(tmp_path):
+    (tmp_path / "file.wav").write_bytes(b"abcdef")
+    (tmp_path / "file.wav.md5").write_text("abc")
+    assert copy_verify.needs_sidecar(tmp_path / "file.wav") is False
+    assert copy_verify.needs_sidecar(tmp_path / "file.wav.md5") is False
+
+
+def test_copy_verify_command_reports_failures(caplog):
+    result = copy_verify.CopyVerifyResult(
+        source=pathlib.Path("source.wav"),
+        destination=pathlib.Path("copy.wav"),
+        status=validation.ChecksumStatus.FAILED,
+        source_digest="abc",
+        destination_digest="def",
+        elapsed=0.0,
+    )
+    assert (
+        copy_verify.copy_verify_command(
+            pathlib.Path("source.wav"),
+            pathlib.Path("copy.wav"),
+            copy_verify_strategy=Mock(return_value=[result]),
+        )
+        is False
+    )
+    assert "Hash mismatch" in caplog.text
+
+
+def test_copy_verify_same_file_is_not_truncated(tmp_path):
+    source = tmp_path / "file.wav"
+    source.write_bytes(b"abcdef")
+    results = list(copy_verify.copy_verify(source, source))
+    assert results[0].status is validation.ChecksumStatus.FAILED
+    assert "same file" in results[0].error
+    assert source.read_bytes() == b"abcdef"
+
+
+def test_copy_verify_reports_unreadable_file_and_continues(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "file.wav").write_bytes(b"abcdef")
+    destination = tmp_path / "destination"
+    results = list(
+        copy_verify.copy_verify(
+            source,
+            destination,
+            locate_copy_jobs_strategy=lambda *_: [
+                (source / "missing.wav", destination / "missing.wav"),
+                (source / "file.wav", destination / "file.wav"),
+            ],
+        )
+    )
+    assert sorted(
+        (result.source.name, result.status, result.error is None)
+        for result in results
+    ) == [
+        ("file.wav", validation.ChecksumStatus.MATCHED, True),
+        ("missing.wav", validation.ChecksumStatus.FAILED, False),
+    ]
@@ -0,0 +1,145 @@
+import hashlib
+import pathlib
+from unittest.mock import Mock
+
+from uiucprescon.tripwire import duplicates
+
+
+def test_group_files_by_size_drops_unique_sizes():
+    sizes = {
+        pathlib.Path("a"): 10,
+        pathlib.Path("b"): 10,
+        pathlib.Path("c"): 20,
+        pathlib.Path("d"): 0,
+        pathlib.Path("e"): 0,
+    }
+    assert duplicates.group_files_by_size(
+        sizes.keys(), get_size=sizes.__getitem__
+    ) == {10: [pathlib.Path("a"), pathlib.Path("b")]}
+
+
+def test_group_files_by_size_skips_unreadable_files(tmp_path, caplog):
+    (tmp_path / "a.wav").write_bytes(b"abc")
+    (tmp_path / "b.wav").write_bytes(b"abc")
+    (tmp_path / "broken.wav").symlink_to(tmp_path / "missing.wav")
+    assert duplicates.group_files_by_size(
+        [tmp_path / "a.wav", tmp_path / "broken.wav", tmp_path / "b.wav"]
+    ) == {3: [tmp_path / "a.wav", tmp_path / "b.wav"]}
+    assert "Skipping" in caplog.text
+
+
+def test_locate_candidate_files_skips_symlinks(tmp_path):
+    (tmp_path / "file.wav").write_bytes(b"abc")
+    (tmp_path / "file.wav.md5").write_text("")
+    (tmp_path / "link.wav").symlink_to(tmp_path / "file.wav")
+    (tmp_path / "broken.wav").symlink_to(tmp_path / "missing.wav")
+    assert list(duplicates.locate_candidate_files(tmp_path)) == [
+        tmp_path / "file.wav"
+    ]
+
+
+def test_get_partial_hash_small_file_is_full_hash(tmp_path):
+    file_path = tmp_path / "dummy.wav"
+    file_path.write_bytes(b"abcdef")
+    assert duplicates.get_partial_hash(file_path, 6) == (
+        hashlib.md5(b"abcdef").hexdigest(),
+        True,
+    )
+
+
+def test_get_partial_hash_only_reads_ends(tmp_path):
+    file_path = tmp_path / "dummy.wav"
+    file_path.write_bytes(b"ab" + b"x" * 10 + b"yz")
+    assert duplicates.get_partial_hash(file_path, 14, sample_size=2) == (
+        hashlib.md5(b"abyz").hexdigest(),
+        False,
+    )
+
+
+def test_get_full_hash_reuses_sidecar():
+    assert (
+        duplicates.get_full_hash(
+            pathlib.Path("dummy.wav"),
+            read_sidecar_strategy=lambda _: "e80b5017098950fc58aad83c8c14978e",
+        )
+        == "e80b5017098950fc58aad83c8c14978e"
+    )
+
+
+def test_find_duplicates(tmp_path):
+    (tmp_path / "first.wav").write_bytes(b"same content")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "second.wav").write_bytes(b"same content")
+    (tmp_path / "other.wav").write_bytes(b"diff content")
+    (tmp_path / "unique.wav").write_bytes(b"unique size")
+    groups = list(duplicates.find_duplicates(tmp_path))
+    assert len(groups) == 1
+    assert groups[0].files == (
+        tmp_path / "first.wav",
+        tmp_path / "sub" / "second.wav",
+    )
+    assert groups[0].digest == hashlib.md5(b"same content").hexdigest()
+
+
+def test_find_duplicates_only_fully_hashes_partial_collisions(tmp_path):
+    for name in ["a.wav", "b.wav", "c.wav"]:
+        (tmp_path / name).write_bytes(b"same size")
+    full_hash_strategy = Mock(return_value="abc")
+    groups = list(
+        duplicates.find_duplicates(
+            tmp_path,
+            partial_hash_strategy=lambda path, _: (
+                "collide" if path.name != "c.wav" else "unique",
+                False,
+            ),
+            full_hash_strategy=full_hash_strategy,
+        )
+    )
+    assert full_hash_strategy.call_count == 2
+    assert groups[0].files == (tmp_path / "a.wav", tmp_path / "b.wav")
+
+
+def test_find_duplicates_skips_files_failing_partial_hash(tmp_path, caplog):
+    for name in ["a.wav", "b.wav", "c.wav"]:
+        (tmp_path / name).write_bytes(b"same size")
+
+    def partial_hash_strategy(path, size):
+        if path.name == "b.wav":
+            raise PermissionError("Permission denied")
+        return duplicates.get_partial_hash(path, size)
+
+    groups = list(
+        duplicates.find_duplicates(
+            tmp_path, partial_hash_strategy=partial_hash_strategy
+        )
+    )
+    assert groups[0].files == (tmp_path / "a.wav", tmp_path / "c.wav")
+    assert "Skipping" in caplog.text and "b.wav" in caplog.text
+
+
+def test_find_duplicates_skips_files_failing_full_hash(tmp_path, caplog):
+    for name in ["a.wav", "b.wav", "c.wav"]:
+        (tmp_path / name).write_bytes(b"same size")
+
+    def full_hash_strategy(path):
+        if path.name == "a.wav":
+            raise FileNotFoundError("No such file or directory")
+        return "abc"
+
+    groups = list(
+        duplicates.find_duplicates(
+            tmp_path,
+            partial_hash_strategy=lambda *_: ("collide", False),
+            full_hash_strategy=full_hash_strategy,
+        )
+    )
+    assert groups[0].files == (tmp_path / "b.wav", tmp_path / "c.wav")
+    assert "a.wav" in caplog.text
+
+
+def test_find_duplicates_command_logs_groups(tmp_path, caplog):
+    (tmp_path / "first.wav").write_bytes(b"same content")
+    (tmp_path / "second.wav").write_bytes(b"same content")
+    duplicates.find_duplicates_command(tmp_path)
+    assert "first.wav" in caplog.text
+    assert "second.wav" in caplog.text
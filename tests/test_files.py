@@ -1,9 +1,13 @@
+import csv
 import io
+import zipfile
 from unittest.mock import Mock
+from xml.sax.saxutils import escape
 
 import pytest
 
 from uiucprescon import tripwire
+from uiucprescon.tripwire.exceptions import InvalidFileFormat
 import sample_data
 
 
@@ -89,6 +93,147 @@ class TestTSVManifest:
         with pytest.raises(IndexError):
             _ = manifest[index]
 
+    def test_get_single_item_does_not_count_entries(self):
+        test_file = io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+        manifest = tripwire.files.TSVManifest(test_file)
+        assert manifest[1]["Side\n(A/B)"] == "B"
+        assert "total_entries" not in vars(manifest)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA,
+            "a\ta\tb\n1\t2\t3\n4\n5\t6\t7\t8\t9\n",
+        ],
+    )
+    def test_rows_read_same_as_dict_reader(self, data):
+        expected = list(csv.DictReader(io.StringIO(data), dialect="excel-tab"))
+        rows = list(
+            tripwire.files.TSVManifest(io.StringIO(data)).iter_rows(rules=())
+        )
+        assert [row.row_data for row in rows] == expected
+        assert [dict(row.row_data) for row in rows] == expected
+        assert [list(row.row_data) for row in rows] == [
+            list(row) for row in expected
+        ]
+
+    def test_rows_are_compact(self):
+        test_file = io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+        first, second = tripwire.files.TSVManifest(test_file)
+        assert isinstance(first.row_data, tripwire.files.TableRowData)
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(first.row_data, "__dict__")
+        assert second["Side\n(A/B)"] == "B"
+
+    def test_iter_rows_with_columns(self):
+        manifest = tripwire.files.TSVManifest(
+            io.StringIO("a\tb\tc\tb\n1\t2\t3\t4\n5\t6\n")
+        )
+        rows = list(manifest.iter_rows(columns={"b", "c", "d"}, rules=()))
+        assert [dict(row.row_data) for row in rows] == [
+            {"c": "3", "b": "4"},
+            {"c": None, "b": None},
+        ]
+
+    def test_get_items_match_iter(self, tmp_path):
+        manifest_file = tmp_path / "manifest.tsv"
+        manifest_file.write_text(
+            'name\tnotes\na\t"first\nsecond"\n\né\tcafé\nc\t"x\n\ny"\n',
+            encoding="utf-8",
+        )
+        with manifest_file.open("r", newline="", encoding="utf-8") as fp:
+            manifest = tripwire.files.TSVManifest(fp)
+            rows = list(manifest)
+            position = fp.tell()
+            assert [manifest[i] for i in range(len(manifest))] == rows
+            assert manifest[-1] == rows[-1]
+            assert manifest[0:3] == rows
+            assert manifest[0:3:2] == rows[::2]
+            assert [row.line_number for row in rows] == [3, 5, 8]
+            assert fp.tell() == position
+
+    def test_get_items_reads_file_once(self):
+        test_file = io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+        manifest = tripwire.files.TSVManifest(test_file)
+        assert manifest[0].line_number == 9
+        test_file.readline = Mock(side_effect=test_file.readline)
+        assert manifest[1].line_number == 10
+        # Only the line of the second row is read, once to find it and
+        # once to read it.
+        assert test_file.readline.call_count == 2
+        test_file.readline.reset_mock()
+        assert manifest[0].line_number == 9
+        assert len(manifest) == 2
+        # Reading the first row again seeks straight to its two lines, and
+        # only the end of the file is left to read to count the rows.
+        assert test_file.readline.call_count == 3
+
+    def test_get_header(self):
+        test_file = io.StringIO("a\tb\n1\t2\t3\n")
+        manifest = tripwire.files.TSVManifest(test_file)
+        assert manifest.get_header() == ["a", "b"]
+        assert test_file.tell() == 0
+
+    def test_get_header_without_rows(self):
+        test_file = io.StringIO("a\tb\n")
+        manifest = tripwire.files.TSVManifest(test_file)
+        assert manifest.get_header() is None
+
+    def test_iter_rows_reports_progress(self):
+        data = "File Name\tb\n1\t2\n3\t4\n"
+        progress = []
+        manifest = tripwire.files.TSVManifest(io.StringIO(data))
+        rows = list(manifest.iter_rows(progress_reporter=progress.append))
+        assert [row.line_number for row in rows] == [2, 3]
+        assert sum(progress) == len(data)
+
+    def test_iter_rows_checks_records_in_the_same_pass(self):
+        manifest = tripwire.files.TSVManifest(
+            io.StringIO("File Name\tNotes\na \tx\nb\ty\tz\nc\tw\n")
+        )
+        findings = []
+        read = []
+        for row in manifest.iter_rows(finding_reporter=findings.append):
+            read.append((row.line_number, len(findings)))
+        assert read == [(2, 1), (3, 2), (4, 2)]
+        assert [
+            (finding.level.name, finding.line_number) for finding in findings
+        ] == [("WARNING", 2), ("WARNING", 3)]
+
+    def test_iter_rows_stops_at_record_error(self):
+        class NoBRule(tripwire.files.AbsManifestRowRule):
+            def check_record(self, line_number, values):
+                if values[0] == "b":
+                    yield tripwire.files.Finding(
+                        tripwire.files.ValidationFindingLevel.ERROR,
+                        "b is not allowed",
+                        line_number,
+                    )
+
+        manifest = tripwire.files.TSVManifest(
+            io.StringIO("File Name\na\nb\nc\n")
+        )
+        read = []
+        with pytest.raises(InvalidFileFormat, match="Line: 3"):
+            for row in manifest.iter_rows(
+                rules=[NoBRule], finding_reporter=lambda _: None
+            ):
+                read.append(row.line_number)
+        assert read == [2]
+
+    def test_iter_rows_checks_header_first(self):
+        manifest = tripwire.files.TSVManifest(io.StringIO("Title\nA\n"))
+        with pytest.raises(InvalidFileFormat, match="No column of file"):
+            next(manifest.iter_rows(columns={"Title"}))
+
+    def test_iter_rows_invalid_data(self):
+        test_file = io.TextIOWrapper(
+            io.BytesIO(b"a\tb\n\xff\xfe\n"), encoding="utf-8"
+        )
+        manifest = tripwire.files.TSVManifest(test_file)
+        with pytest.raises(InvalidFileFormat):
+            list(manifest.iter_rows())
+
     def test_is_valid_file_call_TSVManifestReader(self, monkeypatch):
         test_file = io.StringIO("not\tvalid\tfile\n")
         is_valid_file = Mock(name="is_valid_file", return_value=True)
@@ -100,6 +245,163 @@ class TestTSVManifest:
         is_valid_file.assert_called_once_with(fp=test_file)
 
 
+def create_xlsx(rows):
+    """Create an .xlsx workbook, with the first column as inline strings."""
+    shared_strings = []
+    sheet_rows = []
+    for row_number, row in enumerate(rows, start=1):
+        cells = []
+        for column, value in enumerate(row):
+            if not value:
+                continue
+            reference = f"{chr(ord('A') + column)}{row_number}"
+            if column == 0:
+                cells.append(
+                    f'<c r="{reference}" t="inlineStr">'
+                    f"<is><t>{escape(value)}</t></is></c>"
+                )
+            elif value.isdigit():
+                cells.append(f'<c r="{reference}"><v>{value}</v></c>')
+            else:
+                shared_strings.append(value)
+                cells.append(
+                    f'<c r="{reference}" t="s">'
+                    f"<v>{len(shared_strings) - 1}</v></c>"
+                )
+        sheet_rows.append(f'<row r="{row_number}">{"".join(cells)}</row>')
+    main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    relationships = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    )
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w", zipfile.ZIP_DEFLATED) as workbook:
+        workbook.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{main}" xmlns:r="{relationships}"><sheets>'
+            '<sheet name="Manifest" sheetId="1" r:id="rId1"/>'
+            "</sheets></workbook>",
+        )
+        workbook.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/'
+            'package/2006/relationships">'
+            '<Relationship Id="rId1" Type="{0}/worksheet" '
+            'Target="worksheets/manifest.xml"/>'
+            '<Relationship Id="rId2" Type="{0}/sharedStrings" '
+            'Target="sharedStrings.xml"/>'
+            "</Relationships>".format(relationships),
+        )
+        workbook.writestr(
+            "xl/worksheets/manifest.xml",
+            f'<worksheet xmlns="{main}"><sheetData>'
+            f"{''.join(sheet_rows)}</sheetData></worksheet>",
+        )
+        workbook.writestr(
+            "xl/sharedStrings.xml",
+            f'<sst xmlns="{main}">'
+            + "".join(
+                f"<si><t>{escape(value)}</t></si>" for value in shared_strings
+            )
+            + "</sst>",
+        )
+    data.seek(0)
+    return data
+
+
+def sample_audio_manifest_xlsx():
+    return create_xlsx(
+        csv.reader(
+            io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA),
+            dialect="excel-tab",
+        )
+    )
+
+
+class TestXLSXManifest:
+    def test_rows_match_tsv(self):
+        tsv_rows = list(
+            tripwire.files.TSVManifest(
+                io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+            )
+        )
+        xlsx_rows = list(
+            tripwire.files.XLSXManifest(sample_audio_manifest_xlsx())
+        )
+        assert len(xlsx_rows) == len(tsv_rows) == 2
+        for xlsx_row, tsv_row in zip(xlsx_rows, tsv_rows):
+            assert xlsx_row.row_data == {
+                key: value for key, value in tsv_row.row_data.items() if key
+            }
+
+    def test_line_number_is_row_number(self):
+        rows = tripwire.files.XLSXManifest(sample_audio_manifest_xlsx())
+        assert [row.line_number for row in rows] == [2, 3]
+
+    def test_get_header(self):
+        header = tripwire.files.XLSXManifest(
+            sample_audio_manifest_xlsx()
+        ).get_header()
+        assert header[:3] == ["Housing Title", "Cassette\nNo. ", "Side\n(A/B)"]
+
+    def test_get_header_keeps_position(self):
+        fp = sample_audio_manifest_xlsx()
+        tripwire.files.XLSXManifest(fp).get_header()
+        assert fp.tell() == 0
+
+    def test_skips_empty_rows(self):
+        rows = tripwire.files.XLSXManifest(
+            create_xlsx([["File"], [], ["a"], ["", ""], ["b"]])
+        )
+        assert [(row.line_number, row["File"]) for row in rows] == [
+            (3, "a"),
+            (5, "b"),
+        ]
+
+    def test_iter_rows_reports_progress(self):
+        fp = sample_audio_manifest_xlsx()
+        progress_reporter = Mock()
+        list(tripwire.files.XLSXManifest(fp).iter_rows(progress_reporter))
+        assert progress_reporter.called
+
+    def test_iter_rows_checks_records(self):
+        fp = create_xlsx(
+            [["File Name", "Notes"], ["a", "x"], ["a", "y"], ["b", "z", "!"]]
+        )
+        findings = []
+        rows = tripwire.files.XLSXManifest(fp).iter_rows(
+            finding_reporter=findings.append
+        )
+        assert [row.line_number for row in rows] == [2, 3, 4]
+        assert [
+            (finding.level.name, finding.line_number) for finding in findings
+        ] == [("WARNING", 3), ("WARNING", 4)]
+
+    def test_iter_rows_invalid_data(self):
+        manifest = tripwire.files.XLSXManifest(io.BytesIO(b"not a workbook"))
+        with pytest.raises(InvalidFileFormat):
+            list(manifest.iter_rows())
+
+
+def test_open_manifest_xlsx(tmp_path):
+    manifest = tmp_path / "audio.xlsx"
+    manifest.write_bytes(sample_audio_manifest_xlsx().getvalue())
+    with tripwire.files.open_manifest(manifest) as fp:
+        assert isinstance(
+            tripwire.files.get_manifest_table(fp), tripwire.files.XLSXManifest
+        )
+        assert isinstance(
+            tripwire.manifest_check.get_manifest_type(fp),
+            tripwire.manifest_check.AudioManifest,
+        )
+
+
+def test_open_manifest_tsv(tmp_path):
+    manifest = tmp_path / "audio.tsv"
+    manifest.write_text(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+    with tripwire.files.open_manifest(manifest) as fp:
+        assert isinstance(
+            tripwire.files.get_manifest_table(fp), tripwire.files.TSVManifest
+        )
 
 
 class Test_TSVManifestReader:
@@ -291,16 +593,27 @@ class TestManifestTSVAbsFileValidator:
         assert len(validator.get_validation_findings()) == 0
 
     @pytest.mark.parametrize(
-        "data",
+        "data, expected",
         [
-            sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA,
-            sample_data.SAMPLE_VIDEO_MANIFEST_TSV_DATA,
+            (
+                sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA,
+                {
+                    tripwire.files.Finding(
+                        tripwire.files.ValidationFindingLevel.WARNING,
+                        'Whitespace around "3503082_series17_box33_folder1_'
+                        'label1 thru label29" in column "Photograph '
+                        'Filenames (JPEG)"',
+                        line_number=9,
+                    )
+                },
+            ),
+            (sample_data.SAMPLE_VIDEO_MANIFEST_TSV_DATA, set()),
         ],
     )
-    def test_valid_file(self, data):
+    def test_valid_file(self, data, expected):
         test_file = io.StringIO(data)
         validator = tripwire.files.ManifestTSVAbsFileValidator(test_file)
-        assert len(validator.get_validation_findings()) == 0
+        assert validator.get_validation_findings() == expected
 
     def test_invalid_file(self):
         validator = tripwire.files.ManifestTSVAbsFileValidator(io.StringIO(""))
@@ -318,6 +631,108 @@ class TestManifestTSVAbsFileValidator:
         assert len(validator.get_validation_findings()) == 1
 
 
+class TestIterManifestTSVFindings:
+    @staticmethod
+    def findings(data, **kwargs):
+        return [
+            (finding.level.name, finding.line_number, finding.message)
+            for finding in tripwire.files.iter_manifest_tsv_findings(
+                io.StringIO(data), **kwargs
+            )
+        ]
+
+    def test_column_counts(self):
+        data = "File Name\tNotes\t\nA\nB\tb\t\nC\tc\t\tc\n"
+        assert self.findings(data) == [
+            ("WARNING", 2, "Found 1 values but the header has 2 columns"),
+            (
+                "WARNING",
+                4,
+                "Found 4 values but the header only has 3 columns",
+            ),
+        ]
+
+    def test_file_names(self):
+        data = "Preservation File Name\tAccess File Name\na\ta \n\tb\na\tc\n"
+        assert self.findings(data) == [
+            (
+                "WARNING",
+                2,
+                'Whitespace around "a" in column "Access File Name"',
+            ),
+            ("WARNING", 3, 'No value in column "Preservation File Name"'),
+            (
+                "WARNING",
+                4,
+                '"a" in column "Preservation File Name" is also on line 2',
+            ),
+        ]
+
+    def test_undecodable_bytes(self):
+        test_file = io.TextIOWrapper(
+            io.BytesIO(b"File Name\tNotes\nA\t\xff\nB\tb\t\tb\n"),
+            encoding="utf-8",
+            newline="",
+        )
+        findings = list(tripwire.files.iter_manifest_tsv_findings(test_file))
+        assert [
+            (finding.level.name, finding.line_number) for finding in findings
+        ] == [("ERROR", 2), ("WARNING", 3)]
+        assert findings[0].message.startswith("Unable to read text as utf-8")
+        assert test_file.tell() == 0
+
+    def test_not_text(self):
+        findings = tripwire.files.iter_manifest_tsv_findings(
+            io.BytesIO(b"bad data")
+        )
+        assert list(findings) == [
+            tripwire.files.Finding(
+                tripwire.files.ValidationFindingLevel.ERROR,
+                tripwire.files.INVALID_MANIFEST_TSV_ERROR_MESSAGE,
+            )
+        ]
+
+    def test_no_rows(self):
+        assert self.findings("File Name\n") == [
+            ("WARNING", None, "No rows in the file.")
+        ]
+
+    def test_no_file_name_column(self):
+        assert self.findings("Title\nA\n") == [
+            ("ERROR", None, "No column of file names in the header")
+        ]
+
+    def test_rules_check_each_record_in_turn(self):
+        checked = []
+
+        class RecordingRule(tripwire.files.AbsManifestRowRule):
+            def check_record(self, line_number, values):
+                checked.append((type(self).__name__, line_number))
+                return ()
+
+        class OtherRule(RecordingRule):
+            pass
+
+        assert (
+            self.findings("Title\nA\nB\n", rules=[RecordingRule, OtherRule])
+            == []
+        )
+        assert checked == [
+            ("RecordingRule", 2),
+            ("OtherRule", 2),
+            ("RecordingRule", 3),
+            ("OtherRule", 3),
+        ]
+
+
+def test_is_valid_file_logs_line_numbers(caplog):
+    test_file = io.StringIO("File Name\tNotes\nA\tb\tc\n")
+    assert tripwire.files.TSVManifest(test_file).is_valid_file() is True
+    assert [record.message for record in caplog.records] == [
+        "Line: 2. Found 3 values but the header only has 2 columns"
+    ]
+
+
 @pytest.mark.parametrize(
     "data",
     [
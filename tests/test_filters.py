@@ -0,0 +1,76 @@
+import pytest
+
+from uiucprescon.tripwire import filters
+
+
+@pytest.mark.parametrize(
+    "exclude, relative_path, expected",
+    [
+        (("scratch",), "scratch", True),
+        (("scratch",), "a/b/scratch", True),
+        (("scratch/",), "a/scratch", True),
+        (("/scratch",), "a/scratch", False),
+        (("a/*",), "a/scratch", True),
+        (("a/*",), "b/a/scratch", False),
+        (("*.tmp",), "a/keep", False),
+    ],
+)
+def test_is_directory_excluded(exclude, relative_path, expected):
+    path_filter = filters.PathFilter(exclude=exclude)
+    assert path_filter.is_directory_excluded(relative_path) is expected
+
+
+@pytest.mark.parametrize(
+    "include, exclude, relative_path, expected",
+    [
+        ((), (), "a/file.wav", True),
+        ((), ("*.tmp",), "a/file.tmp", False),
+        ((), ("a/",), "a", True),
+        (("*.wav",), (), "a/file.wav", True),
+        (("*.wav",), (), "a/file.mov", False),
+        (("*.wav",), ("file*",), "a/file.wav", False),
+        ((), (".DS_Store",), "./a/.DS_Store", False),
+    ],
+)
+def test_is_file_included(include, exclude, relative_path, expected):
+    path_filter = filters.PathFilter(include=include, exclude=exclude)
+    assert path_filter.is_file_included(relative_path) is expected
+
+
+def test_is_path_included_checks_parent_directories():
+    path_filter = filters.PathFilter(exclude=("scratch",))
+    assert path_filter.is_path_included("a/scratch/file.wav") is False
+    assert path_filter.is_path_included("a/keep/file.wav") is True
+
+
+def test_prune():
+    path_filter = filters.PathFilter(exclude=("scratch", "a/tmp"))
+    directories = ["scratch", "tmp", "keep"]
+    path_filter.prune("a", directories)
+    assert directories == ["keep"]
+
+
+def test_empty_filter_is_false():
+    assert not filters.PathFilter()
+    assert filters.PathFilter(exclude=("*.tmp",))
+
+
+def test_load_path_filter_reads_ignore_file(tmp_path):
+    (tmp_path / filters.IGNORE_FILE_NAME).write_text(
+        "# scratch space\n\nscratch/\n*.tmp\n"
+    )
+    path_filter = filters.load_path_filter(
+        tmp_path, include=["*.wav"], exclude=["Thumbs.db"]
+    )
+    assert path_filter.include == ("*.wav",)
+    assert path_filter.exclude == (
+        "Thumbs.db",
+        f"/{filters.IGNORE_FILE_NAME}",
+        "scratch/",
+        "*.tmp",
+    )
+    assert not path_filter.is_file_included(filters.IGNORE_FILE_NAME)
+
+
+def test_load_path_filter_without_ignore_file(tmp_path):
+    assert filters.load_path_filter(tmp_path) == filters.PathFilter()
@@ -0,0 +1,84 @@
+import gzip
+import pathlib
+
+import pytest
+
+from uiucprescon.tripwire import inventory, manifest_check
+
+
+def test_text_inventory(tmp_path):
+    inventory_file = tmp_path / "listing.txt"
+    inventory_file.write_text(
+        "./share/film/file1.mov\n./share/film/sub/file2.mov\n"
+        "./share/audio/file3.wav\n\n"
+    )
+    assert list(
+        inventory.iter_inventory_paths(
+            inventory_file, pathlib.Path("share/film")
+        )
+    ) == [
+        pathlib.Path("share/film/file1.mov"),
+        pathlib.Path("share/film/sub/file2.mov"),
+    ]
+
+
+def test_gzip_inventory(tmp_path):
+    inventory_file = tmp_path / "listing.txt.gz"
+    with gzip.open(inventory_file, "wt") as fp:
+        fp.write("/mnt/share/file1.mov\n")
+    assert list(
+        inventory.iter_inventory_paths(inventory_file, pathlib.Path("/mnt"))
+    ) == [pathlib.Path("/mnt/share/file1.mov")]
+
+
+@pytest.mark.parametrize("name", ["listing.txt", "listing.csv"])
+def test_inventory_not_utf8(tmp_path, name):
+    inventory_file = tmp_path / name
+    inventory_file.write_bytes(b"/mnt/share/file1.mov\n/mnt/\xff\xfe.mov\n")
+    with pytest.raises(inventory.InventoryError):
+        list(inventory.iter_inventory_paths(inventory_file, pathlib.Path("/")))
+
+
+def test_zstd_inventory_without_support(tmp_path, monkeypatch):
+    inventory_file = tmp_path / "listing.txt.zst"
+    inventory_file.write_bytes(inventory.ZSTD_MAGIC + b"\x00\x00")
+
+    def no_zstd(fp):
+        raise inventory.InventoryError("no zstd")
+
+    monkeypatch.setattr(inventory, "_open_zstd", no_zstd)
+    with pytest.raises(inventory.InventoryError):
+        inventory.open_inventory(inventory_file)
+
+
+def test_csv_inventory_with_header(tmp_path):
+    inventory_file = tmp_path / "inventory.csv"
+    inventory_file.write_text(
+        "Size,Path\n10,film/file1.mov\n20,film/a b.mov\n"
+    )
+    assert list(
+        inventory.iter_inventory_paths(inventory_file, pathlib.Path("film"))
+    ) == [pathlib.Path("film/file1.mov"), pathlib.Path("film/a b.mov")]
+
+
+def test_csv_s3_inventory(tmp_path):
+    inventory_file = tmp_path / "inventory.csv.gz"
+    with gzip.open(inventory_file, "wt") as fp:
+        fp.write(
+            '"bucket","film/file1.mov","10"\n"bucket","film/a%20b.mov","20"\n'
+        )
+    assert list(
+        inventory.iter_inventory_paths(inventory_file, pathlib.Path("film"))
+    ) == [pathlib.Path("film/file1.mov"), pathlib.Path("film/a b.mov")]
+
+
+def test_inventory_file_search_used_by_package_scanner(tmp_path):
+    inventory_file = tmp_path / "listing.txt"
+    inventory_file.write_text("package/sub/file1.mov\n")
+    scanner = manifest_check.PackageScanner(
+        pathlib.Path("package"),
+        scanner_klass=lambda root: manifest_check.InventoryFileSearch(
+            root, inventory_file
+        ),
+    )
+    assert scanner.locate("file1.mov") == pathlib.Path("package/sub/file1.mov")
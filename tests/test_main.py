@@ -3,6 +3,7 @@ from unittest.mock import Mock
 import pytest
 from uiucprescon.tripwire import main
 import argparse
+import zipfile
 
 @pytest.mark.parametrize(
     "cli_args,expected_subcommand", [(["get-hash", "value"], "get-hash")]
@@ -42,7 +43,8 @@ def test_metadata_validate_command():
     args = argparse.Namespace(
         verbosity=0,
         glob="/Users/dummy/Movies/*.mov",
-        policy_file="/Users/dummy/policy.xml"
+        policy_file="/Users/dummy/policy.xml",
+        jobs=1,
     )
     mock_validate_strategy = Mock()
     main.metadata_validate_command(
@@ -51,5 +53,52 @@ def test_metadata_validate_command():
     )
     mock_validate_strategy.assert_called_once_with(
         args.glob,
-        policy_xml_file=args.policy_file
-    )
\ No newline at end of file
+        policy_xml_file=args.policy_file,
+        jobs=args.jobs,
+    )
+
+@pytest.mark.parametrize(
+    "cli_args",
+    [
+        ["copy-verify", "--jobs", "0", "source", "destination"],
+        ["copy-verify", "--jobs", "-1", "source", "destination"],
+        ["validate-checksums", "--jobs", "0", "sample.zip"],
+        ["manifest-check", "--jobs", "0", "manifest.tsv", "search_path"],
+        [
+            "manifest-check",
+            "--scan-threads",
+            "0",
+            "manifest.tsv",
+            "search_path",
+        ],
+        ["metadata", "validate", "--jobs", "0", "policy.xml", "*.mov"],
+        ["manifest-check-batch", "--jobs", "0", "root"],
+        ["metadata", "show", "--jobs", "0", "*.mov"],
+    ],
+)
+def test_jobs_must_be_positive(cli_args):
+    with pytest.raises(SystemExit) as e:
+        main.get_arg_parser()[0].parse_args(cli_args)
+    assert e.value.code == 2
+
+
+def test_validate_checksums_command_archive_options(tmp_path, caplog):
+    archive_file = tmp_path / "sample.zip"
+    with zipfile.ZipFile(archive_file, "w") as zip_file:
+        zip_file.writestr("file1.wav", b"abcdef")
+        zip_file.writestr("file1.wav.md5", "e80b5017098950fc58aad83c8c14978e")
+        zip_file.writestr("file2.wav", b"abcdef")
+        zip_file.writestr("file2.wav.md5", "bad")
+    args = main.get_arg_parser()[0].parse_args(
+        [
+            "validate-checksums",
+            "--hashing-backend",
+            "kernel",
+            "--exclude",
+            "file2.wav.md5",
+            str(archive_file),
+        ]
+    )
+    main.validate_checksums_command(args)
+    assert "file1.wav - Checksum matched" in caplog.text
+    assert "file2.wav" not in caplog.text
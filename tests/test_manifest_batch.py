@@ -0,0 +1,146 @@
+import concurrent.futures
+import functools
+import logging
+import pathlib
+
+import pytest
+
+from uiucprescon.tripwire import manifest_batch, manifest_check
+import sample_data
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "processing"
+    package_a = root / "package_a"
+    (package_a / "sub").mkdir(parents=True)
+    (package_a / "audio.tsv").write_text(
+        sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA
+    )
+    (package_a / "sub" / "3503082_series17_box33_folder1_tape1_A_acc.mp3").write_text("")
+    (package_a / "sub" / "extra.txt").write_text("")
+    package_b = root / "group" / "package_b"
+    package_b.mkdir(parents=True)
+    (package_b / "film.tsv").write_text(
+        sample_data.SAMPLE_FILM_MANIFEST_TSV_DATA
+    )
+    (root / "group" / "notes.tsv").write_text("not\ta manifest\n")
+    return root
+
+
+def test_find_packages(root):
+    assert list(manifest_batch.find_packages(root)) == [
+        manifest_batch.Package(
+            path=root / "group" / "package_b",
+            manifests=(root / "group" / "package_b" / "film.tsv",),
+        ),
+        manifest_batch.Package(
+            path=root / "package_a",
+            manifests=(root / "package_a" / "audio.tsv",),
+        ),
+    ]
+
+
+def test_find_packages_does_not_search_inside_packages(root):
+    (root / "package_a" / "sub" / "audio.tsv").write_text(
+        sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA
+    )
+    assert [
+        package.path for package in manifest_batch.find_packages(root)
+    ] == [root / "group" / "package_b", root / "package_a"]
+
+
+def test_check_package(root):
+    package = manifest_batch.Package(
+        path=root / "package_a", manifests=(root / "package_a" / "audio.tsv",)
+    )
+    result = manifest_batch.check_package(
+        package, file_search_strategy=manifest_check.ConcurrentFileSearch
+    )
+    assert result.error is None
+    assert result.has_issues
+    assert "3503082_series17_box33_folder1_tape1_A_acc.mp3" not in [
+        missing.file for missing in result.missing
+    ]
+    assert [unexpected.file for unexpected in result.unexpected] == [
+        "extra.txt"
+    ]
+
+
+def test_check_package_with_exclude(root):
+    package = manifest_batch.Package(
+        path=root / "package_a", manifests=(root / "package_a" / "audio.tsv",)
+    )
+    result = manifest_batch.check_package(
+        package,
+        exclude=("*.txt",),
+        file_search_strategy=manifest_check.ConcurrentFileSearch,
+    )
+    assert result.unexpected == ()
+
+
+def test_check_packages_in_worker_processes(root):
+    results = list(
+        manifest_batch.check_packages(
+            manifest_batch.find_packages(root),
+            jobs=2,
+            check_package_strategy=functools.partial(
+                manifest_batch.check_package,
+                file_search_strategy=manifest_check.ConcurrentFileSearch,
+            ),
+            executor_factory=concurrent.futures.ProcessPoolExecutor,
+        )
+    )
+    assert sorted(result.package.path for result in results) == [
+        root / "group" / "package_b",
+        root / "package_a",
+    ]
+
+
+def test_manifest_check_batch_command(root, caplog):
+    caplog.set_level(logging.INFO)
+
+    def check_packages(packages, jobs, check_package_strategy):
+        for package in packages:
+            yield manifest_batch.PackageCheckResult(
+                package=package,
+                error="bad" if package.path.name == "package_a" else None,
+            )
+
+    assert (
+        manifest_batch.manifest_check_batch_command(
+            root, check_packages_strategy=check_packages
+        )
+        is False
+    )
+    assert "Checked 2 package(s)" in caplog.text
+    assert "package_a - Unable to check" in caplog.text
+    assert "1 of 2 package(s) have issues." in caplog.text
+
+
+def test_format_package_details(root):
+    package = manifest_batch.Package(
+        path=root / "package_a", manifests=(root / "package_a" / "audio.tsv",)
+    )
+    result = manifest_batch.PackageCheckResult(
+        package=package,
+        missing=(
+            manifest_check.ManifestCheckResult(
+                status=manifest_check.ManifestCheckStatus.MISSING,
+                file="a.wav",
+                line_number=3,
+            ),
+        ),
+        unexpected=(
+            manifest_check.ManifestCheckResult(
+                status=manifest_check.ManifestCheckStatus.UNEXPECTED,
+                file="extra.txt",
+                location=package.path / "sub" / "extra.txt",
+            ),
+        ),
+    )
+    assert manifest_batch.format_package_details(result, root) == (
+        "package_a:\n"
+        "  Line: 3. Unable to locate: a.wav\n"
+        f"  Not included in manifest: {pathlib.Path('sub', 'extra.txt')}"
+    )
@@ -1,10 +1,15 @@
+import csv
+import hashlib
 import io
+import os
 import pathlib
+import sqlite3
+import tracemalloc
 from unittest.mock import Mock, MagicMock
 
 import pytest
 
-from uiucprescon.tripwire import manifest_check
+from uiucprescon.tripwire import filters, manifest_check, validation
 from uiucprescon.tripwire.files import TSVManifest
 from uiucprescon.tripwire.exceptions import InvalidFileFormat
 import sample_data
@@ -44,6 +49,62 @@ def test_locate_manifest_files_invalid_file_format(monkeypatch):
         )
 
 
+def test_find_manifest_files(tmp_path):
+    (tmp_path / "manifests").mkdir()
+    (tmp_path / "manifests" / "b.tsv").write_text("")
+    (tmp_path / "manifests" / "a.tsv").write_text("")
+    (tmp_path / "manifests" / "notes.txt").write_text("")
+    (tmp_path / "other.tsv").write_text("")
+    assert manifest_check.find_manifest_files(
+        [tmp_path / "manifests", tmp_path / "other.tsv"],
+        is_manifest_strategy=lambda _: True,
+    ) == [
+        tmp_path / "manifests" / "a.tsv",
+        tmp_path / "manifests" / "b.tsv",
+        tmp_path / "other.tsv",
+    ]
+
+
+def test_find_manifest_files_skips_files_that_are_not_manifests(
+    tmp_path, caplog
+):
+    (tmp_path / "audio.tsv").write_text(
+        sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA
+    )
+    (tmp_path / "notes.tsv").write_text("a\tb\n1\t2\n")
+    assert manifest_check.find_manifest_files([tmp_path]) == [
+        tmp_path / "audio.tsv"
+    ]
+    assert "notes.tsv. It is not a manifest." in caplog.text
+
+
+def test_locate_files_in_manifests_searches_once(tmp_path, caplog):
+    audio_manifest = tmp_path / "audio.tsv"
+    audio_manifest.write_text(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+    film_manifest = tmp_path / "film.tsv"
+    film_manifest.write_text(sample_data.SAMPLE_FILM_MANIFEST_TSV_DATA)
+    search_path = pathlib.Path("package")
+    file_search_strategy = Mock(
+        return_value=iter(
+            [
+                search_path / "3503082_series17_box33_folder1_tape1_A_acc.mp3",
+                search_path / "2803015_film1of5_UIUCvUSC_FB_Sept1989_acc.mp4",
+                search_path / "extra.txt",
+            ]
+        )
+    )
+    manifest_check.locate_files_in_manifests(
+        [audio_manifest, film_manifest],
+        search_path,
+        file_search_strategy=file_search_strategy,
+    )
+    file_search_strategy.assert_called_once_with(search_path)
+    assert [record.getMessage() for record in caplog.records][-2:] == [
+        "Files found that were not included in any manifest: ",
+        "* extra.txt",
+    ]
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -62,7 +123,12 @@ def test_locate_manifest_files_fp(monkeypatch, data):
     )
     row_parser = manifest_check.get_manifest_type(fp=manifest_tsv)
     manifest_check.locate_manifest_files_fp(
-        manifest_tsv, search_path, row_parser
+        manifest_tsv,
+        search_path,
+        row_parser,
+        scanner=manifest_check.PackageScanner(
+            search_path, scanner_klass=Mock(return_value=iter([]))
+        ),
     )
 
     locate_missing_files.assert_called()
@@ -82,6 +148,65 @@ def test_locate_manifest_files_fp_with_invalid_file(monkeypatch):
         )
 
 
+def test_locate_files_in_manifests_checks_record_with_extra_value(
+    tmp_path, capsys
+):
+    records = list(
+        csv.reader(
+            io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA),
+            dialect="excel-tab",
+        )
+    )
+    header, _, second_record, *_ = records
+    second_record += [""] * (len(header) - len(second_record)) + ["extra"]
+    manifest = tmp_path / "audio.tsv"
+    with manifest.open("w", newline="") as fp:
+        csv.writer(fp, dialect="excel-tab", lineterminator="\n").writerows(
+            records
+        )
+    manifest_check.locate_files_in_manifests(
+        [manifest],
+        pathlib.Path("package"),
+        file_search_strategy=Mock(return_value=iter([])),
+    )
+    output = capsys.readouterr().out
+    assert (
+        "Line: 10. Found 27 values but the header only has 26 columns"
+        in output
+    )
+    assert (
+        "Line: 10. Unable to locate: "
+        "3503082_series17_box33_folder1_tape1_B_acc.mp3.md5" in output
+    )
+
+
+def test_locate_manifest_files_fp_reads_once(monkeypatch):
+    manifest_tsv = io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+    manifest_type = manifest_check.get_manifest_type(fp=manifest_tsv)
+    seek = Mock(wraps=manifest_tsv.seek)
+    monkeypatch.setattr(manifest_tsv, "seek", seek)
+    search_path = pathlib.Path("package")
+    manifest_check.locate_manifest_files_fp(
+        manifest_tsv,
+        search_path,
+        manifest_type,
+        scanner=manifest_check.PackageScanner(
+            search_path, scanner_klass=Mock(return_value=iter([]))
+        ),
+    )
+    seek.assert_not_called()
+    assert manifest_tsv.read() == ""
+
+
+def test_get_remaining_size(tmp_path):
+    manifest = tmp_path / "manifest.tsv"
+    manifest.write_text("a\tb\n1\t2\n")
+    with manifest.open("r") as fp:
+        fp.readline()
+        assert manifest_check.get_remaining_size(fp) == 4
+    assert manifest_check.get_remaining_size(io.StringIO("a")) is None
+
+
 def test_locate_missing_files():
     search_package = manifest_check.SearchPackage(
         preservation_file="somepresfile.wav",
@@ -112,53 +237,194 @@ class TestRecursiveFileSearch:
 class TestPackageScanner:
     def test_file_not_located_is_none(self):
         root = pathlib.Path("somepath")
-        scanner = manifest_check.PackageScanner(search_path=root)
+        scanner = manifest_check.PackageScanner(
+            search_path=root, scanner_klass=Mock(return_value=iter([]))
+        )
         assert scanner.locate("some file") is None
 
     def test_file_located(self):
         root = pathlib.Path("somepath")
-        mock_scanner = MagicMock(
-            name="Scanner",
+        scanner = manifest_check.PackageScanner(
+            search_path=root,
+            scanner_klass=Mock(return_value=iter([root / "some file"])),
         )
-        a = Mock()
-        a.name = "some file"
-        mock_scanner.__next__.side_effect = [a, StopIteration]
-        manifest_check.PackageScanner.scanner_klass = Mock(
-            return_value=mock_scanner
+        assert scanner.locate("some file") == root / "some file"
+
+    def test_index_is_built_once(self):
+        root = pathlib.Path("somepath")
+        scanner_klass = Mock(
+            return_value=iter([root / "file1.txt", root / "file2.txt"])
         )
-        scanner = manifest_check.PackageScanner(search_path=root)
-        assert scanner.locate("some file") is not None
+        scanner = manifest_check.PackageScanner(
+            search_path=root, scanner_klass=scanner_klass
+        )
+        assert scanner.locate("file2.txt") is not None
+        assert scanner.locate("file1.txt") is not None
+        scanner_klass.assert_called_once_with(root)
 
-    def test_locate_uses_cache(self):
+    def test_unexpected_files_covers_whole_tree(self):
         root = pathlib.Path("somepath")
-        scanner = manifest_check.PackageScanner(search_path=root)
-        d = {
-            "some file.txt": manifest_check.PackageScanner.Cache(
-                file_name="some file.txt",
-                location=pathlib.Path("somepath") / "some location",
-            )
+        scanner = manifest_check.PackageScanner(
+            search_path=root,
+            scanner_klass=Mock(
+                return_value=iter(
+                    [root / "expected.txt", root / "sub" / "extra.txt"]
+                )
+            ),
+        )
+        scanner.locate("expected.txt")
+        assert list(scanner.unexpected_files()) == [root / "sub" / "extra.txt"]
+
+    def test_duplicate_files(self):
+        root = pathlib.Path("somepath")
+        scanner = manifest_check.PackageScanner(
+            search_path=root,
+            scanner_klass=Mock(
+                return_value=iter(
+                    [
+                        root / "a" / "same.txt",
+                        root / "b" / "same.txt",
+                        root / "a" / "other.txt",
+                        root / "b" / "other.txt",
+                    ]
+                )
+            ),
+        )
+        scanner.locate("same.txt")
+        assert scanner.duplicate_files() == {
+            "same.txt": [root / "a" / "same.txt", root / "b" / "same.txt"]
         }
-        scanner.cache = MagicMock()
-        scanner.cache.__getitem__.side_effect = d.__getitem__
-        scanner.cache.__contains__.side_effect = d.__contains__
-        scanner.locate("some file.txt")
-        scanner.cache.__getitem__.assert_called_with("some file.txt")
+
+
+class TestFileIndex:
+    def test_locate_all_locations(self):
+        index = manifest_check.FileIndex.build(
+            [pathlib.Path("a") / "file.txt", pathlib.Path("b") / "file.txt"]
+        )
+        assert index.locate("file.txt") == [
+            pathlib.Path("a") / "file.txt",
+            pathlib.Path("b") / "file.txt",
+        ]
+        assert index.contains_file(pathlib.Path("a") / "file.txt")
+
+    def test_remove(self):
+        index = manifest_check.FileIndex.build(
+            [pathlib.Path("a") / "file.txt", pathlib.Path("b") / "file.txt"]
+        )
+        index.remove(pathlib.Path("a") / "file.txt")
+        assert index.locate("file.txt") == [pathlib.Path("b") / "file.txt"]
+        assert not index.contains_file(pathlib.Path("a") / "file.txt")
+        assert len(index) == 1
+        index.add(pathlib.Path("a") / "file.txt")
+        assert index.locate("file.txt") == [
+            pathlib.Path("b") / "file.txt",
+            pathlib.Path("a") / "file.txt",
+        ]
+
+    def test_remove_keeps_other_locations_linked(self):
+        index = manifest_check.FileIndex.build(
+            pathlib.Path(directory) / "Thumbs.db" for directory in "abcd"
+        )
+        index.remove(pathlib.Path("b") / "Thumbs.db")
+        index.remove(pathlib.Path("d") / "Thumbs.db")
+        index.add(pathlib.Path("e") / "Thumbs.db")
+        assert index.locate("Thumbs.db") == [
+            pathlib.Path("a") / "Thumbs.db",
+            pathlib.Path("c") / "Thumbs.db",
+            pathlib.Path("e") / "Thumbs.db",
+        ]
+        assert index.contains_file(pathlib.Path("c") / "Thumbs.db")
+        assert not index.contains_file(pathlib.Path("d") / "Thumbs.db")
 
     def test_unexpected_files(self):
-        root = pathlib.Path("somepath")
-        scanner = manifest_check.PackageScanner(search_path=root)
-        d = {
-            "some file.txt": manifest_check.PackageScanner.Cache(
-                file_name="some file.txt",
-                location=pathlib.Path("somepath") / "some location",
-                expected=False,
-            )
+        index = manifest_check.FileIndex.build(
+            [pathlib.Path("a") / "file.txt", pathlib.Path("a") / "extra.txt"]
+        )
+        index.mark_expected("file.txt")
+        assert list(index.unexpected_files()) == [
+            pathlib.Path("a") / "extra.txt"
+        ]
+
+    def test_unexpected_files_sorted(self):
+        index = manifest_check.FileIndex.build(
+            [
+                pathlib.Path("b") / "z.txt",
+                pathlib.Path("a") / "x.txt",
+                pathlib.Path("b") / "y.txt",
+            ]
+        )
+        assert list(index.unexpected_files()) == [
+            pathlib.Path("a") / "x.txt",
+            pathlib.Path("b") / "y.txt",
+            pathlib.Path("b") / "z.txt",
+        ]
+
+    def test_remove_and_add_many_files_with_the_same_name(self):
+        files = [
+            pathlib.Path(f"dir{number}") / "Thumbs.db" for number in range(100)
+        ]
+        index = manifest_check.FileIndex.build(files)
+        for file_path in files[::2]:
+            index.remove(file_path)
+        assert not any(index.contains_file(f) for f in files[::2])
+        assert all(index.contains_file(f) for f in files[1::2])
+        for file_path in files[::2]:
+            index.add(file_path)
+        assert all(index.contains_file(f) for f in files)
+        assert len(index) == len(files) == len(index.locate("Thumbs.db"))
+
+    def test_size_of_each_file(self):
+        files = [
+            pathlib.Path(f"dir{directory}") / f"file{name}.wav"
+            for directory in range(100)
+            for name in range(100)
+        ]
+        for file_path in files:
+            os.fspath(file_path)
+        tracemalloc.start()
+        try:
+            index = manifest_check.FileIndex.build(files)
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(index) == len(files)
+        # The directories and names are shared, so what is left are the
+        # arrays of each file and the hash table used to look them up.
+        assert size / len(files) < 48
+
+    def test_add_is_idempotent(self):
+        index = manifest_check.FileIndex.build(
+            [pathlib.Path("a") / "file.txt", pathlib.Path("a") / "file.txt"]
+        )
+        assert len(index) == 1
+        assert list(index.names()) == ["file.txt"]
+
+    def test_duplicate_files_expected_only(self):
+        index = manifest_check.FileIndex.build(
+            [
+                pathlib.Path("a") / "file.txt",
+                pathlib.Path("b") / "file.txt",
+                pathlib.Path("a") / "other.txt",
+                pathlib.Path("b") / "other.txt",
+            ]
+        )
+        index.mark_expected("file.txt")
+        assert index.duplicate_files(expected_only=True) == {
+            "file.txt": [
+                pathlib.Path("a") / "file.txt",
+                pathlib.Path("b") / "file.txt",
+            ]
         }
-        scanner.cache = MagicMock()
-        scanner.cache.__getitem__.side_effect = d.__getitem__
-        scanner.cache.__contains__.side_effect = d.__contains__
-        scanner.cache.items = d.items
-        assert "some file.txt" not in scanner.unexpected_files()
+        assert len(index.duplicate_files()) == 2
+
+
+def test_report_duplicate_files(caplog):
+    root = pathlib.Path("somepath")
+    manifest_check.report_duplicate_files(
+        {"same.txt": [root / "b" / "same.txt", root / "a" / "same.txt"]}, root
+    )
+    assert "more than one location" in caplog.text
+    assert caplog.text.index("a/same.txt") < caplog.text.index("b/same.txt")
 
 
 class TestAbsManifestClasses:
@@ -216,6 +482,589 @@ class TestAbsManifestClasses:
         manifest = klass()
         assert manifest.verify_format_type(io.StringIO(data)) is expected
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA,
+            sample_data.SAMPLE_VIDEO_MANIFEST_TSV_DATA,
+            sample_data.SAMPLE_FILM_MANIFEST_TSV_DATA,
+        ],
+    )
+    def test_required_columns(self, data):
+        manifest_type = manifest_check.get_manifest_type(io.StringIO(data))
+        rows = TSVManifest(io.StringIO(data)).iter_rows()
+        compact_rows = TSVManifest(io.StringIO(data)).iter_rows(
+            columns=manifest_type.required_columns()
+        )
+        for row, compact_row in zip(rows, compact_rows, strict=True):
+            assert len(compact_row.row_data) < len(row.row_data)
+            assert manifest_type.extract_files_from_manifest(
+                compact_row.row_data
+            ) == manifest_type.extract_files_from_manifest(row.row_data)
+
     def test_get_manifest_type_unknown_throws(self):
         with pytest.raises(ValueError):
             manifest_check.get_manifest_type(io.StringIO("unknown format"))
+
+    def test_get_manifest_type_reads_header_once(self, monkeypatch):
+        calls = []
+        get_header = TSVManifest.get_header
+
+        def counting_get_header(self):
+            calls.append(self)
+            return get_header(self)
+
+        monkeypatch.setattr(TSVManifest, "get_header", counting_get_header)
+        manifest_type = manifest_check.get_manifest_type(
+            io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+        )
+        assert isinstance(manifest_type, manifest_check.AudioManifest)
+        assert len(calls) == 1
+
+    def test_register_manifest_type(self, monkeypatch):
+        monkeypatch.setattr(
+            manifest_check,
+            "LOOK_UP_MANIFEST_CHECKS_ORDER",
+            list(manifest_check.LOOK_UP_MANIFEST_CHECKS_ORDER),
+        )
+
+        @manifest_check.register_manifest_type
+        class PhotoManifest(manifest_check.AbsManifest):
+            @classmethod
+            def matches_header(cls, header):
+                return "Photo Title" in header
+
+            def verify_format_type(self, fp):
+                raise AssertionError("the header should be enough")
+
+            def extract_files_from_manifest(self, row):
+                return {}
+
+        manifest_type = manifest_check.get_manifest_type(
+            io.StringIO("Photo Title\nsomething\n")
+        )
+        assert isinstance(manifest_type, PhotoManifest)
+
+    def test_manifest_type_without_header_check(self, monkeypatch):
+        class OtherManifest(manifest_check.AbsManifest):
+            def verify_format_type(self, fp):
+                return True
+
+            def extract_files_from_manifest(self, row):
+                return {}
+
+        monkeypatch.setattr(
+            manifest_check, "LOOK_UP_MANIFEST_CHECKS_ORDER", [OtherManifest]
+        )
+        manifest_type = manifest_check.get_manifest_type(io.StringIO("a\nb\n"))
+        assert isinstance(manifest_type, OtherManifest)
+
+
+def test_iter_missing_manifest_files():
+    row = Mock(line_number=3, row_data={})
+    manifest_type = Mock(
+        spec_set=manifest_check.AbsManifest,
+        extract_files_from_manifest=Mock(
+            return_value=manifest_check.SearchPackage(
+                preservation_file="somepresfile.wav",
+                access_file="someaccesfile.wav",
+            )
+        ),
+    )
+    scanner = Mock(
+        spec_set=manifest_check.PackageScanner,
+        locate=lambda file_name: "someaccesfile.wav"
+        if file_name == "someaccesfile.wav"
+        else None,
+    )
+    assert list(
+        manifest_check.iter_missing_manifest_files(
+            [row], scanner, manifest_type
+        )
+    ) == [
+        manifest_check.ManifestCheckResult(
+            status=manifest_check.ManifestCheckStatus.MISSING,
+            file="somepresfile.wav",
+            line_number=3,
+            package_key="preservation_file",
+        )
+    ]
+
+
+def test_iter_unexpected_files():
+    scanner = Mock(
+        spec_set=manifest_check.PackageScanner,
+        unexpected_files=Mock(
+            return_value={pathlib.Path("somepath") / "extra.txt"}
+        ),
+    )
+    results = list(manifest_check.iter_unexpected_files(scanner))
+    assert results[0].status is manifest_check.ManifestCheckStatus.UNEXPECTED
+    assert results[0].file == "extra.txt"
+
+
+class TestConcurrentFileSearch:
+    def test_search(self, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "file1").write_text("")
+        (tmp_path / "sub" / "file2").write_text("")
+        (tmp_path / "sub" / "deeper" / "file3").write_text("")
+        search = manifest_check.ConcurrentFileSearch(tmp_path, max_workers=2)
+        assert sorted(search) == [
+            tmp_path / "file1",
+            tmp_path / "sub" / "deeper" / "file3",
+            tmp_path / "sub" / "file2",
+        ]
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        search = manifest_check.ConcurrentFileSearch(tmp_path / "missing")
+        assert list(search) == []
+
+    def test_can_be_used_by_package_scanner(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "file1").write_text("")
+        scanner = manifest_check.PackageScanner(
+            tmp_path, scanner_klass=manifest_check.ConcurrentFileSearch
+        )
+        assert scanner.locate("file1") == tmp_path / "sub" / "file1"
+
+
+class TestPathFilter:
+    @pytest.fixture
+    def search_path(self, tmp_path):
+        search_path = tmp_path / "package"
+        (search_path / "scratch" / "sub").mkdir(parents=True)
+        (search_path / "sub").mkdir()
+        (search_path / "file1.wav").write_text("")
+        (search_path / "file1.tmp").write_text("")
+        (search_path / "sub" / "file2.wav").write_text("")
+        (search_path / "scratch" / "sub" / "file3.wav").write_text("")
+        return search_path
+
+    @pytest.fixture
+    def path_filter(self):
+        return filters.PathFilter(exclude=("scratch/", "*.tmp"))
+
+    def test_recursive_search(self, monkeypatch, search_path, path_filter):
+        monkeypatch.setattr(manifest_check.RecursiveFileSearch, "walk", os.walk)
+        search = manifest_check.RecursiveFileSearch(search_path, path_filter)
+        assert sorted(search) == [
+            search_path / "file1.wav",
+            search_path / "sub" / "file2.wav",
+        ]
+
+    def test_concurrent_search(self, search_path, path_filter):
+        search = manifest_check.ConcurrentFileSearch(
+            search_path, path_filter=path_filter
+        )
+        assert sorted(search) == [
+            search_path / "file1.wav",
+            search_path / "sub" / "file2.wav",
+        ]
+
+    def test_indexed_search_does_not_filter_index(
+        self, tmp_path, search_path, path_filter
+    ):
+        index_file = tmp_path / "index.db"
+        search = manifest_check.IndexedFileSearch(
+            search_path, index_file, path_filter=path_filter
+        )
+        assert sorted(search) == [
+            search_path / "file1.wav",
+            search_path / "sub" / "file2.wav",
+        ]
+        assert len(list(manifest_check.IndexedFileSearch(search_path, index_file))) == 4
+
+    def test_inventory_search(self, tmp_path, path_filter):
+        inventory_file = tmp_path / "listing.txt"
+        inventory_file.write_text(
+            "package/file1.wav\npackage/file1.tmp\n"
+            "package/scratch/sub/file3.wav\n"
+        )
+        search = manifest_check.InventoryFileSearch(
+            pathlib.Path("package"), inventory_file, path_filter=path_filter
+        )
+        assert list(search) == [pathlib.Path("package/file1.wav")]
+
+
+class TestVerifyChecksums:
+    @pytest.fixture
+    def search_path(self, tmp_path):
+        search_path = tmp_path / "package"
+        search_path.mkdir()
+        pres_file = (
+            search_path / "3503082_series17_box33_folder1_tape1_A_pres.wav"
+        )
+        pres_file.write_bytes(b"data")
+        pres_file.with_name(f"{pres_file.name}.md5").write_text(
+            f"{hashlib.md5(b'data').hexdigest()} *{pres_file.name}\n"
+        )
+        acc_file = (
+            search_path / "3503082_series17_box33_folder1_tape1_A_acc.mp3"
+        )
+        acc_file.write_bytes(b"changed")
+        acc_file.with_name(f"{acc_file.name}.md5").write_text(
+            f"{hashlib.md5(b'data').hexdigest()} *{acc_file.name}\n"
+        )
+        return search_path
+
+    def test_verify_checksum_pair(self, search_path):
+        file_path = (
+            search_path / "3503082_series17_box33_folder1_tape1_A_pres.wav"
+        )
+        result = manifest_check.verify_checksum_pair(
+            file_path.with_name(f"{file_path.name}.md5"), file_path
+        )
+        assert result.status is validation.ChecksumStatus.MATCHED
+
+    @pytest.mark.parametrize(
+        "checksum_data, issue",
+        [
+            (b"not a hash *file.wav\n", "does not contain a hash value"),
+            (b"\xff\xfe\n", "Unable to read checksum file"),
+        ],
+    )
+    def test_verify_checksum_pair_invalid_checksum_file(
+        self, tmp_path, checksum_data, issue
+    ):
+        file_path = tmp_path / "file.wav"
+        file_path.write_bytes(b"data")
+        checksum_file = tmp_path / "file.wav.md5"
+        checksum_file.write_bytes(checksum_data)
+        result = manifest_check.verify_checksum_pair(checksum_file, file_path)
+        assert result.status is validation.ChecksumStatus.FAILED
+        assert issue in result.issues[0]
+
+    def test_checksum_pairs_use_the_same_directory(self, tmp_path):
+        search_path = tmp_path / "package"
+        for directory in ("a", "b"):
+            (search_path / directory).mkdir(parents=True)
+        (search_path / "a" / "file.wav").write_bytes(b"data")
+        (search_path / "b" / "file.wav.md5").write_text("abc")
+        (search_path / "b" / "other.wav").write_bytes(b"data")
+        (search_path / "b" / "other.wav.md5").write_text("abc")
+        scanner = manifest_check.PackageScanner(
+            search_path, scanner_klass=manifest_check.ConcurrentFileSearch
+        )
+        assert scanner.locate("file.wav") == search_path / "a" / "file.wav"
+        assert manifest_check.locate_checksum_pairs(
+            {
+                "preservation_file": "file.wav",
+                "preservation_file_checksum": "file.wav.md5",
+                "access_file": "other.wav",
+                "access_file_checksum": "other.wav.md5",
+            },
+            scanner,
+        ) == [
+            (
+                search_path / "b" / "file.wav.md5",
+                search_path / "a" / "file.wav",
+            ),
+            (
+                search_path / "b" / "other.wav.md5",
+                search_path / "b" / "other.wav",
+            ),
+        ]
+
+    def test_checksum_file_in_another_directory_fails(self, tmp_path):
+        search_path = tmp_path / "package"
+        for directory in ("a", "b"):
+            (search_path / directory).mkdir(parents=True)
+        (search_path / "a" / "file.wav").write_bytes(b"data")
+        (search_path / "b" / "file.wav.md5").write_text(
+            hashlib.md5(b"data").hexdigest()
+        )
+        scanner = manifest_check.PackageScanner(
+            search_path, scanner_klass=manifest_check.ConcurrentFileSearch
+        )
+        results = [
+            manifest_check.verify_checksum_pair(checksum_file, file_path)
+            for checksum_file, file_path in (
+                manifest_check.locate_checksum_pairs(
+                    {
+                        "preservation_file": "file.wav",
+                        "preservation_file_checksum": "file.wav.md5",
+                    },
+                    scanner,
+                )
+            )
+        ]
+        assert [result.status for result in results] == [
+            validation.ChecksumStatus.FAILED
+        ]
+        assert "not next to the file" in results[0].issues[0]
+
+    def test_checksum_pairs_try_every_location(self, tmp_path):
+        search_path = tmp_path / "package"
+        for directory in ("a", "b"):
+            (search_path / directory).mkdir(parents=True)
+            (search_path / directory / "file.wav").write_bytes(b"data")
+        (search_path / "b" / "file.wav.md5").write_text("abc")
+        scanner = manifest_check.PackageScanner(
+            search_path, scanner_klass=manifest_check.ConcurrentFileSearch
+        )
+        assert manifest_check.locate_checksum_pairs(
+            {
+                "preservation_file": "file.wav",
+                "preservation_file_checksum": "file.wav.md5",
+            },
+            scanner,
+        ) == [
+            (
+                search_path / "b" / "file.wav.md5",
+                search_path / "b" / "file.wav",
+            )
+        ]
+
+    def test_line_results(self, search_path):
+        scanner = manifest_check.PackageScanner(
+            search_path, scanner_klass=manifest_check.ConcurrentFileSearch
+        )
+        manifest = TSVManifest(
+            io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+        )
+        results = list(
+            manifest_check.iter_manifest_line_results(
+                manifest, scanner, manifest_check.AudioManifest(), jobs=2
+            )
+        )
+        assert [r.line_number for r in results] == [9, 10]
+        assert [
+            (r.file.name, r.status) for r in results[0].checksums
+        ] == [
+            (
+                "3503082_series17_box33_folder1_tape1_A_pres.wav",
+                validation.ChecksumStatus.MATCHED,
+            ),
+            (
+                "3503082_series17_box33_folder1_tape1_A_acc.mp3",
+                validation.ChecksumStatus.FAILED,
+            ),
+        ]
+        assert results[1].checksums == ()
+        assert len(results[1].missing) == 4
+
+    def test_report(self, search_path, capsys, caplog):
+        scanner = manifest_check.PackageScanner(
+            search_path, scanner_klass=manifest_check.ConcurrentFileSearch
+        )
+        manifest_check.locate_manifest_files_fp(
+            io.StringIO(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA),
+            search_path,
+            manifest_check.AudioManifest(),
+            scanner=scanner,
+            verify_checksums=True,
+        )
+        assert (
+            "Line: 9. 3503082_series17_box33_folder1_tape1_A_acc.mp3 - "
+            "Failed: Hash mismatch" in capsys.readouterr().out
+        )
+        assert "The following files failed" in caplog.text
+
+
+class TestNameSuggestionIndex:
+    @pytest.fixture
+    def index(self):
+        return manifest_check.NameSuggestionIndex(
+            [
+                "2803015_film1of5_UIUCvUSC_FB_Sept1989_pres.MOV",
+                "2803015_film2of5_UIUCvUSC_FB_Sept1989_pres.mov",
+                "2803015_film3of5_UIUCvUSC_FB_Sept1989_acc.mp4",
+                "caf\u0065\u0301.wav",
+                "unrelated.txt",
+            ]
+        )
+
+    def test_case_difference(self, index):
+        assert index.suggest(
+            "2803015_film1of5_UIUCvUSC_FB_Sept1989_pres.mov", limit=1
+        ) == ["2803015_film1of5_UIUCvUSC_FB_Sept1989_pres.MOV"]
+
+    def test_extension_difference_is_not_suggested(self, index):
+        assert (
+            index.suggest("2803015_film3of5_UIUCvUSC_FB_Sept1989_acc.mov")
+            == []
+        )
+
+    def test_checksum_file_is_not_suggested(self, index):
+        assert (
+            index.suggest(
+                "2803015_film3of5_UIUCvUSC_FB_Sept1989_acc.mp4.md5"
+            )
+            == []
+        )
+
+    def test_shared_prefix_is_not_similar(self, index):
+        assert (
+            index.suggest("2803015_film3of5_UIUCvUSC_FB_Sept1989_label.jpg")
+            == []
+        )
+
+    def test_unicode_normalization(self, index):
+        assert index.suggest("caf\u00e9.wav", limit=1) == [
+            "caf\u0065\u0301.wav"
+        ]
+
+    def test_typo(self, index):
+        assert index.suggest(
+            "2803015_flim2of5_UIUCvUSC_FB_Sept1989_pres.mov", limit=1
+        ) == ["2803015_film2of5_UIUCvUSC_FB_Sept1989_pres.mov"]
+
+    def test_nothing_similar(self, index):
+        assert index.suggest("something else entirely.jpg") == []
+
+
+def test_format_missing_file_with_suggestions():
+    search_path = pathlib.Path("package")
+    scanner = manifest_check.PackageScanner(
+        search_path,
+        scanner_klass=Mock(
+            return_value=iter([search_path / "sub" / "SomeFile.MOV"])
+        ),
+    )
+    result = manifest_check.ManifestCheckResult(
+        status=manifest_check.ManifestCheckStatus.MISSING,
+        file="somefile.mov",
+        line_number=3,
+    )
+    assert manifest_check.format_missing_file(
+        result, scanner, search_path, suggest=True
+    ) == (
+        "Line: 3. Unable to locate: somefile.mov. "
+        f"Similar files found: {pathlib.Path('sub', 'SomeFile.MOV')}"
+    )
+
+
+class TestIndexedFileSearch:
+    @pytest.fixture
+    def search_path(self, tmp_path):
+        search_path = tmp_path / "package"
+        (search_path / "sub").mkdir(parents=True)
+        (search_path / "file1").write_text("")
+        (search_path / "sub" / "file2").write_text("")
+        return search_path
+
+    @staticmethod
+    def make_old(*paths):
+        for path in paths:
+            os.utime(path, (0, 0))
+
+    def test_search(self, tmp_path, search_path):
+        search = manifest_check.IndexedFileSearch(
+            search_path, index_file=tmp_path / "index.db"
+        )
+        assert sorted(search) == [
+            search_path / "file1",
+            search_path / "sub" / "file2",
+        ]
+
+    def test_unchanged_directories_are_not_listed(self, tmp_path, search_path):
+        self.make_old(search_path, search_path / "sub")
+        index_file = tmp_path / "index.db"
+        list(manifest_check.IndexedFileSearch(search_path, index_file))
+        search = manifest_check.IndexedFileSearch(search_path, index_file)
+        assert sorted(search) == [
+            search_path / "file1",
+            search_path / "sub" / "file2",
+        ]
+        assert search.directories_listed == 0
+
+    def test_changed_directories_are_listed(self, tmp_path, search_path):
+        self.make_old(search_path, search_path / "sub")
+        index_file = tmp_path / "index.db"
+        list(manifest_check.IndexedFileSearch(search_path, index_file))
+        (search_path / "sub" / "file3").write_text("")
+        search = manifest_check.IndexedFileSearch(search_path, index_file)
+        assert sorted(search) == [
+            search_path / "file1",
+            search_path / "sub" / "file2",
+            search_path / "sub" / "file3",
+        ]
+        assert search.directories_listed == 1
+
+    def test_removed_directories_are_dropped(self, tmp_path, search_path):
+        index_file = tmp_path / "index.db"
+        list(manifest_check.IndexedFileSearch(search_path, index_file))
+        (search_path / "sub" / "file2").unlink()
+        (search_path / "sub").rmdir()
+        search = manifest_check.IndexedFileSearch(search_path, index_file)
+        assert list(search) == [search_path / "file1"]
+        with sqlite3.connect(index_file) as connection:
+            assert connection.execute(
+                "SELECT path FROM directories"
+            ).fetchall() == [(str(search_path),)]
+
+
+class TestStreamingCheck:
+    @staticmethod
+    def entry(file_name, line_number):
+        return manifest_check.ManifestCheckResult(
+            status=manifest_check.ManifestCheckStatus.MISSING,
+            file=file_name,
+            line_number=line_number,
+        )
+
+    def test_results(self):
+        root = pathlib.Path("somepath")
+        search = [
+            root / "a" / "found.wav",
+            root / "extra.txt",
+            root / "b" / "found.wav",
+        ]
+        results = list(
+            manifest_check.iter_streaming_check_results(
+                [self.entry("found.wav", 2), self.entry("missing.wav", 3)],
+                root,
+                file_search_strategy=Mock(return_value=iter(search)),
+            )
+        )
+        assert [(result.status, result.file) for result in results] == [
+            (manifest_check.ManifestCheckStatus.UNEXPECTED, "extra.txt"),
+            (manifest_check.ManifestCheckStatus.DUPLICATE, "found.wav"),
+            (manifest_check.ManifestCheckStatus.DUPLICATE, "found.wav"),
+            (manifest_check.ManifestCheckStatus.MISSING, "missing.wav"),
+        ]
+
+    def test_unexpected_files_are_yielded_while_searching(self):
+        root = pathlib.Path("somepath")
+
+        def search(_):
+            yield root / "extra.txt"
+            raise AssertionError("searched past the first unexpected file")
+
+        results = manifest_check.iter_streaming_check_results(
+            [self.entry("found.wav", 2)], root, file_search_strategy=search
+        )
+        assert next(results).file == "extra.txt"
+
+    def test_locate_files_in_manifests_streaming(self, tmp_path, caplog):
+        manifest = tmp_path / "audio.tsv"
+        manifest.write_text(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+        search_path = pathlib.Path("package")
+        manifest_check.locate_files_in_manifests_streaming(
+            [manifest],
+            search_path,
+            file_search_strategy=Mock(
+                return_value=iter(
+                    [
+                        search_path
+                        / "3503082_series17_box33_folder1_tape1_A_acc.mp3",
+                        search_path / "extra.txt",
+                    ]
+                )
+            ),
+        )
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == manifest_check.logger.name
+        ]
+        assert messages[:2] == [
+            "Files found that were not included in manifest: ",
+            "* extra.txt",
+        ]
+        assert (
+            "Line: 9. Unable to locate: "
+            "3503082_series17_box33_folder1_tape1_A_pres.wav"
+        ) in messages
+        assert "Line: 9. Whitespace around" in caplog.text
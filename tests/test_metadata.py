@@ -1,12 +1,15 @@
+import concurrent.futures
 import json
 import logging
 import pathlib
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 from pygments.lexers import wowtoc
 
 from uiucprescon.tripwire import metadata as metadata_module
+from uiucprescon.tripwire.filters import PathFilter
 
 
 @pytest.mark.parametrize(
@@ -57,6 +60,30 @@ def test_show_metadata():
     )
 
 
+def test_show_metadata_with_jobs_keeps_order(caplog):
+    caplog.set_level(logging.INFO)
+    files = [f"file_{i}.mp3" for i in range(6)]
+    first_file_read = threading.Event()
+
+    def get_file_metadata(file_path):
+        # The first file takes the longest, so the others finish first.
+        if file_path.name == "file_0.mp3":
+            first_file_read.wait(timeout=5)
+        elif file_path.name == "file_3.mp3":
+            first_file_read.set()
+        return {"title": file_path.stem}
+
+    metadata_module.show_metadata(
+        glob="*.mp3",
+        find_files_strategy=Mock(return_value=files),
+        get_file_metadata_strategy=get_file_metadata,
+        jobs=4,
+    )
+    assert [record.message.splitlines()[0] for record in caplog.records] == [
+        f"file: {file}" for file in files
+    ]
+
+
 def test_show_metadata_no_files(caplog):
     find_files_strategy = Mock(return_value=[])
     metadata_module.show_metadata(
@@ -82,6 +109,19 @@ def test_locate_files_uses_default_filters(monkeypatch):
     mock_filter.assert_called_once_with("dummy.mp3")
 
 
+def test_locate_files_with_path_filter(monkeypatch):
+    mock_glob = Mock(
+        return_value=["media/a/dummy.mp3", "media/scratch/dummy.mp3"]
+    )
+    monkeypatch.setattr(metadata_module.glob_module, "iglob", mock_glob)
+    path_filter = PathFilter(exclude=("scratch",))
+    assert list(
+        metadata_module.locate_files(
+            "media/**/*.mp3", filters=[], path_filter=path_filter
+        )
+    ) == ["media/a/dummy.mp3"]
+
+
 def test_get_terminal_width_falls_back():
     with patch(
         "uiucprescon.tripwire.metadata.shutil.get_terminal_size"
@@ -298,6 +338,75 @@ class TestMediaConchValidator:
             validator.get_mediaconch_results("somefile", mc)
         assert "Failed to parse MediaConch" in caplog.text
 
+    def test_validate_with_jobs_uses_worker_mediaconch(self, monkeypatch):
+        def get_report(filepath):
+            outcome = "fail" if filepath == "b.wav" else "pass"
+            return json.dumps({
+                "MediaConch": {
+                    "media": [
+                        {
+                            "ref": filepath,
+                            "policies": [
+                                {
+                                    "outcome": outcome,
+                                    "rules": [
+                                        {
+                                            "name": "24 bit",
+                                            "outcome": outcome,
+                                            "requested": "24",
+                                            "actual": "25",
+                                        }
+                                    ],
+                                }
+                            ],
+                        }
+                    ]
+                }
+            })
+
+        handles = []
+
+        def get_media_conch():
+            handle = Mock(
+                add_file=Mock(side_effect=lambda filepath: filepath),
+                get_report=Mock(side_effect=get_report),
+            )
+            handles.append(handle)
+            return handle
+
+        monkeypatch.setattr(
+            metadata_module.MediaConchValidator,
+            "_get_media_conch",
+            staticmethod(get_media_conch),
+        )
+        validator = metadata_module.MediaConchValidator(jobs=2)
+        validator.executor_factory = concurrent.futures.ThreadPoolExecutor
+        validator.validate_policy_file = lambda _: True
+        validator.set_policy_file(pathlib.Path("policy.xml"))
+        validator.iglob = lambda *_, **__: ["a.wav", "b.wav", "c.wav"]
+        result = validator.validate("*.wav")
+        assert 1 <= len(handles) <= 2
+        for handle in handles:
+            handle.add_policy.assert_called_once_with("policy.xml")
+        assert sorted(
+            call.args[0]
+            for handle in handles
+            for call in handle.add_file.call_args_list
+        ) == ["a.wav", "b.wav", "c.wav"]
+        assert {
+            file_issues.file: file_issues.issues
+            for file_issues in result.files_with_issues
+        } == {
+            "a.wav": set(),
+            "b.wav": {'Rule "24 bit" failed.  Expected: 24, Got: 25'},
+            "c.wav": set(),
+        }
+
+    def test_worker_report_requires_initialized_worker(self, monkeypatch):
+        monkeypatch.setattr(metadata_module, "_worker_mediaconch", None)
+        with pytest.raises(RuntimeError):
+            metadata_module._get_worker_mediaconch_report("a.wav")
+
 
 class TestValidationReportBuilder:
     def test_add_file_issues(self):
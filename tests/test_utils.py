@@ -1,3 +1,4 @@
+import concurrent.futures
 import importlib.metadata
 import io
 from unittest.mock import Mock, MagicMock
@@ -101,3 +102,21 @@ def test_get_version_from_pyproject_fail():
     )
     with pytest.raises(utils.InvalidVersionStrategy):
         utils.get_version_from_pyproject(path=pyproject_toml)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_iter_executor_results(ordered):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            utils.iter_executor_results(
+                executor,
+                lambda x: x * 2,
+                range(10),
+                max_pending=3,
+                ordered=ordered,
+            )
+        )
+    if ordered:
+        assert results == [x * 2 for x in range(10)]
+    else:
+        assert sorted(results) == [x * 2 for x in range(10)]
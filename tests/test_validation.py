@@ -1,8 +1,9 @@
 import pathlib
 from unittest.mock import Mock, MagicMock, ANY
-from uiucprescon.tripwire import validation
+from uiucprescon.tripwire import filters, validation
 import hashlib
 import io
+import tarfile
 import pytest
 
 
@@ -64,6 +65,16 @@ def test_locate_checksum_files(monkeypatch):
     monkeypatch.setattr(validation.os, "walk", lambda _: [(path, [], [file_path.name, hash_file_path.name])])
     assert list(validation.locate_checksum_files(path)) == [hash_file_path]
 
+def test_locate_checksum_files_prunes_excluded_directories(tmp_path):
+    (tmp_path / "scratch").mkdir()
+    (tmp_path / "scratch" / "dummy.mp3.md5").write_text("")
+    (tmp_path / "dummy.mp3.md5").write_text("")
+    path_filter = filters.PathFilter(exclude=("scratch",))
+    assert list(
+        validation.locate_checksum_files(tmp_path, path_filter=path_filter)
+    ) == [tmp_path / "dummy.mp3.md5"]
+
+
 def test_validate_file_against_expected_hash():
     file_path = pathlib.Path("dummy.mp3")
     expected_hash = "e80b5017098950fc58aad83c8c14978e"
@@ -102,23 +113,20 @@ def test_get_hash_command(monkeypatch):
     )
     validation.get_hash_command(files, hashing_algorithm=hashing_algorithm)
     get_file_hash_with_progress_reporting.assert_called_once_with(
-        files[0], hashing_algorithm=hashlib.md5, progress_reporter=ANY
+        files[0],
+        hashing_algorithm=hashlib.md5,
+        progress_reporter=ANY,
+        hashing_strategy=validation.get_hash_from_file_pointer,
     )
 def test_create_checksum_validation_report():
-    checksum_files_checked = [pathlib.Path("dummy.mp3")]
     errors = ["File not found"]
-    report = validation.create_checksum_validation_report(
-        checksum_files_checked, errors
-    )
+    report = validation.create_checksum_validation_report(1, errors)
     assert "The following files failed:" in report
     assert "File not found" in report
 
 def test_create_checksum_validation_report_no_errors():
-    checksum_files_checked = [pathlib.Path("dummy.mp3")]
     errors = []
-    report = validation.create_checksum_validation_report(
-        checksum_files_checked, errors
-    )
+    report = validation.create_checksum_validation_report(1, errors)
     assert "All 1 checksum(s) matched." in report
 
 @pytest.mark.parametrize(
@@ -146,6 +154,19 @@ def test_validate_directory_checksums_command_failed(caplog, comparison_results,
     assert compare_checksum_to_target_strategy.called
     assert expected_message_in_log in caplog.text
 
+def test_validate_directory_checksums_command_logs_progress(caplog):
+    path = pathlib.Path("dummy")
+    checksum_files = [path / "dummy1.mp3.md5", path / "dummy2.mp3.md5"]
+    validation.validate_directory_checksums_command(
+        path=path,
+        locate_checksum_strategy=lambda _: iter(checksum_files),
+        read_checksums_strategy=lambda _: "123344",
+        compare_checksum_to_target_strategy=Mock(return_value=None),
+    )
+    assert "(1/2) Validating dummy1.mp3" in caplog.text
+    assert "(2/2) Validating dummy2.mp3" in caplog.text
+    assert "All 2 checksum(s) matched." in caplog.text
+
 @pytest.mark.parametrize(
     "file_contents, expect_hash",
     [
@@ -162,4 +183,134 @@ def test_validate_directory_checksums_command_failed(caplog, comparison_results,
 def test_get_checksum_file_reading_strategy(file_contents, expect_hash):
     text = io.StringIO()
     text.write(file_contents)
-    assert validation.get_checksum_file_reading_strategy(fp=text)(fp=text)==expect_hash
\ No newline at end of file
+    assert validation.get_checksum_file_reading_strategy(fp=text)(fp=text)==expect_hash
+
+def test_iter_file_hashes_yields_result_per_file(monkeypatch):
+    files = [pathlib.Path("dummy1.mp3"), pathlib.Path("dummy2.mp3")]
+    monkeypatch.setattr(
+        validation,
+        "get_file_hash_with_progress_reporting",
+        Mock(return_value="e80b5017098950fc58aad83c8c14978e"),
+    )
+    results = list(validation.iter_file_hashes(files, hashing_algorithm="md5"))
+    assert [r.file for r in results] == files
+    assert all(r.digest == "e80b5017098950fc58aad83c8c14978e" for r in results)
+    assert all(r.algorithm == "md5" for r in results)
+
+
+def test_iter_file_hashes_is_lazy(monkeypatch):
+    get_file_hash = Mock(return_value="abc")
+    monkeypatch.setattr(
+        validation, "get_file_hash_with_progress_reporting", get_file_hash
+    )
+    results = validation.iter_file_hashes(
+        iter([pathlib.Path("dummy1.mp3"), pathlib.Path("dummy2.mp3")]),
+        hashing_algorithm="md5",
+    )
+    next(results)
+    assert get_file_hash.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "comparison_results, expected_status",
+    [
+        (["Hash mismatch"], validation.ChecksumStatus.FAILED),
+        (None, validation.ChecksumStatus.MATCHED),
+    ],
+)
+def test_iter_checksum_validation_results(comparison_results, expected_status):
+    path = pathlib.Path("dummy")
+    results = list(
+        validation.iter_checksum_validation_results(
+            path,
+            locate_checksum_strategy=lambda _: [path / "dummy.mp3.md5"],
+            read_checksums_strategy=lambda _: "123344",
+            compare_checksum_to_target_strategy=Mock(
+                return_value=comparison_results
+            ),
+        )
+    )
+    assert len(results) == 1
+    assert results[0].file == path / "dummy.mp3"
+    assert results[0].expected_digest == "123344"
+    assert results[0].status is expected_status
+
+
+def test_create_checksum_validation_report_with_count():
+    report = validation.create_checksum_validation_report(3, [])
+    assert "All 3 checksum(s) matched." in report
+
+
+def test_get_hash_from_file_pointer_not_seekable():
+    reporter = Mock()
+    pointer = Mock(
+        seekable=Mock(return_value=False),
+        read=Mock(side_effect=[b"abc", b"def", b""]),
+    )
+    assert (
+        validation.get_hash_from_file_pointer(
+            pointer, hashlib.md5, progress_reporter=reporter, size=6
+        )
+        == "e80b5017098950fc58aad83c8c14978e"
+    )
+    pointer.seek.assert_not_called()
+    assert reporter.mock_calls[-1].args[0] == 100
+
+
+@pytest.mark.parametrize("data", [b"", b"abcdef", b"abcdef" * 100000])
+def test_get_hash_from_file_pointer_kernel_matches_hashlib(tmp_path, data):
+    file_path = tmp_path / "dummy.wav"
+    file_path.write_bytes(data)
+    with file_path.open("rb") as fp:
+        assert (
+            validation.get_hash_from_file_pointer_kernel(fp, hashlib.md5)
+            == hashlib.md5(data).hexdigest()
+        )
+
+
+def test_get_hash_from_file_pointer_kernel_falls_back_without_fileno():
+    assert (
+        validation.get_hash_from_file_pointer_kernel(
+            io.BytesIO(b"abcdef"), hashlib.md5
+        )
+        == "e80b5017098950fc58aad83c8c14978e"
+    )
+
+
+def test_get_hash_from_file_pointer_kernel_falls_back_for_tar_member(
+    monkeypatch,
+):
+    monkeypatch.setattr(validation, "is_kernel_hashing_available", lambda: True)
+    kernel_hash = Mock()
+    monkeypatch.setattr(validation, "_get_kernel_hash", kernel_hash)
+    archive_data = io.BytesIO()
+    with tarfile.open(fileobj=archive_data, mode="w:") as tar_file:
+        info = tarfile.TarInfo("dummy.wav")
+        info.size = 6
+        tar_file.addfile(info, io.BytesIO(b"abcdef"))
+    archive_data.seek(0)
+    with tarfile.open(fileobj=archive_data, mode="r:") as tar_file:
+        member = tar_file.extractfile("dummy.wav")
+        assert (
+            validation.get_hash_from_file_pointer_kernel(
+                member, hashlib.md5, size=6
+            )
+            == "e80b5017098950fc58aad83c8c14978e"
+        )
+    kernel_hash.assert_not_called()
+
+
+def test_get_hash_from_file_pointer_kernel_unavailable(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        validation, "is_kernel_hashing_available", lambda: False
+    )
+    kernel_hash = Mock()
+    monkeypatch.setattr(validation, "_get_kernel_hash", kernel_hash)
+    file_path = tmp_path / "dummy.wav"
+    file_path.write_bytes(b"abcdef")
+    with file_path.open("rb") as fp:
+        assert (
+            validation.get_hash_from_file_pointer_kernel(fp, hashlib.md5)
+            == "e80b5017098950fc58aad83c8c14978e"
+        )
+    kernel_hash.assert_not_called()
@@ -0,0 +1,136 @@
+import itertools
+import sys
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from uiucprescon.tripwire import manifest_check, watch
+import sample_data
+
+
+def entry(file_name, line_number=2):
+    return manifest_check.ManifestCheckResult(
+        status=manifest_check.ManifestCheckStatus.MISSING,
+        file=file_name,
+        line_number=line_number,
+    )
+
+
+@pytest.fixture
+def search_path(tmp_path):
+    search_path = tmp_path / "package"
+    (search_path / "sub").mkdir(parents=True)
+    (search_path / "sub" / "a.wav").write_text("")
+    (search_path / "extra.txt").write_text("")
+    return search_path
+
+
+@pytest.fixture
+def watcher(search_path):
+    inotify = Mock(add_watch=Mock(side_effect=itertools.count(1)))
+    return watch.ManifestWatcher(
+        search_path, [entry("a.wav"), entry("b.wav", 3)], inotify=inotify
+    )
+
+
+def get_wd(watcher, directory):
+    return next(
+        wd for wd, path in watcher.watched.items() if path == directory
+    )
+
+
+def test_start(watcher, search_path):
+    results = list(watcher.start())
+    assert [(result.status, result.file) for result in results] == [
+        (manifest_check.ManifestCheckStatus.MISSING, "b.wav"),
+        (manifest_check.ManifestCheckStatus.UNEXPECTED, "extra.txt"),
+    ]
+    assert sorted(watcher.watched.values()) == [
+        search_path,
+        search_path / "sub",
+    ]
+
+
+def test_missing_file_arrives(watcher, search_path):
+    list(watcher.start())
+    changes = list(
+        watcher.handle_event(
+            watch.InotifyEvent(
+                get_wd(watcher, search_path / "sub"),
+                watch.IN_CLOSE_WRITE,
+                0,
+                "b.wav",
+            )
+        )
+    )
+    assert changes == [watch.WatchChange(entry("b.wav", 3), resolved=True)]
+    assert watcher.missing == {}
+
+
+def test_found_file_removed(watcher, search_path):
+    list(watcher.start())
+    changes = list(
+        watcher.handle_event(
+            watch.InotifyEvent(
+                get_wd(watcher, search_path / "sub"),
+                watch.IN_DELETE,
+                0,
+                "a.wav",
+            )
+        )
+    )
+    assert changes == [watch.WatchChange(entry("a.wav"), resolved=False)]
+    assert "a.wav" in watcher.missing
+
+
+def test_directory_removed(watcher, search_path):
+    list(watcher.start())
+    changes = list(
+        watcher.handle_event(
+            watch.InotifyEvent(
+                get_wd(watcher, search_path),
+                watch.IN_MOVED_FROM | watch.IN_ISDIR,
+                0,
+                "sub",
+            )
+        )
+    )
+    assert changes == [watch.WatchChange(entry("a.wav"), resolved=False)]
+    assert search_path / "sub" not in watcher.watched.values()
+
+
+def test_unexpected_file_arrives(watcher, search_path):
+    list(watcher.start())
+    changes = list(
+        watcher.handle_event(
+            watch.InotifyEvent(
+                get_wd(watcher, search_path), watch.IN_MOVED_TO, 0, "c.txt"
+            )
+        )
+    )
+    assert [(change.result.file, change.resolved) for change in changes] == [
+        ("c.txt", False)
+    ]
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+def test_watch_manifests(tmp_path, search_path):
+    manifest = tmp_path / "audio.tsv"
+    manifest.write_text(sample_data.SAMPLE_AUDIO_MANIFEST_TSV_DATA)
+    entries = list(manifest_check.iter_manifest_entries([manifest]))
+    watcher = watch.ManifestWatcher(search_path, entries)
+    list(watcher.start())
+
+    def upload():
+        for file_name in list(watcher.missing):
+            (search_path / "sub" / file_name).write_text("")
+
+    thread = threading.Thread(target=upload)
+    thread.start()
+    list(watcher.iter_changes(timeout=5))
+    thread.join()
+    watcher.inotify.close()
+    assert watcher.missing == {}